@@ -0,0 +1,121 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.synthetic_datasets import dataset_environment, generate_datasets
+
+# Every scenario runs in a fresh interpreter, so nothing is imported before it starts.
+SCENARIOS: dict[str, str] = {
+    "interpreter": "pass",
+    "import src.main": "import src.main",
+    "import src.service_client": "import src.service_client",
+    "build validator DAG": "from src.main import validator_dag; validator_dag().build()",
+}
+
+# Modules the validator only needs once pipelines are built or run.
+HEAVY_MODULES: list[str] = ["pandas", "numpy", "fastavro", "validators", "minio", "urllib3"]
+
+MEASURE: str = """
+import json, sys, time
+start = time.perf_counter()
+exec({code!r})
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": [m for m in {modules!r} if m in sys.modules]}}))
+"""
+
+
+def run_scenario(root: Path, code: str, repeat: int, directory: Path) -> dict[str, Any]:
+    environment: dict[str, str] = {**os.environ, "PYTHONPATH": str(root)}
+    wall_times: list[float] = []
+    import_times: list[float] = []
+    modules: list[str] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        completed: subprocess.CompletedProcess = subprocess.run(
+            [sys.executable, "-c", MEASURE.format(code=code, modules=HEAVY_MODULES)],
+            cwd=directory, env=environment, capture_output=True, text=True, check=True)
+        wall_times.append(time.perf_counter() - start)
+        measured: dict[str, Any] = json.loads(completed.stdout.splitlines()[-1])
+        import_times.append(measured["seconds"])
+        modules = measured["modules"]
+    return {"wall_time": statistics.median(wall_times), "seconds": statistics.median(import_times), "modules": modules}
+
+
+def slowest_imports(root: Path, module: str, directory: Path, count: int) -> list[tuple[str, int]]:
+    # Cumulative microseconds of the modules imported by the module itself, as reported by -X importtime.
+    completed: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=directory, env={**os.environ, "PYTHONPATH": str(root)}, capture_output=True, text=True, check=True)
+    imports: list[tuple[str, int]] = []
+    children: list[tuple[str, int]] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        # Imports are listed before the module importing them, indented by two more spaces.
+        depth: int = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            children.append((name.strip(), int(cumulative)))
+        elif depth == 0:
+            if name.strip() == module:
+                imports = children
+            children = []
+    return sorted(imports, key=lambda entry: entry[1], reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how long starting the validator takes.")
+    parser.add_argument("--root", type=Path, default=Path(__file__).resolve().parents[1],
+                        help="Checkout to measure, this one by default.")
+    parser.add_argument("--compare", type=Path, default=None,
+                        help="Another checkout to measure, e.g. a git worktree of an earlier commit.")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports of src.main to list.")
+    parser.add_argument("--output", type=Path, default=None)
+    arguments = parser.parse_args()
+
+    roots: dict[str, Path] = {"current": arguments.root}
+    if arguments.compare is not None:
+        roots["compare"] = arguments.compare
+    results: dict[str, dict[str, dict[str, Any]]] = {}
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        directory: Path = Path(temporary_directory)
+        # The DAG reads its schemas when it is built, and earlier checkouts read the dataset paths on import.
+        os.environ.update(dataset_environment(directory))
+        generate_datasets(directory, rows=100)
+        for label, root in roots.items():
+            results[label] = {name: run_scenario(root, code, arguments.repeat, directory)
+                              for name, code in SCENARIOS.items()}
+            print(f"{label}: {root}")
+            print(f"  {'scenario':<28} {'process':>10} {'in process':>12}  heavy modules loaded")
+            for name, entry in results[label].items():
+                print(f"  {name:<28} {entry['wall_time'] * 1000:8.1f}ms {entry['seconds'] * 1000:10.1f}ms  "
+                      f"{', '.join(entry['modules']) or '-'}")
+            print("  slowest imports of src.main:")
+            for module, microseconds in slowest_imports(root, "src.main", directory, arguments.top):
+                print(f"    {module:<40} {microseconds / 1000:8.1f}ms")
+
+    if "compare" in results:
+        for name in SCENARIOS:
+            current: float = results["current"][name]["wall_time"]
+            compared: float = results["compare"][name]["wall_time"]
+            print(f"{name}: {compared * 1000:.1f}ms -> {current * 1000:.1f}ms "
+                  f"({(current / compared - 1) * 100 if compared else 0:+.1f}%)")
+    if arguments.output is not None:
+        with open(arguments.output, "w") as f:
+            json.dump({"repeat": arguments.repeat, "roots": {label: str(root) for label, root in roots.items()},
+                       "results": results}, f, indent=2)
+        print(f"Results written to {arguments.output}")
+
+
+if __name__ == '__main__':
+    main()
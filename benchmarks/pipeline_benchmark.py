@@ -0,0 +1,192 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+
+from benchmarks.synthetic_datasets import dataset_environment, generate_datasets
+
+
+def configure(directory: Path, chunk_size: int | None):
+    # The configuration is read from the environment when src is first imported, so it is set before any import of src.
+    os.environ.update(dataset_environment(directory))
+    os.environ.update({
+        "VALIDATION_MODE": "COLLECT",
+        "MAX_WORKERS": "1",
+        "CHUNK_SIZE": str(chunk_size) if chunk_size is not None else "",
+        "CACHE_DIRECTORY_PATH": "",
+        "STORE_OUTPUT": "False",
+        "RUN_REPORT_FILE_PATH": "",
+        "TRACE_MEMORY": "False",
+    })
+
+
+def traced_peak(function: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline: int = tracemalloc.get_traced_memory()[0]
+        function()
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def result(scale: int, kind: str, name: str, rows: int, seconds: float, peak_memory: int | None) -> dict[str, Any]:
+    return {
+        "scale": scale,
+        "kind": kind,
+        "name": name,
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds if seconds > 0 else None,
+        "peak_memory": peak_memory,
+    }
+
+
+def benchmark_pipelines(scale: int, repeat: int, memory: bool) -> tuple[list[dict[str, Any]], dict[str, pd.DataFrame]]:
+    from src.main import validator_dag
+    from src.patterns.builder.dag import PipelineDAG
+
+    # Pipelines run one at a time (MAX_WORKERS=1), so every pipeline is timed in isolation; the best run counts.
+    best: dict[str, dict[str, Any]] = {}
+    outputs: dict[str, pd.DataFrame] = {}
+    for _ in range(repeat):
+        dag: PipelineDAG = validator_dag().build()
+        outputs = dag.run()
+        for name, report in dag.run_report()["pipelines"].items():
+            if name not in best or report["wall_time"] < best[name]["wall_time"]:
+                best[name] = report
+    results: list[dict[str, Any]] = []
+    for name, report in best.items():
+        peak_memory: int | None = None
+        if memory:
+            node = dag.nodes[name]
+            inputs: list[pd.DataFrame] = [outputs[dependency] for dependency in node.dependencies]
+            peak_memory = traced_peak(node.factory(*inputs).build().run)
+        results.append(result(scale, "pipeline", name, max(report["rows_in"], report["rows_out"]), report["wall_time"],
+                              peak_memory))
+    return results, outputs
+
+
+def benchmark_strategies(scale: int, repeat: int, memory: bool,
+                         outputs: dict[str, pd.DataFrame]) -> list[dict[str, Any]]:
+    from src.main import validator_dag
+    from src.validator.models.enums import StageType
+
+    results: list[dict[str, Any]] = []
+    dag = validator_dag().build()
+    for name in dag.topological_order():
+        node = dag.nodes[name]
+        pipeline = node.factory(*[outputs[dependency] for dependency in node.dependencies]).build()
+        data: pd.DataFrame | None = pipeline.data
+        for stage in pipeline.stages:
+            if stage.stage_type == StageType.STORE:
+                continue
+            for step in stage.steps:
+                if step.strategy is None:
+                    # Load and filter steps prepare the frame the following strategies see.
+                    data = step.run(data)
+                    continue
+                timings: list[float] = []
+                for _ in range(repeat):
+                    step.strategy.reset()
+                    start: float = time.perf_counter()
+                    step.strategy.invalid_mask(data)
+                    timings.append(time.perf_counter() - start)
+                step.strategy.reset()
+                peak_memory: int | None = traced_peak(lambda: step.strategy.invalid_mask(data)) if memory else None
+                step.strategy.reset()
+                results.append(result(scale, "strategy", f"{name}/{step.name}", len(data), min(timings), peak_memory))
+    return results
+
+
+def environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "packages": {package: version(package) for package in ["pandas", "numpy", "fastavro", "validators"]},
+    }
+
+
+def compare(results: list[dict[str, Any]], baseline: list[dict[str, Any]], tolerance: float) -> list[str]:
+    # A result regresses when its throughput drops or its peak memory grows by more than the tolerance.
+    previous: dict[tuple, dict[str, Any]] = {(entry["scale"], entry["kind"], entry["name"]): entry
+                                             for entry in baseline}
+    regressions: list[str] = []
+    for entry in results:
+        reference: dict[str, Any] | None = previous.get((entry["scale"], entry["kind"], entry["name"]))
+        if reference is None:
+            continue
+        if entry["rows_per_second"] and reference["rows_per_second"] \
+                and entry["rows_per_second"] < reference["rows_per_second"] * (1 - tolerance):
+            regressions.append(f"{entry['kind']} {entry['name']} at {entry['scale']} rows: "
+                               f"{entry['rows_per_second']:,.0f} rows/s, baseline {reference['rows_per_second']:,.0f}")
+        if entry["peak_memory"] and reference["peak_memory"] \
+                and entry["peak_memory"] > reference["peak_memory"] * (1 + tolerance):
+            regressions.append(f"{entry['kind']} {entry['name']} at {entry['scale']} rows: "
+                               f"{entry['peak_memory']:,} bytes peak, baseline {reference['peak_memory']:,}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every validator pipeline and strategy on synthetic data.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000],
+                        help="Scales to run, as the row count of the largest datasets (e.g. 10000 1000000 10000000).")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--directory", type=Path, default=None,
+                        help="Where the synthetic datasets are generated, a temporary directory by default.")
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    parser.add_argument("--baseline", type=Path, default=None,
+                        help="Earlier results file; the run fails when a result regressed beyond the tolerance.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--skip-memory", action="store_true", help="Skip the tracemalloc peak memory measurements.")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        directory: Path = arguments.directory or Path(temporary_directory)
+        configure(directory, arguments.chunk_size)
+        results: list[dict[str, Any]] = []
+        for scale in arguments.rows:
+            print(f"Generating datasets for {scale} rows...")
+            generate_datasets(directory, scale)
+            logging.disable(logging.INFO)
+            pipeline_results, outputs = benchmark_pipelines(scale, arguments.repeat, not arguments.skip_memory)
+            results += pipeline_results
+            results += benchmark_strategies(scale, arguments.repeat, not arguments.skip_memory, outputs)
+            logging.disable(logging.NOTSET)
+
+    for entry in results:
+        peak_memory: str = f"{entry['peak_memory'] / 2 ** 20:9.1f} MiB" if entry["peak_memory"] is not None else ""
+        rows_per_second: str = f"{entry['rows_per_second']:15,.0f} rows/s" if entry["rows_per_second"] else ""
+        print(f"{entry['scale']:>10} {entry['kind']:<8} {entry['name']:<70} {entry['seconds']:9.4f}s "
+              f"{rows_per_second} {peak_memory}")
+    with open(arguments.output, "w") as f:
+        json.dump({"environment": environment(), "chunk_size": arguments.chunk_size, "results": results}, f, indent=2)
+    print(f"Results written to {arguments.output}")
+
+    if arguments.baseline is not None:
+        with open(arguments.baseline) as f:
+            baseline: dict[str, Any] = json.load(f)
+        if baseline.get("chunk_size") != arguments.chunk_size:
+            print(f"Warning: the baseline was run with chunk size {baseline.get('chunk_size')}.")
+        regressions: list[str] = compare(results, baseline["results"], arguments.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.avro import write_avro
+
+
+def string_field(name: str) -> dict:
+    return {"name": name, "type": "string"}
+
+
+def int_field(name: str) -> dict:
+    return {"name": name, "type": "int"}
+
+
+def enum_field(name: str, type_name: str, symbols: list[str]) -> dict:
+    return {"name": name, "type": {"type": "enum", "name": type_name, "symbols": symbols}}
+
+
+def record(name: str, fields: list[dict]) -> dict:
+    return {"type": "record", "name": name, "namespace": "mk.ukim.finki.benchmark", "fields": fields}
+
+
+# Keyed by the dataset prefix of the *_DATA_INPUT_FILE_NAME and *_SCHEMA_FILE_NAME environment variables.
+SCHEMAS: dict[str, dict] = {
+    "STUDY_PROGRAMS": record("StudyProgram", [string_field("study_program_id"), string_field("study_program_code"),
+                                              string_field("study_program_name"), int_field("study_program_duration"),
+                                              string_field("study_program_url")]),
+    "COURSES": record("Course", [string_field("course_id"), string_field("course_code"),
+                                 string_field("course_name_mk"), string_field("course_name_en"),
+                                 string_field("course_url"), int_field("course_level")]),
+    "PROFESSORS": record("Professor", [string_field("professor_id"), string_field("professor_name"),
+                                       string_field("professor_surname")]),
+    "CURRICULA": record("Curriculum", [string_field("curriculum_id"),
+                                       enum_field("course_type", "CourseType", ["MANDATORY", "ELECTIVE"]),
+                                       int_field("course_semester"),
+                                       enum_field("course_semester_season", "CourseSemesterSeasonType",
+                                                  ["WINTER", "SUMMER"]),
+                                       int_field("course_academic_year")]),
+    "REQUISITES": record("Requisite", [string_field("requisite_id"),
+                                       enum_field("course_prerequisite_type", "CoursePrerequisiteType",
+                                                  ["NONE", "ONE", "ANY", "TOTAL"]),
+                                       int_field("minimum_required_number_of_courses")]),
+    "OFFERS": record("Offers", [string_field("offers_id"), string_field("curriculum_id"),
+                                string_field("study_program_id")]),
+    "INCLUDES": record("Includes", [string_field("includes_id"), string_field("curriculum_id"),
+                                    string_field("course_id")]),
+    "REQUIRES": record("Requires", [string_field("requires_id"), string_field("requisite_id"),
+                                    string_field("course_id")]),
+    "SATISFIES": record("Satisfies", [string_field("satisfies_id"), string_field("requisite_id"),
+                                      string_field("prerequisite_course_id")]),
+    "TEACHES": record("Teaches", [string_field("teaches_id"), string_field("course_id"), string_field("professor_id")]),
+}
+
+HEX_DIGITS: np.ndarray = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+UUID_DASH_POSITIONS: list[int] = [8, 12, 16, 20]
+
+
+def uuids(rng: np.random.Generator, size: int) -> np.ndarray:
+    # Random version 4 UUIDs in canonical form, built as a (size, 36) byte matrix instead of one uuid4() call per row.
+    nibbles: np.ndarray = rng.integers(0, 16, size=(size, 32), dtype=np.uint8)
+    nibbles[:, 12] = 4
+    nibbles[:, 16] = 8 + nibbles[:, 16] % 4
+    characters: np.ndarray = np.insert(HEX_DIGITS[nibbles], UUID_DASH_POSITIONS, ord("-"), axis=1)
+    return np.ascontiguousarray(characters).view("S36").ravel().astype("U36").astype(object)
+
+
+def numbered(prefix: str, size: int) -> pd.Series:
+    return prefix + pd.Series(np.arange(size)).astype(str)
+
+
+def dataset_sizes(rows: int) -> dict[str, int]:
+    # The curricula and the relationships between them scale with rows, the catalogues with a fraction of it.
+    courses: int = max(10, rows // 10)
+    return {
+        "STUDY_PROGRAMS": max(10, rows // 100),
+        "COURSES": courses,
+        "PROFESSORS": max(10, rows // 50),
+        "CURRICULA": rows,
+        "REQUISITES": courses,
+        "OFFERS": rows,
+        "INCLUDES": rows,
+        "TEACHES": rows,
+    }
+
+
+def generate_frames(rows: int, seed: int = 0) -> dict[str, pd.DataFrame]:
+    rng: np.random.Generator = np.random.default_rng(seed)
+    sizes: dict[str, int] = dataset_sizes(rows)
+    letters: np.ndarray = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"), dtype=object)
+
+    study_program_codes: np.ndarray = letters[rng.integers(0, 26, (100, 3))].sum(axis=1) \
+        + rng.integers(0, 10, 100).astype(str).astype(object)
+    study_programs: pd.DataFrame = pd.DataFrame({
+        "study_program_id": uuids(rng, sizes["STUDY_PROGRAMS"]),
+        "study_program_code": rng.choice(study_program_codes, sizes["STUDY_PROGRAMS"]),
+        "study_program_name": numbered("Study program ", sizes["STUDY_PROGRAMS"]),
+        "study_program_duration": rng.choice([2, 3, 4], sizes["STUDY_PROGRAMS"]),
+        "study_program_url": numbered("https://finki.ukim.mk/program/", sizes["STUDY_PROGRAMS"]),
+    })
+
+    course_codes: pd.Series = ("F23L" + pd.Series(rng.integers(1, 4, sizes["COURSES"])).astype(str)
+                               + pd.Series(rng.choice(["S", "W"], sizes["COURSES"]))
+                               + pd.Series(rng.integers(0, 1000, sizes["COURSES"])).astype(str).str.zfill(3))
+    courses: pd.DataFrame = pd.DataFrame({
+        "course_id": uuids(rng, sizes["COURSES"]),
+        "course_code": course_codes,
+        "course_name_mk": numbered("Предмет ", sizes["COURSES"]),
+        "course_name_en": numbered("Course ", sizes["COURSES"]),
+        "course_url": "https://finki.ukim.mk/subject/" + course_codes,
+        "course_level": rng.integers(1, 4, sizes["COURSES"]),
+    })
+
+    professors: pd.DataFrame = pd.DataFrame({
+        "professor_id": uuids(rng, sizes["PROFESSORS"]),
+        "professor_name": numbered("Name ", sizes["PROFESSORS"]),
+        "professor_surname": numbered("Surname ", sizes["PROFESSORS"]),
+    })
+
+    curricula: pd.DataFrame = pd.DataFrame({
+        "curriculum_id": uuids(rng, sizes["CURRICULA"]),
+        "course_type": rng.choice(["MANDATORY", "ELECTIVE"], sizes["CURRICULA"]).astype(object),
+        "course_semester": rng.integers(1, 8, sizes["CURRICULA"]),
+        "course_semester_season": rng.choice(["WINTER", "SUMMER"], sizes["CURRICULA"]).astype(object),
+        "course_academic_year": rng.integers(1, 4, sizes["CURRICULA"]),
+    })
+
+    # Requisite i belongs to course i and is satisfied by courses with a lower position, so the prerequisite graph is
+    # acyclic. The first course has a TOTAL requisite without linked courses.
+    requisite_count: int = sizes["REQUISITES"]
+    prerequisite_types: np.ndarray = rng.choice(["ONE", "ANY", "TOTAL"], requisite_count).astype(object)
+    prerequisite_types[0] = "TOTAL"
+    link_counts: np.ndarray = np.select([prerequisite_types == "ONE", prerequisite_types == "ANY"],
+                                        [1, rng.integers(1, 5, requisite_count)], rng.integers(0, 3, requisite_count))
+    link_counts[0] = 0
+    linked_requisites: np.ndarray = np.repeat(np.arange(requisite_count), link_counts)
+    linked_courses: np.ndarray = (rng.random(len(linked_requisites)) * linked_requisites).astype(np.int64)
+    distinct_links: np.ndarray = np.bincount(
+        np.unique(linked_requisites * requisite_count + linked_courses) // requisite_count, minlength=requisite_count)
+    minimums: np.ndarray = np.where(prerequisite_types == "TOTAL", rng.integers(0, 39, requisite_count),
+                                    (rng.random(requisite_count) * distinct_links).astype(np.int64) + 1)
+    minimums[prerequisite_types == "ONE"] = 1
+    requisites: pd.DataFrame = pd.DataFrame({
+        "requisite_id": uuids(rng, requisite_count),
+        "course_prerequisite_type": prerequisite_types,
+        "minimum_required_number_of_courses": minimums,
+    })
+
+    requisite_ids: np.ndarray = requisites["requisite_id"].to_numpy()
+    course_ids: np.ndarray = courses["course_id"].to_numpy()
+    return {
+        "STUDY_PROGRAMS": study_programs,
+        "COURSES": courses,
+        "PROFESSORS": professors,
+        "CURRICULA": curricula,
+        "REQUISITES": requisites,
+        "OFFERS": pd.DataFrame({
+            "offers_id": uuids(rng, sizes["OFFERS"]),
+            "curriculum_id": rng.choice(curricula["curriculum_id"].to_numpy(), sizes["OFFERS"]),
+            "study_program_id": rng.choice(study_programs["study_program_id"].to_numpy(), sizes["OFFERS"]),
+        }),
+        "INCLUDES": pd.DataFrame({
+            "includes_id": uuids(rng, sizes["INCLUDES"]),
+            "curriculum_id": curricula["curriculum_id"].to_numpy()[rng.permutation(sizes["CURRICULA"])],
+            "course_id": rng.choice(course_ids, sizes["INCLUDES"]),
+        }),
+        "REQUIRES": pd.DataFrame({
+            "requires_id": uuids(rng, requisite_count),
+            "requisite_id": requisite_ids,
+            "course_id": course_ids[:requisite_count],
+        }),
+        "SATISFIES": pd.DataFrame({
+            "satisfies_id": uuids(rng, len(linked_requisites)),
+            "requisite_id": requisite_ids[linked_requisites],
+            "prerequisite_course_id": course_ids[linked_courses],
+        }),
+        "TEACHES": pd.DataFrame({
+            "teaches_id": uuids(rng, sizes["TEACHES"]),
+            "course_id": rng.choice(course_ids, sizes["TEACHES"]),
+            "professor_id": rng.choice(professors["professor_id"].to_numpy(), sizes["TEACHES"]),
+        }),
+    }
+
+
+def generate_datasets(directory: Path, rows: int, seed: int = 0, codec: str = "deflate") -> dict[str, int]:
+    (directory / "data").mkdir(parents=True, exist_ok=True)
+    (directory / "schemas").mkdir(parents=True, exist_ok=True)
+    counts: dict[str, int] = {}
+    for dataset, df in generate_frames(rows, seed).items():
+        schema: dict = SCHEMAS[dataset]
+        (directory / "schemas" / f"{dataset.lower()}.avsc").write_text(json.dumps(schema))
+        with open(directory / "data" / f"{dataset.lower()}.avro", "wb") as f:
+            write_avro(f, df, schema, codec=codec, sync_interval=64 * 1024)
+        counts[dataset] = len(df)
+    return counts
+
+
+def dataset_environment(directory: Path) -> dict[str, str]:
+    environment: dict[str, str] = {
+        "FILE_STORAGE_TYPE": "LOCAL",
+        "INPUT_DATA_DIRECTORY_PATH": str(directory / "data"),
+        "SCHEMA_DIRECTORY_PATH": str(directory / "schemas"),
+        "OUTPUT_DATA_DIRECTORY_PATH": str(directory / "output"),
+    }
+    for dataset in SCHEMAS:
+        environment[f"{dataset}_DATA_INPUT_FILE_NAME"] = f"{dataset.lower()}.avro"
+        environment[f"{dataset}_SCHEMA_FILE_NAME"] = f"{dataset.lower()}.avsc"
+    return environment
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate referentially consistent synthetic datasets.")
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--codec", default="deflate")
+    arguments = parser.parse_args()
+
+    counts: dict[str, int] = generate_datasets(arguments.directory, arguments.rows, arguments.seed, arguments.codec)
+    for dataset, count in counts.items():
+        print(f"{dataset}: {count} rows")
+    for name, value in dataset_environment(arguments.directory).items():
+        print(f"{name}={value}")
+
+
+if __name__ == '__main__':
+    main()
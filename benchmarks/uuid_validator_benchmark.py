@@ -0,0 +1,56 @@
+import argparse
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+import validators
+
+from src.patterns.strategy.validator import UUIDValidatorStrategy
+
+
+def apply_invalid_mask(column: pd.Series) -> pd.Series:
+    return ~column.apply(lambda value: bool(validators.uuid(value)) if pd.notnull(value) else False)
+
+
+def vectorized_invalid_mask(df: pd.DataFrame, column: str) -> pd.Series:
+    return UUIDValidatorStrategy(column=column).invalid_mask(df)
+
+
+def measure(function: callable, repeat: int) -> tuple[float, pd.Series]:
+    timings: list[float] = []
+    result: pd.Series | None = None
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the per-row and vectorized UUID validation paths.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.001)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    rng: np.random.Generator = np.random.default_rng(0)
+    values: list[str | None] = [str(uuid.UUID(int=int(value), version=4)) for value in
+                                rng.integers(0, 2 ** 63, size=arguments.rows, dtype=np.uint64)]
+    for position in rng.choice(arguments.rows, size=int(arguments.rows * arguments.invalid_ratio), replace=False):
+        values[position] = values[position][:-1] if position % 2 else None
+    df: pd.DataFrame = pd.DataFrame({"id": values})
+
+    apply_time, expected = measure(lambda: apply_invalid_mask(df["id"]), arguments.repeat)
+    vectorized_time, actual = measure(lambda: vectorized_invalid_mask(df, "id"), arguments.repeat)
+    if not expected.equals(actual):
+        raise AssertionError("The vectorized UUID mask differs from the per-row validators.uuid mask.")
+
+    print(f"rows: {arguments.rows}, invalid: {int(actual.sum())}")
+    print(f"validators.uuid apply: {apply_time:.3f}s ({arguments.rows / apply_time:,.0f} rows/s)")
+    print(f"vectorized: {vectorized_time:.3f}s ({arguments.rows / vectorized_time:,.0f} rows/s)")
+    print(f"speedup: {apply_time / vectorized_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+import logging
+import mmap
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+from fastavro import block_reader
+from fastavro.write import Writer
+
+AVRO_NUMPY_TYPES: dict[str, type] = {
+    "int": np.int64,
+    "long": np.int64,
+    "float": np.float64,
+    "double": np.float64,
+    "boolean": np.bool_,
+}
+SYNC_SIZE: int = 16
+# Compact integer dtypes follow the schema, never the decoded values, so every chunk of a column gets the same dtype. Avro
+# ints fit int32 and the small codes of the datasets are stored as int8.
+COMPACT_INTEGER_TYPES: dict[str, type] = {"int": np.int32, "long": np.int64}
+COMPACT_INTEGER_FIELDS: dict[str, type] = {
+    "course_level": np.int8,
+    "course_semester": np.int8,
+    "course_academic_year": np.int8,
+    "study_program_duration": np.int8,
+    "minimum_required_number_of_courses": np.int8,
+}
+
+
+class AvroColumn:
+    def __init__(self, name: str, avro_type: Any, compact: bool = False):
+        self.name: str = name
+        self.avro_type: Any = avro_type
+        self.compact: bool = compact
+        self.blocks: list[np.ndarray] = []
+        self.categories: list[str] | None = None
+        self.encode: Callable[[Sequence[Any]], np.ndarray] = self.encoder()
+
+    def encoder(self) -> Callable[[Sequence[Any]], np.ndarray]:
+        if isinstance(self.avro_type, dict) and self.avro_type.get("type") == "enum":
+            self.categories = list(self.avro_type["symbols"])
+            codes: dict[str, int] = {symbol: code for code, symbol in enumerate(self.categories)}
+            dtype: type = np.int8 if len(self.categories) < np.iinfo(np.int8).max else np.int32
+            return lambda values: np.fromiter(map(codes.__getitem__, values), dtype=dtype, count=len(values))
+        if isinstance(self.avro_type, str) and self.avro_type in AVRO_NUMPY_TYPES:
+            return lambda values: np.array(values, dtype=AVRO_NUMPY_TYPES[self.avro_type])
+        # Strings, bytes, unions, logical and named types are kept as objects and inferred once at the end.
+        return lambda values: np.array(values, dtype=object)
+
+    def append(self, values: Sequence[Any]):
+        self.blocks.append(self.encode(values))
+
+    def to_series(self) -> pd.Series:
+        values: np.ndarray = np.concatenate(self.blocks) if self.blocks else self.encode([])
+        self.blocks = []
+        if self.categories is not None:
+            return pd.Series(pd.Categorical.from_codes(values, categories=self.categories), name=self.name)
+        if values.dtype == object and self.avro_type != "string":
+            return pd.Series(values.tolist(), name=self.name)
+        if self.compact and values.dtype == np.int64:
+            values = self.narrow(values, COMPACT_INTEGER_FIELDS.get(self.name,
+                                                                    COMPACT_INTEGER_TYPES.get(self.avro_type, np.int64)))
+        return pd.Series(values, name=self.name)
+
+    def narrow(self, values: np.ndarray, dtype: type) -> np.ndarray:
+        # Values outside the dtype are clipped to its bounds instead of wrapping around, so they stay outside every valid
+        # range and the range validators reject them. The original values are logged.
+        bounds: np.iinfo = np.iinfo(dtype)
+        outside: np.ndarray = (values < bounds.min) | (values > bounds.max)
+        if outside.any():
+            logging.warning("Column %s has %s values outside %s, clipped to its bounds: %s",
+                            self.name, int(outside.sum()), bounds.dtype, values[outside][:10].tolist())
+            values = np.clip(values, bounds.min, bounds.max)
+        return values.astype(dtype, copy=False)
+
+
+class AvroColumnarReader:
+    def __init__(self, fo: BinaryIO, columns: list[str] | None = None, schema: dict | None = None):
+        self.block_reader: Iterable = block_reader(fo)
+        self.schema: dict = self.block_reader.writer_schema
+        # The dataset schema selects the decoded fields and enables compact dtypes, the writer schema decodes them.
+        if schema and columns is None:
+            columns = [field["name"] for field in schema["fields"]]
+        fields: list[dict] = [field for field in self.schema["fields"] if columns is None or field["name"] in columns]
+        self.names: list[str] = [field["name"] for field in fields]
+        self.columns: list[AvroColumn] = [AvroColumn(field["name"], field["type"], compact=bool(schema)) for field in fields]
+
+    def decode_block(self, records: Iterable[dict[str, Any]]):
+        if len(self.names) == 1:
+            self.columns[0].append([record[self.names[0]] for record in records])
+            return
+        rows: list[tuple] = list(map(itemgetter(*self.names), records))
+        if not rows:
+            return
+        for column, values in zip(self.columns, zip(*rows)):
+            column.append(values)
+
+    def to_arrays(self) -> list[np.ndarray]:
+        arrays: list[np.ndarray] = [np.concatenate(column.blocks) if column.blocks else column.encode([])
+                                    for column in self.columns]
+        for column in self.columns:
+            column.blocks = []
+        return arrays
+
+    def to_frame(self, offset: int = 0) -> pd.DataFrame:
+        df: pd.DataFrame = pd.DataFrame({column.name: column.to_series() for column in self.columns}, columns=self.names)
+        df.index = pd.RangeIndex(offset, offset + len(df))
+        return df
+
+    def read(self) -> pd.DataFrame:
+        for block in self.block_reader:
+            self.decode_block(block)
+        return self.to_frame()
+
+    def read_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        offset: int = 0
+        rows: int = 0
+        for block in self.block_reader:
+            self.decode_block(block)
+            rows += block.num_records
+            if rows >= chunk_size:
+                yield self.to_frame(offset)
+                offset += rows
+                rows = 0
+        if rows or not offset:
+            yield self.to_frame(offset)
+
+
+class AvroBlockRange:
+    # A read-only stream over the container header followed by a contiguous range of blocks of a mapped file, so a
+    # range can be decoded by the regular block reader independently of the blocks before it.
+    def __init__(self, buffer: mmap.mmap, header_end: int, start: int, stop: int):
+        self.buffer: mmap.mmap = buffer
+        self.segments: list[tuple[int, int]] = [(0, header_end), (start, stop)]
+        self.length: int = header_end + stop - start
+        self.position: int = 0
+
+    def read(self, size: int = -1) -> bytes:
+        end: int = self.length if size < 0 else min(self.position + size, self.length)
+        parts: list[bytes] = []
+        segment_offset: int = 0
+        for segment_start, segment_stop in self.segments:
+            segment_length: int = segment_stop - segment_start
+            begin: int = max(self.position - segment_offset, 0)
+            finish: int = min(end - segment_offset, segment_length)
+            if begin < finish:
+                parts.append(self.buffer[segment_start + begin:segment_start + finish])
+            segment_offset += segment_length
+        self.position = end
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+
+    def tell(self) -> int:
+        return self.position
+
+
+def read_long(buffer: mmap.mmap, position: int) -> tuple[int, int]:
+    shift: int = 0
+    value: int = 0
+    while True:
+        byte: int = buffer[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return (value >> 1) ^ -(value & 1), position
+        shift += 7
+
+
+def avro_header_end(buffer: mmap.mmap) -> int:
+    buffer.seek(0)
+    block_reader(buffer)
+    return buffer.tell()
+
+
+def avro_block_bounds(buffer: mmap.mmap, header_end: int) -> list[tuple[int, int]]:
+    bounds: list[tuple[int, int]] = []
+    position: int = header_end
+    while position < len(buffer):
+        start: int = position
+        _, position = read_long(buffer, position)
+        size, position = read_long(buffer, position)
+        position += size + SYNC_SIZE
+        bounds.append((start, position))
+    return bounds
+
+
+def _decode_block_range(path: Path, columns: list[str] | None, schema: dict | None,
+                        header_end: int, start: int, stop: int) -> list[np.ndarray]:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        reader: AvroColumnarReader = AvroColumnarReader(AvroBlockRange(buffer, header_end, start, stop),
+                                                        columns=columns, schema=schema)
+        for block in reader.block_reader:
+            reader.decode_block(block)
+        return reader.to_arrays()
+
+
+class MappedAvroReader:
+    START_METHOD: str = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    PRELOADED_MODULES: list[str] = ['src.avro']
+
+    def __init__(self, path: Path, columns: list[str] | None = None, schema: dict | None = None, workers: int = 1):
+        self.path: Path = path
+        self.columns: list[str] | None = columns
+        self.schema: dict | None = schema
+        self.workers: int = workers
+
+    def read(self) -> pd.DataFrame:
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if self.workers <= 1:
+                return AvroColumnarReader(buffer, columns=self.columns, schema=self.schema).read()
+            header_end: int = avro_header_end(buffer)
+            bounds: list[tuple[int, int]] = avro_block_bounds(buffer, header_end)
+            reader: AvroColumnarReader = AvroColumnarReader(AvroBlockRange(buffer, header_end, header_end, header_end),
+                                                            columns=self.columns, schema=self.schema)
+        ranges: list[np.ndarray] = [part for part in np.array_split(np.array(bounds, dtype=np.int64).reshape(-1, 2),
+                                                                    min(self.workers, max(len(bounds), 1))) if len(part)]
+        if len(ranges) > 1:
+            context = multiprocessing.get_context(self.START_METHOD)
+            if self.START_METHOD == 'forkserver':
+                context.set_forkserver_preload(self.PRELOADED_MODULES)
+            with ProcessPoolExecutor(max_workers=len(ranges), mp_context=context) as executor:
+                results: list[list[np.ndarray]] = list(executor.map(
+                    _decode_block_range,
+                    *zip(*[(self.path, self.columns, self.schema, header_end, int(part[0, 0]), int(part[-1, 1]))
+                           for part in ranges])
+                ))
+        else:
+            results: list[list[np.ndarray]] = [_decode_block_range(self.path, self.columns, self.schema, header_end,
+                                                                    int(part[0, 0]), int(part[-1, 1])) for part in ranges]
+        for position, column in enumerate(reader.columns):
+            column.blocks = [result[position] for result in results]
+        return reader.to_frame()
+
+    def read_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from AvroColumnarReader(buffer, columns=self.columns, schema=self.schema).read_chunks(chunk_size)
+
+
+def read_avro(fo: BinaryIO, columns: list[str] | None = None, schema: dict | None = None) -> pd.DataFrame:
+    return AvroColumnarReader(fo, columns=columns, schema=schema).read()
+
+
+def read_avro_chunks(fo: BinaryIO, chunk_size: int, columns: list[str] | None = None,
+                     schema: dict | None = None) -> Iterator[pd.DataFrame]:
+    return AvroColumnarReader(fo, columns=columns, schema=schema).read_chunks(chunk_size)
+
+
+class AvroColumnarWriter:
+    BATCH_SIZE: int = 65536
+
+    def __init__(self, fo: BinaryIO, schema: dict, codec: str = "null", sync_interval: int = 16000):
+        self.writer: Writer = Writer(fo, schema, codec=codec, sync_interval=sync_interval)
+        self.names: list[str] = [field["name"] for field in schema["fields"]]
+
+    @staticmethod
+    def column_values(column: pd.Series) -> list[Any]:
+        # Python scalars in place of NumPy scalars, category values in place of codes and None in place of missing values.
+        return column.to_numpy(dtype=object, na_value=None).tolist()
+
+    def records(self, df: pd.DataFrame) -> Iterator[dict[str, Any]]:
+        for start in range(0, len(df), self.BATCH_SIZE):
+            batch: pd.DataFrame = df.iloc[start:start + self.BATCH_SIZE]
+            for row in zip(*[self.column_values(batch[name]) for name in self.names]):
+                yield dict(zip(self.names, row))
+
+    def write(self, df: pd.DataFrame):
+        for record in self.records(df):
+            self.writer.write(record)
+
+    def flush(self):
+        self.writer.flush()
+
+
+def write_avro(fo: BinaryIO, df: pd.DataFrame, schema: dict, codec: str = "null", sync_interval: int = 16000):
+    avro_writer: AvroColumnarWriter = AvroColumnarWriter(fo, schema, codec=codec, sync_interval=sync_interval)
+    avro_writer.write(df)
+    avro_writer.flush()
@@ -0,0 +1,214 @@
+import hashlib
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from stat import S_ISDIR, S_ISREG, S_IWGRP, S_IWOTH
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+
+def hash_values(value: Any) -> bytes:
+    hashes: np.ndarray = pd.util.hash_array(np.asarray(list(value), dtype=object))
+    if isinstance(value, (set, frozenset, pd.Index)):
+        hashes = np.sort(hashes)
+    return hashes.tobytes()
+
+
+class IndexFingerprintRegistry:
+    # Indexes are immutable, so the shared key indexes are hashed once per index object instead of once per pipeline
+    # run, and the hashes are dropped together with the index.
+    _hashes: dict[int, bytes] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get(cls, index: pd.Index) -> bytes:
+        key: int = id(index)
+        with cls._lock:
+            hashes: bytes | None = cls._hashes.get(key)
+        if hashes is None:
+            hashes = hash_values(index)
+            with cls._lock:
+                if key not in cls._hashes:
+                    cls._hashes[key] = hashes
+                    weakref.finalize(index, cls._hashes.pop, key, None)
+        return hashes
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._hashes.clear()
+
+
+def fingerprint_value(value: Any) -> bytes:
+    if isinstance(value, pd.Index):
+        return IndexFingerprintRegistry.get(value)
+    if isinstance(value, (set, frozenset, list, tuple, pd.Series, np.ndarray)):
+        return hash_values(value)
+    if isinstance(value, re.Pattern):
+        return f"{value.pattern}/{value.flags}".encode()
+    return repr(value).encode()
+
+
+def fingerprint(*values: Any) -> str:
+    digest = hashlib.sha256()
+    for value in values:
+        digest.update(fingerprint_value(value))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def trusted(stat: os.stat_result) -> bool:
+    # Unpickling runs arbitrary code, so only files and directories owned by this user that nobody else can write to
+    # are trusted.
+    return stat.st_uid == os.geteuid() and not stat.st_mode & (S_IWGRP | S_IWOTH)
+
+
+class ValidationCache:
+    SUFFIX: str = ".pickle"
+    DIRECTORY_MODE: int = 0o700
+
+    def __init__(self, directory: Path, max_size: int):
+        self.directory: Path = directory
+        self.max_size: int = max_size
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.SUFFIX}"
+
+    def open_directory(self) -> bool:
+        # Creates the directory private to this user, and refuses a directory somebody else could plant entries in.
+        self.directory.mkdir(mode=self.DIRECTORY_MODE, parents=True, exist_ok=True)
+        stat: os.stat_result = os.lstat(self.directory)
+        if not S_ISDIR(stat.st_mode) or not trusted(stat):
+            logging.error("Cache directory %s is not a directory owned by this user and writable only by it, the cache "
+                          "is not used", self.directory)
+            return False
+        return True
+
+    def get(self, key: str) -> Any | None:
+        path: Path = self.path(key)
+        try:
+            if not self.open_directory():
+                return None
+            # The checks are made on the opened file, so the entry cannot be swapped between the check and the load.
+            with open(os.open(path, os.O_RDONLY | os.O_NOFOLLOW), "rb") as f:
+                stat: os.stat_result = os.fstat(f.fileno())
+                if not S_ISREG(stat.st_mode) or not trusted(stat):
+                    logging.error("Cache entry %s is not a file owned by this user and writable only by it, ignored",
+                                  path)
+                    return None
+                entry: Any = pickle.load(f)
+            os.utime(path)
+            logging.info("Cache hit: %s", path)
+            return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logging.error("Failed to read cache entry %s: %s", path, e)
+            return None
+
+    def put(self, key: str, entry: Any):
+        try:
+            if not self.open_directory():
+                return
+            # Temporary files are created with mode 0600.
+            with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, self.path(key))
+            logging.info("Cache entry written: %s", self.path(key))
+            self.evict()
+        except OSError as e:
+            logging.error("Failed to write cache entry %s: %s", self.path(key), e)
+
+    def evict(self):
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            try:
+                stat: os.stat_result = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        size: int = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+            logging.info("Cache entry evicted: %s", path)
+
+
+class MemoryCache:
+    # Keeps entries as they are instead of pickling them, so a cached pipeline result is the same frame object on every
+    # hit and the key indexes built on it stay valid.
+    def __init__(self, max_entries: int):
+        self.max_entries: int = max_entries
+        self.entries: OrderedDict[str, Any] = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self.lock:
+            entry: Any | None = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                logging.info("Memory cache hit: %s", key)
+            return entry
+
+    def put(self, key: str, entry: Any):
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                evicted, _ = self.entries.popitem(last=False)
+                logging.info("Memory cache entry evicted: %s", evicted)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class SchemaCache:
+    def __init__(self, max_entries: int, disk_cache: ValidationCache | None = None):
+        self.max_entries: int = max_entries
+        self.disk_cache: ValidationCache | None = disk_cache
+        self.entries: OrderedDict[str, tuple[str, dict]] = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(self, name: str, version: str | None, load: Callable[[], dict]) -> dict:
+        if version is None:
+            return load()
+        with self.lock:
+            entry: tuple[str, dict] | None = self.entries.get(name)
+            if entry is not None and entry[0] == version:
+                self.entries.move_to_end(name)
+                return entry[1]
+        # Prefixed, so a schema entry can never share a key with a pipeline result in the same directory.
+        key: str = fingerprint("schema", name, version)
+        schema: dict | None = self.disk_cache.get(key) if self.disk_cache is not None else None
+        if schema is None:
+            schema = load()
+            if schema and self.disk_cache is not None:
+                self.disk_cache.put(key, schema)
+        if schema:
+            with self.lock:
+                self.entries[name] = (version, schema)
+                self.entries.move_to_end(name)
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+        return schema
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
@@ -1,4 +1,9 @@
+import threading
+from datetime import timedelta
+
+import urllib3
 from minio import Minio
+from urllib3 import Retry, Timeout
 
 from src.configurations import StorageConfiguration
 
@@ -7,19 +12,34 @@ class MinioClient:
     MINIO_ENDPOINT_URL: str = StorageConfiguration.MINIO_ENDPOINT_URL
     MINIO_ACCESS_KEY: str = StorageConfiguration.MINIO_ACCESS_KEY
     MINIO_SECRET_KEY: str = StorageConfiguration.MINIO_SECRET_KEY
+    MINIO_MAX_POOL_SIZE: int = StorageConfiguration.MINIO_MAX_POOL_SIZE
+    TIMEOUT: int = timedelta(minutes=5).seconds
     _instance: 'MinioClient' = None
+    _lock: threading.Lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
-        if not cls._instance:
-            cls._instance = super().__new__(cls)
-            cls._instance.client = Minio(
-                endpoint=cls.MINIO_ENDPOINT_URL,
-                access_key=cls.MINIO_ACCESS_KEY,
-                secret_key=cls.MINIO_SECRET_KEY,
-                secure=False,
-            )
+        with cls._lock:
+            if not cls._instance:
+                instance: 'MinioClient' = super().__new__(cls)
+                instance.client = Minio(
+                    endpoint=cls.MINIO_ENDPOINT_URL,
+                    access_key=cls.MINIO_ACCESS_KEY,
+                    secret_key=cls.MINIO_SECRET_KEY,
+                    secure=False,
+                    http_client=cls.http_client(),
+                )
+                cls._instance = instance
         return cls._instance
 
+    @classmethod
+    def http_client(cls) -> urllib3.PoolManager:
+        # Same settings as the MinIO default client, with a pool large enough for concurrent downloads.
+        return urllib3.PoolManager(
+            timeout=Timeout(connect=cls.TIMEOUT, read=cls.TIMEOUT),
+            maxsize=cls.MINIO_MAX_POOL_SIZE,
+            retries=Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+        )
+
     @staticmethod
     def connect():
         return MinioClient().client
@@ -4,7 +4,8 @@ from pathlib import Path
 
 from dotenv import dotenv_values
 
-from src.validator.models.enums import CoursePrerequisiteType, CourseType, CourseSemesterSeasonType, DatasetType
+from src.validator.models.enums import CoursePrerequisiteType, CourseType, CourseSemesterSeasonType, DatasetType, \
+    ValidationMode
 
 ENVIRONMENT_VARIABLES: dict[str, str] = {**dotenv_values("../.env"), **os.environ}
 
@@ -27,6 +28,30 @@ class ApplicationConfiguration:
     VALID_COURSE_SEMESTERS_RANGE: range = range(1, 8)
 
 
+class ExecutionConfiguration:
+    MAX_WORKERS: int = int(ENVIRONMENT_VARIABLES.get("MAX_WORKERS", os.cpu_count() or 1))
+    VALIDATION_MODE: ValidationMode = ValidationMode(ENVIRONMENT_VARIABLES.get("VALIDATION_MODE", ValidationMode.FAIL_FAST))
+    VALIDATION_SAMPLE_SIZE: int = int(ENVIRONMENT_VARIABLES.get("VALIDATION_SAMPLE_SIZE", 10))
+    FUSED_VALIDATION: bool = ENVIRONMENT_VARIABLES.get("FUSED_VALIDATION", "False").lower() == "true"
+    VALIDATION_WORKERS: int = int(ENVIRONMENT_VARIABLES.get("VALIDATION_WORKERS", 1))
+    CHUNK_SIZE: int | None = int(ENVIRONMENT_VARIABLES["CHUNK_SIZE"]) if ENVIRONMENT_VARIABLES.get("CHUNK_SIZE") else None
+    MMAP_INPUT: bool = ENVIRONMENT_VARIABLES.get("MMAP_INPUT", "False").lower() == "true"
+    DECODING_WORKERS: int = int(ENVIRONMENT_VARIABLES.get("DECODING_WORKERS", 1))
+    CACHE_DIRECTORY_PATH: Path | None = Path(ENVIRONMENT_VARIABLES["CACHE_DIRECTORY_PATH"]) \
+        if ENVIRONMENT_VARIABLES.get("CACHE_DIRECTORY_PATH") else None
+    CACHE_MAX_SIZE: int = int(ENVIRONMENT_VARIABLES.get("CACHE_MAX_SIZE", 1024 ** 3))
+    SCHEMA_CACHE_SIZE: int = int(ENVIRONMENT_VARIABLES.get("SCHEMA_CACHE_SIZE", 64))
+    RUN_REPORT_FILE_PATH: Path | None = Path(ENVIRONMENT_VARIABLES["RUN_REPORT_FILE_PATH"]) \
+        if ENVIRONMENT_VARIABLES.get("RUN_REPORT_FILE_PATH") else None
+    TRACE_MEMORY: bool = ENVIRONMENT_VARIABLES.get("TRACE_MEMORY", "False").lower() == "true"
+    UNIQUE_MEMORY_LIMIT: int = int(ENVIRONMENT_VARIABLES.get("UNIQUE_MEMORY_LIMIT", 64 * 1024 ** 2))
+
+
+class ServiceConfiguration:
+    SOCKET_PATH: Path = Path(ENVIRONMENT_VARIABLES.get("SERVICE_SOCKET_PATH", "validator.sock"))
+    RESULT_CACHE_SIZE: int = int(ENVIRONMENT_VARIABLES.get("SERVICE_RESULT_CACHE_SIZE", 32))
+
+
 class StorageConfiguration:
     FILE_STORAGE_TYPE: str = ENVIRONMENT_VARIABLES.get("FILE_STORAGE_TYPE")
     MINIO_ENDPOINT_URL: str = ENVIRONMENT_VARIABLES.get("MINIO_ENDPOINT_URL")
@@ -34,10 +59,20 @@ class StorageConfiguration:
     MINIO_SECRET_KEY: str = ENVIRONMENT_VARIABLES.get("MINIO_SECRET_KEY")
     MINIO_INPUT_DATA_BUCKET_NAME: str = ENVIRONMENT_VARIABLES.get("MINIO_INPUT_DATA_BUCKET_NAME")
     MINIO_SCHEMA_BUCKET_NAME: str = ENVIRONMENT_VARIABLES.get("MINIO_SCHEMA_BUCKET_NAME")
+    MINIO_OUTPUT_DATA_BUCKET_NAME: str = ENVIRONMENT_VARIABLES.get("MINIO_OUTPUT_DATA_BUCKET_NAME")
+    MINIO_MAX_POOL_SIZE: int = int(ENVIRONMENT_VARIABLES.get("MINIO_MAX_POOL_SIZE", 10))
+    MINIO_PREFETCH: bool = ENVIRONMENT_VARIABLES.get("MINIO_PREFETCH", "False").lower() == "true"
     # MINIO_SECURE_CONNECTION: bool = bool(ENVIRONMENT_VARIABLES.get("MINIO_SECURE_CONNECTION"))
 
     INPUT_DATA_DIRECTORY_PATH = Path(ENVIRONMENT_VARIABLES.get("INPUT_DATA_DIRECTORY_PATH", ".."))
     SCHEMA_DIRECTORY_PATH: Path = Path(ENVIRONMENT_VARIABLES.get('SCHEMA_DIRECTORY_PATH', '..'))
+    # No default, so stored datasets never land next to the inputs by accident.
+    OUTPUT_DATA_DIRECTORY_PATH: Path | None = Path(ENVIRONMENT_VARIABLES["OUTPUT_DATA_DIRECTORY_PATH"]) \
+        if ENVIRONMENT_VARIABLES.get("OUTPUT_DATA_DIRECTORY_PATH") else None
+
+    STORE_OUTPUT: bool = ENVIRONMENT_VARIABLES.get("STORE_OUTPUT", "False").lower() == "true"
+    OUTPUT_CODEC: str = ENVIRONMENT_VARIABLES.get("OUTPUT_CODEC", "deflate")
+    OUTPUT_SYNC_INTERVAL: int = int(ENVIRONMENT_VARIABLES.get("OUTPUT_SYNC_INTERVAL", 64 * 1024))
 
 
 class DatasetIOConfiguration:
@@ -45,112 +80,118 @@ class DatasetIOConfiguration:
                  ):
         self.file_name = file_name
 
+    def __repr__(self):
+        return f"DatasetIOConfiguration(file_name={self.file_name})"
+
+
+class EnvironmentPath:
+    # A file name read from the environment when it is first used, so a run only needs the file names of the datasets it
+    # validates. Unset output file names default to the input file name.
+    def __init__(self, name: str, default: str | None = None):
+        self.name: str = name
+        self.default: str | None = default
+
+    def __set_name__(self, owner: type, attribute: str):
+        self.attribute: str = attribute
+
+    def __get__(self, instance: object | None, owner: type) -> Path:
+        value: str | None = ENVIRONMENT_VARIABLES.get(self.name)
+        if value is None and self.default is not None:
+            value = ENVIRONMENT_VARIABLES.get(self.default)
+        if value is None:
+            raise ValueError(f"Environment variable {self.name} is not set.")
+        path: Path = Path(value)
+        setattr(owner, self.attribute, path)
+        return path
+
+    def __repr__(self):
+        return f"EnvironmentPath(name={self.name}, default={self.default})"
+
 
 class PathConfiguration:
-    STUDY_PROGRAMS_INPUT_DATA: Path = Path(ENVIRONMENT_VARIABLES.get("STUDY_PROGRAMS_DATA_INPUT_FILE_NAME"))
-    COURSES_INPUT_DATA: Path = Path(ENVIRONMENT_VARIABLES.get("COURSES_DATA_INPUT_FILE_NAME"))
-    PROFESSORS_INPUT_DATA: Path = Path(ENVIRONMENT_VARIABLES.get("PROFESSORS_DATA_INPUT_FILE_NAME"))
-    CURRICULA_INPUT_DATA: Path = Path(ENVIRONMENT_VARIABLES.get("CURRICULA_DATA_INPUT_FILE_NAME"))
-    REQUISITES_INPUT_DATA: Path = Path(ENVIRONMENT_VARIABLES.get("REQUISITES_DATA_INPUT_FILE_NAME"))
-    OFFERS_INPUT_DATA: Path = Path(ENVIRONMENT_VARIABLES.get("OFFERS_DATA_INPUT_FILE_NAME"))
-    INCLUDES_INPUT_DATA: Path = Path(ENVIRONMENT_VARIABLES.get("INCLUDES_DATA_INPUT_FILE_NAME"))
-    REQUIRES_INPUT_DATA: Path = Path(ENVIRONMENT_VARIABLES.get("REQUIRES_DATA_INPUT_FILE_NAME"))
-    SATISFIES_INPUT_DATA: Path = Path(ENVIRONMENT_VARIABLES.get("SATISFIES_DATA_INPUT_FILE_NAME"))
-    TEACHES_INPUT_DATA: Path = Path(ENVIRONMENT_VARIABLES.get("TEACHES_DATA_INPUT_FILE_NAME"))
-
-    STUDY_PROGRAMS_SCHEMA: Path = Path(ENVIRONMENT_VARIABLES.get("STUDY_PROGRAMS_SCHEMA_FILE_NAME"))
-    CURRICULA_SCHEMA: Path = Path(ENVIRONMENT_VARIABLES.get("CURRICULA_SCHEMA_FILE_NAME"))
-    COURSES_SCHEMA: Path = Path(ENVIRONMENT_VARIABLES.get("COURSES_SCHEMA_FILE_NAME"))
-    REQUISITES_SCHEMA: Path = Path(ENVIRONMENT_VARIABLES.get("REQUISITES_SCHEMA_FILE_NAME"))
-    PROFESSORS_SCHEMA: Path = Path(ENVIRONMENT_VARIABLES.get("PROFESSORS_SCHEMA_FILE_NAME"))
-    OFFERS_SCHEMA: Path = Path(ENVIRONMENT_VARIABLES.get("OFFERS_SCHEMA_FILE_NAME"))
-    INCLUDES_SCHEMA: Path = Path(ENVIRONMENT_VARIABLES.get("INCLUDES_SCHEMA_FILE_NAME"))
-    REQUIRES_SCHEMA: Path = Path(ENVIRONMENT_VARIABLES.get("REQUIRES_SCHEMA_FILE_NAME"))
-    SATISFIES_SCHEMA: Path = Path(ENVIRONMENT_VARIABLES.get("SATISFIES_SCHEMA_FILE_NAME"))
-    TEACHES_SCHEMA: Path = Path(ENVIRONMENT_VARIABLES.get("TEACHES_SCHEMA_FILE_NAME"))
+    STUDY_PROGRAMS_INPUT_DATA: Path = EnvironmentPath("STUDY_PROGRAMS_DATA_INPUT_FILE_NAME")
+    COURSES_INPUT_DATA: Path = EnvironmentPath("COURSES_DATA_INPUT_FILE_NAME")
+    PROFESSORS_INPUT_DATA: Path = EnvironmentPath("PROFESSORS_DATA_INPUT_FILE_NAME")
+    CURRICULA_INPUT_DATA: Path = EnvironmentPath("CURRICULA_DATA_INPUT_FILE_NAME")
+    REQUISITES_INPUT_DATA: Path = EnvironmentPath("REQUISITES_DATA_INPUT_FILE_NAME")
+    OFFERS_INPUT_DATA: Path = EnvironmentPath("OFFERS_DATA_INPUT_FILE_NAME")
+    INCLUDES_INPUT_DATA: Path = EnvironmentPath("INCLUDES_DATA_INPUT_FILE_NAME")
+    REQUIRES_INPUT_DATA: Path = EnvironmentPath("REQUIRES_DATA_INPUT_FILE_NAME")
+    SATISFIES_INPUT_DATA: Path = EnvironmentPath("SATISFIES_DATA_INPUT_FILE_NAME")
+    TEACHES_INPUT_DATA: Path = EnvironmentPath("TEACHES_DATA_INPUT_FILE_NAME")
+
+    STUDY_PROGRAMS_OUTPUT_DATA: Path = EnvironmentPath("STUDY_PROGRAMS_DATA_OUTPUT_FILE_NAME", default="STUDY_PROGRAMS_DATA_INPUT_FILE_NAME")
+    COURSES_OUTPUT_DATA: Path = EnvironmentPath("COURSES_DATA_OUTPUT_FILE_NAME", default="COURSES_DATA_INPUT_FILE_NAME")
+    PROFESSORS_OUTPUT_DATA: Path = EnvironmentPath("PROFESSORS_DATA_OUTPUT_FILE_NAME", default="PROFESSORS_DATA_INPUT_FILE_NAME")
+    CURRICULA_OUTPUT_DATA: Path = EnvironmentPath("CURRICULA_DATA_OUTPUT_FILE_NAME", default="CURRICULA_DATA_INPUT_FILE_NAME")
+    REQUISITES_OUTPUT_DATA: Path = EnvironmentPath("REQUISITES_DATA_OUTPUT_FILE_NAME", default="REQUISITES_DATA_INPUT_FILE_NAME")
+    OFFERS_OUTPUT_DATA: Path = EnvironmentPath("OFFERS_DATA_OUTPUT_FILE_NAME", default="OFFERS_DATA_INPUT_FILE_NAME")
+    INCLUDES_OUTPUT_DATA: Path = EnvironmentPath("INCLUDES_DATA_OUTPUT_FILE_NAME", default="INCLUDES_DATA_INPUT_FILE_NAME")
+    REQUIRES_OUTPUT_DATA: Path = EnvironmentPath("REQUIRES_DATA_OUTPUT_FILE_NAME", default="REQUIRES_DATA_INPUT_FILE_NAME")
+    SATISFIES_OUTPUT_DATA: Path = EnvironmentPath("SATISFIES_DATA_OUTPUT_FILE_NAME", default="SATISFIES_DATA_INPUT_FILE_NAME")
+    TEACHES_OUTPUT_DATA: Path = EnvironmentPath("TEACHES_DATA_OUTPUT_FILE_NAME", default="TEACHES_DATA_INPUT_FILE_NAME")
+
+    STUDY_PROGRAMS_SCHEMA: Path = EnvironmentPath("STUDY_PROGRAMS_SCHEMA_FILE_NAME")
+    CURRICULA_SCHEMA: Path = EnvironmentPath("CURRICULA_SCHEMA_FILE_NAME")
+    COURSES_SCHEMA: Path = EnvironmentPath("COURSES_SCHEMA_FILE_NAME")
+    REQUISITES_SCHEMA: Path = EnvironmentPath("REQUISITES_SCHEMA_FILE_NAME")
+    PROFESSORS_SCHEMA: Path = EnvironmentPath("PROFESSORS_SCHEMA_FILE_NAME")
+    OFFERS_SCHEMA: Path = EnvironmentPath("OFFERS_SCHEMA_FILE_NAME")
+    INCLUDES_SCHEMA: Path = EnvironmentPath("INCLUDES_SCHEMA_FILE_NAME")
+    REQUIRES_SCHEMA: Path = EnvironmentPath("REQUIRES_SCHEMA_FILE_NAME")
+    SATISFIES_SCHEMA: Path = EnvironmentPath("SATISFIES_SCHEMA_FILE_NAME")
+    TEACHES_SCHEMA: Path = EnvironmentPath("TEACHES_SCHEMA_FILE_NAME")
+
+
+class LazyDatasetConfiguration:
+    # Builds the configuration of a dataset when it is first used, so the file names of the other datasets are not read.
+    def __init__(self, dataset: DatasetType, prefix: str):
+        self.dataset: DatasetType = dataset
+        self.prefix: str = prefix
+
+    def __set_name__(self, owner: type, attribute: str):
+        self.attribute: str = attribute
+
+    def __get__(self, instance: object | None, owner: type) -> 'DatasetConfiguration':
+        configuration: DatasetConfiguration = owner(
+            dataset=self.dataset,
+            input_io_configuration=DatasetIOConfiguration(getattr(PathConfiguration, f"{self.prefix}_INPUT_DATA")),
+            schema_configuration=DatasetIOConfiguration(getattr(PathConfiguration, f"{self.prefix}_SCHEMA")),
+            output_io_configuration=DatasetIOConfiguration(getattr(PathConfiguration, f"{self.prefix}_OUTPUT_DATA")),
+        )
+        setattr(owner, self.attribute, configuration)
+        return configuration
+
+    def __repr__(self):
+        return f"LazyDatasetConfiguration(dataset={self.dataset}, prefix={self.prefix})"
 
 
 class DatasetConfiguration:
-    STUDY_PROGRAMS: "DatasetConfiguration"
-    COURSES: "DatasetConfiguration"
-    PROFESSORS: "DatasetConfiguration"
-    CURRICULA: "DatasetConfiguration"
-    REQUISITES: "DatasetConfiguration"
-    OFFERS: "DatasetConfiguration"
-    INCLUDES: "DatasetConfiguration"
-    REQUIRES: "DatasetConfiguration"
-    SATISFIES: "DatasetConfiguration"
-    TEACHES: "DatasetConfiguration"
+    STUDY_PROGRAMS: "DatasetConfiguration" = LazyDatasetConfiguration(DatasetType.STUDY_PROGRAMS, "STUDY_PROGRAMS")
+    COURSES: "DatasetConfiguration" = LazyDatasetConfiguration(DatasetType.COURSES, "COURSES")
+    PROFESSORS: "DatasetConfiguration" = LazyDatasetConfiguration(DatasetType.PROFESSORS, "PROFESSORS")
+    CURRICULA: "DatasetConfiguration" = LazyDatasetConfiguration(DatasetType.CURRICULA, "CURRICULA")
+    REQUISITES: "DatasetConfiguration" = LazyDatasetConfiguration(DatasetType.REQUISITES, "REQUISITES")
+    OFFERS: "DatasetConfiguration" = LazyDatasetConfiguration(DatasetType.OFFERS, "OFFERS")
+    INCLUDES: "DatasetConfiguration" = LazyDatasetConfiguration(DatasetType.INCLUDES, "INCLUDES")
+    REQUIRES: "DatasetConfiguration" = LazyDatasetConfiguration(DatasetType.POSTREQUISITES, "REQUIRES")
+    SATISFIES: "DatasetConfiguration" = LazyDatasetConfiguration(DatasetType.PREREQUISITES, "SATISFIES")
+    TEACHES: "DatasetConfiguration" = LazyDatasetConfiguration(DatasetType.TEACHES, "TEACHES")
 
     def __init__(self,
                  dataset: DatasetType,
                  input_io_configuration: DatasetIOConfiguration,
                  schema_configuration: DatasetIOConfiguration,
+                 output_io_configuration: DatasetIOConfiguration,
                  ):
         self.dataset_name = dataset
         self.input_io_configuration = input_io_configuration
         self.schema_configuration = schema_configuration
+        self.output_io_configuration = output_io_configuration
 
+    def __repr__(self):
+        return (f"DatasetConfiguration(dataset_name={self.dataset_name}, "
+                f"input_io_configuration={self.input_io_configuration}, "
+                f"schema_configuration={self.schema_configuration}, "
+                f"output_io_configuration={self.output_io_configuration})")
 
-DatasetConfiguration.STUDY_PROGRAMS = DatasetConfiguration(
-    dataset=DatasetType.STUDY_PROGRAMS,
-    input_io_configuration=DatasetIOConfiguration(PathConfiguration.STUDY_PROGRAMS_INPUT_DATA),
-    schema_configuration=DatasetIOConfiguration(PathConfiguration.STUDY_PROGRAMS_SCHEMA),
-)
-
-DatasetConfiguration.CURRICULA = DatasetConfiguration(
-    dataset=DatasetType.CURRICULA,
-    input_io_configuration=DatasetIOConfiguration(PathConfiguration.CURRICULA_INPUT_DATA),
-    schema_configuration=DatasetIOConfiguration(PathConfiguration.CURRICULA_SCHEMA),
-)
-
-DatasetConfiguration.COURSES = DatasetConfiguration(
-    dataset=DatasetType.COURSES,
-    input_io_configuration=DatasetIOConfiguration(PathConfiguration.COURSES_INPUT_DATA),
-    schema_configuration=DatasetIOConfiguration(PathConfiguration.COURSES_SCHEMA),
-)
-
-DatasetConfiguration.REQUISITES = DatasetConfiguration(
-    dataset=DatasetType.REQUISITES,
-    input_io_configuration=DatasetIOConfiguration(PathConfiguration.REQUISITES_INPUT_DATA),
-    schema_configuration=DatasetIOConfiguration(PathConfiguration.REQUISITES_SCHEMA),
-)
-
-DatasetConfiguration.PROFESSORS = DatasetConfiguration(
-    dataset=DatasetType.PROFESSORS,
-    input_io_configuration=DatasetIOConfiguration(PathConfiguration.PROFESSORS_INPUT_DATA),
-    schema_configuration=DatasetIOConfiguration(PathConfiguration.PROFESSORS_SCHEMA),
-)
-
-DatasetConfiguration.OFFERS = DatasetConfiguration(
-    dataset=DatasetType.OFFERS,
-    input_io_configuration=DatasetIOConfiguration(PathConfiguration.OFFERS_INPUT_DATA),
-    schema_configuration=DatasetIOConfiguration(PathConfiguration.OFFERS_SCHEMA),
-)
-
-DatasetConfiguration.INCLUDES = DatasetConfiguration(
-    dataset=DatasetType.INCLUDES,
-    input_io_configuration=DatasetIOConfiguration(PathConfiguration.INCLUDES_INPUT_DATA),
-    schema_configuration=DatasetIOConfiguration(PathConfiguration.INCLUDES_SCHEMA),
-
-)
-
-DatasetConfiguration.REQUIRES = DatasetConfiguration(
-    dataset=DatasetType.POSTREQUISITES,
-    input_io_configuration=DatasetIOConfiguration(PathConfiguration.REQUIRES_INPUT_DATA),
-    schema_configuration=DatasetIOConfiguration(PathConfiguration.REQUIRES_SCHEMA),
-
-)
-
-DatasetConfiguration.SATISFIES = DatasetConfiguration(
-    dataset=DatasetType.PREREQUISITES,
-    input_io_configuration=DatasetIOConfiguration(PathConfiguration.SATISFIES_INPUT_DATA),
-    schema_configuration=DatasetIOConfiguration(PathConfiguration.SATISFIES_SCHEMA),
-
-)
-
-DatasetConfiguration.TEACHES = DatasetConfiguration(
-    dataset=DatasetType.TEACHES,
-    input_io_configuration=DatasetIOConfiguration(PathConfiguration.TEACHES_INPUT_DATA),
-    schema_configuration=DatasetIOConfiguration(PathConfiguration.TEACHES_SCHEMA),
-)
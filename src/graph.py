@@ -0,0 +1,133 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+
+class CSRGraph:
+    def __init__(self, sources: np.ndarray, targets: np.ndarray, size: int):
+        order: np.ndarray = np.argsort(sources, kind="stable")
+        self.size: int = size
+        self.indices: np.ndarray = targets[order]
+        self.indptr: np.ndarray = np.concatenate([[0], np.cumsum(np.bincount(sources, minlength=size))])
+
+    def neighbors(self, nodes: np.ndarray) -> np.ndarray:
+        starts: np.ndarray = self.indptr[nodes]
+        counts: np.ndarray = self.indptr[nodes + 1] - starts
+        # Concatenated index ranges [start, start + count) of all nodes without a Python loop.
+        offsets: np.ndarray = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        return self.indices[offsets]
+
+    def unsorted_nodes(self) -> np.ndarray:
+        # Kahn's algorithm, one frontier of zero in-degree nodes at a time. Nodes that never reach zero in-degree lie on
+        # a cycle or downstream of one.
+        in_degree: np.ndarray = np.bincount(self.indices, minlength=self.size)
+        frontier: np.ndarray = np.flatnonzero(in_degree == 0)
+        while len(frontier):
+            neighbors: np.ndarray = self.neighbors(frontier)
+            np.subtract.at(in_degree, neighbors, 1)
+            frontier = np.unique(neighbors[in_degree[neighbors] == 0])
+        return in_degree > 0
+
+    def cyclic_nodes(self, candidates: np.ndarray) -> np.ndarray:
+        # Tarjan's algorithm over the candidate nodes, with an explicit stack instead of recursion. A node is on a cycle
+        # when its strongly connected component has more than one node or it has an edge to itself.
+        nodes: np.ndarray = np.flatnonzero(candidates)
+        successors: dict[int, list[int]] = {}
+        for node in nodes.tolist():
+            targets: np.ndarray = self.indices[self.indptr[node]:self.indptr[node + 1]]
+            successors[node] = targets[candidates[targets]].tolist()
+        cyclic: np.ndarray = np.zeros(self.size, dtype=bool)
+        order: dict[int, int] = {}
+        low: dict[int, int] = {}
+        stack: list[int] = []
+        on_stack: set[int] = set()
+        for root in successors:
+            if root in order:
+                continue
+            order[root] = low[root] = len(order)
+            stack.append(root)
+            on_stack.add(root)
+            work: list[tuple[int, int]] = [(root, 0)]
+            while work:
+                node, position = work[-1]
+                if position < len(successors[node]):
+                    work[-1] = (node, position + 1)
+                    successor: int = successors[node][position]
+                    if successor not in order:
+                        order[successor] = low[successor] = len(order)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, 0))
+                    elif successor in on_stack:
+                        low[node] = min(low[node], order[successor])
+                    continue
+                work.pop()
+                if work:
+                    low[work[-1][0]] = min(low[work[-1][0]], low[node])
+                if low[node] != order[node]:
+                    continue
+                component: list[int] = []
+                while not component or component[-1] != node:
+                    component.append(stack.pop())
+                    on_stack.discard(component[-1])
+                if len(component) > 1 or node in successors[node]:
+                    cyclic[component] = True
+        return cyclic
+
+
+def exact_unique(index: pd.Index) -> pd.Index:
+    return index if index.is_unique else index.drop_duplicates()
+
+
+class PrerequisiteGraph:
+    # Requisites are nodes 0..R-1 and courses are nodes R..R+C-1. A satisfies row adds the edge course -> requisite and
+    # a requires row adds the edge requisite -> course, so a prerequisite cycle between courses is a cycle of the graph.
+    def __init__(self, requisites: pd.DataFrame, satisfies: pd.DataFrame, requires: pd.DataFrame):
+        # Built from the exact ids: unique() and factorize compare object strings only up to the first NUL, so ids
+        # differing after one would become a single node.
+        self.requisites: pd.Index = exact_unique(pd.Index(requisites['requisite_id']))
+        course_ids: pd.Index = pd.Index(pd.concat([satisfies['prerequisite_course_id'], requires['course_id']],
+                                                  ignore_index=True))
+        self.courses: pd.Index = exact_unique(course_ids.dropna())
+        course_codes: np.ndarray = self.courses.get_indexer(course_ids)
+        size: int = len(self.requisites) + len(self.courses)
+        # Rows without a course id get no node, like rows referencing unknown requisites.
+        course_nodes: np.ndarray = np.where(course_codes >= 0, course_codes + len(self.requisites), -1)
+        satisfied_requisites: np.ndarray = self.requisites.get_indexer(satisfies['requisite_id'])
+        required_requisites: np.ndarray = self.requisites.get_indexer(requires['requisite_id'])
+        sources: np.ndarray = np.concatenate([course_nodes[:len(satisfies)], required_requisites])
+        targets: np.ndarray = np.concatenate([satisfied_requisites, course_nodes[len(satisfies):]])
+        # Rows referencing unknown requisites are reported by the referential checks and left out of the graph.
+        known: np.ndarray = (sources >= 0) & (targets >= 0)
+        sources, targets = sources[known], targets[known]
+        logging.info("Prerequisite graph: %s requisites, %s courses, %s edges",
+                     len(self.requisites), len(self.courses), len(sources))
+        graph: CSRGraph = CSRGraph(sources, targets, size)
+        # Nodes both Kahn passes leave unordered lie on a cycle or on a path between two cycles. Only these are searched
+        # for strongly connected components, so an acyclic graph never reaches the slower Python pass.
+        candidates: np.ndarray = graph.unsorted_nodes() & CSRGraph(targets, sources, size).unsorted_nodes()
+        cyclic: np.ndarray = graph.cyclic_nodes(candidates)
+        self.cyclic_requisites: np.ndarray = cyclic[:len(self.requisites)]
+        satisfied: np.ndarray = (satisfied_requisites >= 0) & (course_codes[:len(satisfies)] >= 0)
+        pairs: np.ndarray = np.unique(satisfied_requisites[satisfied].astype(np.int64) * max(len(self.courses), 1)
+                                      + course_codes[:len(satisfies)][satisfied])
+        self.satisfying_course_counts: np.ndarray = np.bincount(pairs // max(len(self.courses), 1),
+                                                                minlength=len(self.requisites))
+
+    def lookup(self, values: np.ndarray, requisite_ids: pd.Series) -> np.ndarray:
+        positions: np.ndarray = self.requisites.get_indexer(requisite_ids)
+        known: np.ndarray = positions >= 0
+        result: np.ndarray = np.zeros(len(positions), dtype=values.dtype)
+        result[known] = values[positions[known]]
+        return result
+
+    def is_cyclic(self, requisite_ids: pd.Series) -> np.ndarray:
+        return self.lookup(self.cyclic_requisites, requisite_ids)
+
+    def satisfying_courses(self, requisite_ids: pd.Series) -> np.ndarray:
+        return self.lookup(self.satisfying_course_counts, requisite_ids)
+
+    def __repr__(self):
+        return (f"PrerequisiteGraph(requisites={len(self.requisites)}, courses={len(self.courses)}, "
+                f"cyclic_requisites={int(self.cyclic_requisites.sum())})")
@@ -0,0 +1,101 @@
+import logging
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+
+
+class KeyIndexRegistry:
+    # One hash index per parent dataset column, shared by every relationship validator that references it and dropped
+    # together with the parent frame.
+    _indexes: dict[tuple[int, str], pd.Index] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get(cls, df: pd.DataFrame, column: str) -> pd.Index:
+        key: tuple[int, str] = (id(df), column)
+        with cls._lock:
+            index: pd.Index | None = cls._indexes.get(key)
+            if index is None:
+                logging.info("Building key index for column: %s", column)
+                # Built from the exact values: unique() compares object strings only up to the first NUL, so keys
+                # differing after one would collapse into a single entry. Checking uniqueness builds the hash table
+                # once, so lookups from concurrent pipelines and streamed chunks reuse it, and parent keys are usually
+                # unique already.
+                index = pd.Index(df[column], name=column)
+                if not index.is_unique:
+                    index = index.drop_duplicates()
+                    index.is_unique
+                cls._indexes[key] = index
+                weakref.finalize(df, cls._indexes.pop, key, None)
+        return index
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._indexes.clear()
+
+    @classmethod
+    def size(cls) -> int:
+        with cls._lock:
+            return len(cls._indexes)
+
+
+class GroupCodes:
+    def __init__(self, df: pd.DataFrame, columns: list[str]):
+        self.columns: list[str] = columns
+        # Group numbers in order of first appearance, rows with a missing key belong to no group (-1).
+        self.codes: np.ndarray = df.groupby(columns, sort=False, observed=True).ngroup().fillna(-1).to_numpy(dtype=np.intp)
+        self.size: int = int(self.codes.max()) + 1 if len(self.codes) else 0
+        self.grouped: np.ndarray = self.codes >= 0
+
+    def count(self, mask: np.ndarray) -> np.ndarray:
+        # Number of rows of each row's group for which the mask holds, 0 for rows without a group.
+        selected: np.ndarray = self.grouped & mask
+        counts: np.ndarray = np.bincount(self.codes[selected], minlength=self.size)
+        return np.where(self.grouped, counts[self.codes], 0)
+
+    def any(self, mask: np.ndarray) -> np.ndarray:
+        return self.count(mask) > 0
+
+    def first(self, values: pd.Series) -> np.ndarray:
+        # First non-missing value of each row's group, NaN where the group has none.
+        present: np.ndarray = self.grouped & values.notnull().to_numpy(dtype=bool)
+        positions: np.ndarray = np.flatnonzero(present)
+        first_positions: np.ndarray = np.full(self.size, -1, dtype=np.intp)
+        # Assigning in reverse order leaves the smallest position of each group.
+        first_positions[self.codes[positions[::-1]]] = positions[::-1]
+        row_positions: np.ndarray = np.where(self.grouped, first_positions[self.codes], -1)
+        result: np.ndarray = np.full(len(self.codes), np.nan)
+        found: np.ndarray = row_positions >= 0
+        result[found] = values.to_numpy()[row_positions[found]]
+        return result
+
+    def __repr__(self):
+        return f"GroupCodes(columns={self.columns}, rows={len(self.codes)}, groups={self.size})"
+
+
+class GroupCodeRegistry:
+    # One factorization of the group keys per frame, shared by every group filter evaluated on that frame and dropped
+    # together with it.
+    _codes: dict[tuple[int, tuple[str, ...]], GroupCodes] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get(cls, df: pd.DataFrame, columns: str | list[str]) -> GroupCodes:
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        key: tuple[int, tuple[str, ...]] = (id(df), tuple(columns))
+        with cls._lock:
+            codes: GroupCodes | None = cls._codes.get(key)
+            if codes is None:
+                logging.info("Building group codes for columns: %s", columns)
+                codes = GroupCodes(df, columns)
+                cls._codes[key] = codes
+                weakref.finalize(df, cls._codes.pop, key, None)
+        return codes
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._codes.clear()
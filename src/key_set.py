@@ -0,0 +1,123 @@
+import logging
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Header of a bytes object and the array slot pointing at it, counted on top of the length of every key held in memory.
+KEY_OVERHEAD: int = 41
+
+
+def encode_keys(frame: pd.DataFrame) -> np.ndarray:
+    # One bytes key per row. repr keeps values of different types apart, e.g. the string "1" and the integer 1.
+    columns: list[list] = [frame[column].tolist() for column in frame.columns]
+    values = columns[0] if len(columns) == 1 else zip(*columns)
+    return np.array([repr(value).encode() for value in values], dtype=object)
+
+
+def hash_keys(keys: np.ndarray) -> np.ndarray:
+    return pd.util.hash_array(keys)
+
+
+class MemoryKeyRun:
+    def __init__(self, hashes: np.ndarray, keys: np.ndarray):
+        order: np.ndarray = np.argsort(hashes, kind="stable")
+        self.hashes: np.ndarray = hashes[order]
+        self.keys: np.ndarray = keys[order]
+        self.nbytes: int = self.hashes.nbytes + sum(map(len, self.keys)) + KEY_OVERHEAD * len(self.keys)
+
+    def key(self, position: int) -> bytes:
+        return self.keys[position]
+
+    def __len__(self):
+        return len(self.hashes)
+
+
+class DiskKeyRun:
+    # Hashes, key offsets and key bytes in .npy files, memory-mapped so lookups page in only what they touch.
+    def __init__(self, directory: Path, hashes: np.ndarray, keys: np.ndarray):
+        lengths: np.ndarray = np.fromiter(map(len, keys), dtype=np.int64, count=len(keys))
+        np.save(directory / "hashes.npy", hashes)
+        np.save(directory / "offsets.npy", np.concatenate([[0], np.cumsum(lengths)]))
+        np.save(directory / "keys.npy", np.frombuffer(b"".join(keys), dtype=np.uint8))
+        self.hashes: np.ndarray = np.load(directory / "hashes.npy", mmap_mode="r")
+        self.offsets: np.ndarray = np.load(directory / "offsets.npy", mmap_mode="r")
+        self.data: np.ndarray = np.load(directory / "keys.npy", mmap_mode="r")
+
+    def key(self, position: int) -> bytes:
+        return self.data[self.offsets[position]:self.offsets[position + 1]].tobytes()
+
+    def __len__(self):
+        return len(self.hashes)
+
+
+def run_contains(run: MemoryKeyRun | DiskKeyRun, hashes: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    # Binary search by hash, then every key with an equal hash is compared, so hash collisions are never reported.
+    starts: np.ndarray = np.searchsorted(run.hashes, hashes, side="left")
+    stops: np.ndarray = np.searchsorted(run.hashes, hashes, side="right")
+    found: np.ndarray = np.zeros(len(hashes), dtype=bool)
+    for position in np.flatnonzero(stops > starts).tolist():
+        found[position] = any(run.key(candidate) == keys[position]
+                              for candidate in range(starts[position], stops[position]))
+    return found
+
+
+class SpillingKeySet:
+    # Keys are kept in sorted in-memory runs merged like a binary counter, so every key is re-sorted O(log n) times. When
+    # the runs use more than memory_limit bytes they are merged into one run written to disk, and later lookups binary
+    # search the memory-mapped files. The heap therefore holds at most memory_limit bytes of keys, and every spill adds
+    # one disk run to probe.
+    def __init__(self, memory_limit: int):
+        self.memory_limit: int = memory_limit
+        self.memory_runs: list[MemoryKeyRun] = []
+        self.disk_runs: list[DiskKeyRun] = []
+        self.spill_directory: tempfile.TemporaryDirectory | None = None
+
+    @property
+    def memory_size(self) -> int:
+        return sum(run.nbytes for run in self.memory_runs)
+
+    def contains(self, hashes: np.ndarray, keys: np.ndarray) -> np.ndarray:
+        found: np.ndarray = np.zeros(len(hashes), dtype=bool)
+        for run in [*self.memory_runs, *self.disk_runs]:
+            missing: np.ndarray = np.flatnonzero(~found)
+            found[missing] = run_contains(run, hashes[missing], keys[missing])
+        return found
+
+    def add(self, hashes: np.ndarray, keys: np.ndarray):
+        # Only keys that are not in the set yet are added, each once.
+        if not len(hashes):
+            return
+        run: MemoryKeyRun = MemoryKeyRun(hashes, keys)
+        while self.memory_runs and len(self.memory_runs[-1]) <= len(run):
+            previous: MemoryKeyRun = self.memory_runs.pop()
+            run = MemoryKeyRun(np.concatenate([previous.hashes, run.hashes]), np.concatenate([previous.keys, run.keys]))
+        self.memory_runs.append(run)
+        if self.memory_size > self.memory_limit:
+            self.spill()
+
+    def spill(self):
+        if self.spill_directory is None:
+            self.spill_directory = tempfile.TemporaryDirectory(prefix="unique-keys-")
+        directory: Path = Path(self.spill_directory.name) / str(len(self.disk_runs))
+        directory.mkdir()
+        run: MemoryKeyRun = MemoryKeyRun(np.concatenate([run.hashes for run in self.memory_runs]),
+                                         np.concatenate([run.keys for run in self.memory_runs]))
+        self.memory_runs = []
+        self.disk_runs.append(DiskKeyRun(directory, run.hashes, run.keys))
+        logging.info("Spilled %s keys to %s", len(run), directory)
+
+    def clear(self):
+        self.memory_runs = []
+        self.disk_runs = []
+        if self.spill_directory is not None:
+            self.spill_directory.cleanup()
+            self.spill_directory = None
+
+    def __len__(self):
+        return sum(len(run) for run in [*self.memory_runs, *self.disk_runs])
+
+    def __repr__(self):
+        return (f"SpillingKeySet(memory_limit={self.memory_limit}, memory_runs={len(self.memory_runs)}, "
+                f"disk_runs={len(self.disk_runs)}, keys={len(self)})")
@@ -1,32 +1,176 @@
+import argparse
+import json
 import logging
+import sys
 import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
+from src.configurations import DatasetConfiguration, ExecutionConfiguration, StorageConfiguration
+from src.validator.models.enums import DatasetType
+from src.validator.models.metrics import max_rss
 
-from src.validator.course_validator import course_validator
-from src.validator.curriculum_validator import curriculum_validator
-from src.validator.includes_validator import includes_validator
-from src.validator.offers_validator import offers_validator
-from src.validator.requires_validator import requires_validator
-from src.validator.satisfies_validator import satisfies_validator
-from src.validator.professor_validator import professor_validator
-from src.validator.requisite_validator import requisite_validator
-from src.validator.study_program_validator import study_program_validator
-from src.validator.teaches_validator import teaches_validator
+if TYPE_CHECKING:
+    from src.patterns.builder.dag import PipelineDAG
+    from src.validator.models.report import ValidationReport
 
 logging.basicConfig(level=logging.INFO)
 
-if __name__ == '__main__':
+# Validator of every dataset, named like its module in src.validator, and the datasets whose results it needs. Pandas,
+# the validator modules and the storage clients are only imported when a DAG is built and run.
+VALIDATORS: dict[DatasetType, tuple[str, list[DatasetType]]] = {
+    DatasetType.COURSES: ('course_validator', []),
+    DatasetType.PROFESSORS: ('professor_validator', []),
+    DatasetType.STUDY_PROGRAMS: ('study_program_validator', []),
+    DatasetType.REQUISITES: ('requisite_validator', []),
+    DatasetType.CURRICULA: ('curriculum_validator', []),
+    DatasetType.OFFERS: ('offers_validator', [DatasetType.CURRICULA, DatasetType.STUDY_PROGRAMS]),
+    DatasetType.INCLUDES: ('includes_validator', [DatasetType.CURRICULA, DatasetType.COURSES]),
+    DatasetType.PREREQUISITES: ('satisfies_validator', [DatasetType.REQUISITES, DatasetType.COURSES]),
+    DatasetType.POSTREQUISITES: ('requires_validator', [DatasetType.REQUISITES, DatasetType.COURSES]),
+    DatasetType.TEACHES: ('teaches_validator', [DatasetType.COURSES, DatasetType.PROFESSORS]),
+    DatasetType.PREREQUISITE_GRAPH: ('prerequisite_graph_validator', [DatasetType.REQUISITES, DatasetType.PREREQUISITES,
+                                                                      DatasetType.POSTREQUISITES]),
+}
+
+# Input dataset read from storage by every pipeline, the prerequisite graph is built from the results of others.
+INPUT_DATASETS: dict[DatasetType, str] = {
+    DatasetType.STUDY_PROGRAMS: 'STUDY_PROGRAMS',
+    DatasetType.COURSES: 'COURSES',
+    DatasetType.PROFESSORS: 'PROFESSORS',
+    DatasetType.CURRICULA: 'CURRICULA',
+    DatasetType.REQUISITES: 'REQUISITES',
+    DatasetType.OFFERS: 'OFFERS',
+    DatasetType.INCLUDES: 'INCLUDES',
+    DatasetType.POSTREQUISITES: 'REQUIRES',
+    DatasetType.PREREQUISITES: 'SATISFIES',
+    DatasetType.TEACHES: 'TEACHES',
+}
+
+# Datasets whose pipelines stream their input in chunks when CHUNK_SIZE is set.
+STREAMED_DATASETS: set[DatasetType] = {DatasetType.OFFERS, DatasetType.INCLUDES, DatasetType.PREREQUISITES,
+                                       DatasetType.POSTREQUISITES, DatasetType.TEACHES}
+
+
+def validator_dag(datasets: list[str] | None = None) -> 'PipelineDAG':
+    from src.patterns.builder.dag import LazyFactory, PipelineDAG, PipelineNode
+
+    dag: PipelineDAG = PipelineDAG(name='validator-dag', max_workers=ExecutionConfiguration.MAX_WORKERS)
+    for dataset, (validator, dependencies) in VALIDATORS.items():
+        dag.add_node(PipelineNode(name=dataset, factory=LazyFactory(f"src.validator.{validator}", validator),
+                                  dependencies=dependencies))
+    # Selected datasets are validated together with every dataset they depend on.
+    return dag.subset(datasets) if datasets else dag
+
+
+def prefetch_inputs(dag: 'PipelineDAG'):
+    from src.patterns.strategy.minio_storage import MinioPrefetcher
+
+    # Only the inputs of the selected datasets are configured and downloaded. A prefetched object is held in memory as a
+    # whole, so streamed datasets are left to read their chunks straight from the response instead.
+    streamed: set[DatasetType] = STREAMED_DATASETS if ExecutionConfiguration.CHUNK_SIZE else set()
+    MinioPrefetcher.start([getattr(DatasetConfiguration, INPUT_DATASETS[name]).input_io_configuration.file_name
+                           for name in dag.nodes if name in INPUT_DATASETS and name not in streamed])
+
+
+def check_outputs(dag: 'PipelineDAG'):
+    from src.patterns.mixin.storage import storage_strategy
+    from src.patterns.strategy.storage import StorageStrategy
+
+    # Refuses to run when a validated dataset would be stored without a destination or over its own input.
+    strategy: StorageStrategy = storage_strategy()
+    for name in dag.nodes:
+        if name in INPUT_DATASETS:
+            configuration: DatasetConfiguration = getattr(DatasetConfiguration, INPUT_DATASETS[name])
+            strategy.check_output(configuration.input_io_configuration.file_name,
+                                  configuration.output_io_configuration.file_name)
+
+
+def run_dag(dag: 'PipelineDAG') -> bool:
+    # Runs the validation and waits for the outputs to be stored, returns whether all of them were.
+    from src.patterns.strategy.storage import DatasetWriter
+
+    if StorageConfiguration.STORE_OUTPUT:
+        check_outputs(dag)
+    prefetch: bool = StorageConfiguration.FILE_STORAGE_TYPE == 'MINIO' and StorageConfiguration.MINIO_PREFETCH
+    if prefetch:
+        prefetch_inputs(dag)
+    stored: bool = False
+    try:
+        dag.run()
+    finally:
+        if prefetch:
+            from src.patterns.strategy.minio_storage import MinioPrefetcher
+            MinioPrefetcher.shutdown()
+        stored = DatasetWriter.wait_all()
+    return stored
+
+
+def write_run_report(dag: 'PipelineDAG', path: Path, elapsed: float):
+    report: dict = {
+        'wall_time': elapsed,
+        'cpu_time': time.process_time(),
+        'max_rss': max_rss(),
+        'traced_memory_peak': tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None,
+        'configuration': {
+            'validation_mode': ExecutionConfiguration.VALIDATION_MODE,
+            'fused_validation': ExecutionConfiguration.FUSED_VALIDATION,
+            'validation_workers': ExecutionConfiguration.VALIDATION_WORKERS,
+            'chunk_size': ExecutionConfiguration.CHUNK_SIZE,
+            'max_workers': ExecutionConfiguration.MAX_WORKERS,
+        },
+        'dag': dag.run_report(),
+        'validation': {name: {'is_valid': report.is_valid, 'invalid_count': report.invalid_count}
+                       for name, report in dag.validation_reports().items()},
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        logging.info("Run report written: %s", path)
+    except OSError as e:
+        logging.error("Failed to write run report %s: %s", path, e)
+
+
+def parse_arguments(arguments: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate the study program datasets.")
+    parser.add_argument("datasets", nargs="*", type=str.upper, metavar="DATASET",
+                        help="Datasets to validate together with the datasets they depend on, all when none are given.")
+    parser.add_argument("--list", action="store_true", help="List the datasets and the datasets they depend on.")
+    parsed: argparse.Namespace = parser.parse_args(arguments)
+    unknown: list[str] = [dataset for dataset in parsed.datasets if dataset not in VALIDATORS]
+    if unknown:
+        parser.error(f"unknown datasets: {', '.join(unknown)} (choose from {', '.join(VALIDATORS)})")
+    return parsed
+
+
+def main():
+    arguments: argparse.Namespace = parse_arguments()
+    if arguments.list:
+        for dataset, (_, dependencies) in VALIDATORS.items():
+            print(f"{dataset}: {', '.join(dependencies)}" if dependencies else dataset)
+        return
     logging.info("Starting...")
+    if ExecutionConfiguration.TRACE_MEMORY:
+        tracemalloc.start()
     start: float = time.perf_counter()
-    df_courses: pd.DataFrame = course_validator().build().run()
-    df_professors: pd.DataFrame = professor_validator().build().run()
-    df_study_programs: pd.DataFrame = study_program_validator().build().run()
-    df_requisites: pd.DataFrame = requisite_validator().build().run()
-    df_curricula: pd.DataFrame = curriculum_validator().build().run()
-    offers_validator(df_curricula, df_study_programs).build().run()
-    includes_validator(df_curricula, df_courses).build().run()
-    satisfies_validator(df_requisites, df_courses).build().run()
-    requires_validator(df_requisites, df_courses).build().run()
-    teaches_validator(df_courses, df_professors).build().run()
-    logging.info(f"Time taken: {time.perf_counter() - start:.2f} seconds")
+    dag: PipelineDAG = validator_dag(arguments.datasets).build()
+    try:
+        stored: bool = run_dag(dag)
+    finally:
+        if ExecutionConfiguration.RUN_REPORT_FILE_PATH is not None:
+            write_run_report(dag, ExecutionConfiguration.RUN_REPORT_FILE_PATH, time.perf_counter() - start)
+    logging.info("Time taken: %.2f seconds", time.perf_counter() - start)
+    reports: dict[str, ValidationReport] = dag.validation_reports()
+    invalid_reports: list[ValidationReport] = [report for report in reports.values() if not report.is_valid]
+    for report in invalid_reports:
+        logging.error("Validation failed: %s", report)
+        for failure in report.failures:
+            logging.error("%r", failure)
+    if invalid_reports or not stored:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
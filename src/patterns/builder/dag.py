@@ -0,0 +1,165 @@
+import importlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Callable
+
+import pandas as pd
+
+from src.patterns.builder.pipeline import Pipeline
+from src.validator.models.metrics import ExecutionMetrics
+from src.validator.models.report import ValidationReport
+
+
+class LazyFactory:
+    # Imports the module of a pipeline factory when the pipeline is first built, so only the modules of the pipelines
+    # that run are loaded.
+    def __init__(self, module_name: str, function_name: str):
+        self.module_name: str = module_name
+        self.function_name: str = function_name
+
+    def __call__(self, *inputs: pd.DataFrame) -> Pipeline:
+        factory: Callable[..., Pipeline] = getattr(importlib.import_module(self.module_name), self.function_name)
+        return factory(*inputs)
+
+    def __repr__(self):
+        return f"LazyFactory(module_name={self.module_name}, function_name={self.function_name})"
+
+
+class PipelineNode:
+    def __init__(self,
+                 name: str,
+                 factory: Callable[..., Pipeline],
+                 dependencies: list[str] | None = None,
+                 ):
+        self.name: str = name
+        self.factory: Callable[..., Pipeline] = factory
+        self.dependencies: list[str] = dependencies if dependencies is not None else []
+        self.validation_report: ValidationReport | None = None
+        self.metrics_report: dict | None = None
+
+    def run(self, *inputs: pd.DataFrame) -> pd.DataFrame:
+        pipeline: Pipeline = self.factory(*inputs).build()
+        try:
+            data: pd.DataFrame = pipeline.run()
+        finally:
+            self.metrics_report = pipeline.metrics_report()
+        self.validation_report = pipeline.validation_report()
+        return data
+
+    def __repr__(self):
+        return f"PipelineNode(name={self.name}, dependencies={self.dependencies})"
+
+    def __str__(self):
+        return f"{self.name}"
+
+
+class PipelineDAG:
+    def __init__(self,
+                 name: str,
+                 nodes: list[PipelineNode] | None = None,
+                 max_workers: int | None = None,
+                 ):
+        self.name: str = name
+        self.nodes: dict[str, PipelineNode] = {node.name: node for node in nodes} if nodes is not None else {}
+        self.max_workers: int | None = max_workers
+        self.metrics: ExecutionMetrics = ExecutionMetrics(name=name)
+
+    def add_node(self, node: PipelineNode) -> 'PipelineDAG':
+        if node.name in self.nodes:
+            raise ValueError(f"Duplicate pipeline node: {node.name}")
+        self.nodes[node.name] = node
+        return self
+
+    def build(self) -> 'PipelineDAG':
+        for node in self.nodes.values():
+            missing: list[str] = [dependency for dependency in node.dependencies if dependency not in self.nodes]
+            if missing:
+                raise ValueError(f"Pipeline node {node.name} depends on unknown nodes: {missing}")
+        self.topological_order()
+        return self
+
+    def subset(self, names: list[str]) -> 'PipelineDAG':
+        # The named nodes together with every node they depend on, directly or through other nodes.
+        selected: set[str] = set()
+        pending: list[str] = list(names)
+        while pending:
+            name: str = pending.pop()
+            if name not in self.nodes:
+                raise ValueError(f"Unknown pipeline node: {name}")
+            if name not in selected:
+                selected.add(name)
+                pending.extend(self.nodes[name].dependencies)
+        return PipelineDAG(name=self.name, nodes=[node for name, node in self.nodes.items() if name in selected],
+                           max_workers=self.max_workers)
+
+    def topological_order(self) -> list[str]:
+        in_degree: dict[str, int] = {name: len(node.dependencies) for name, node in self.nodes.items()}
+        dependants: dict[str, list[str]] = {name: [] for name in self.nodes}
+        for name, node in self.nodes.items():
+            for dependency in node.dependencies:
+                dependants[dependency].append(name)
+        ready: list[str] = [name for name, degree in in_degree.items() if degree == 0]
+        order: list[str] = []
+        while ready:
+            name: str = ready.pop(0)
+            order.append(name)
+            for dependant in dependants[name]:
+                in_degree[dependant] -= 1
+                if in_degree[dependant] == 0:
+                    ready.append(dependant)
+        if len(order) != len(self.nodes):
+            cyclic: list[str] = [name for name in self.nodes if name not in order]
+            raise ValueError(f"Pipeline DAG {self.name} contains a cycle between nodes: {cyclic}")
+        return order
+
+    def run(self) -> dict[str, pd.DataFrame]:
+        logging.info("Pipeline DAG: %r started...", self)
+        started: tuple = self.metrics.start()
+        results: dict[str, pd.DataFrame] = {}
+        pending: dict[str, PipelineNode] = dict(self.nodes)
+        running: dict[Future, PipelineNode] = {}
+        # No more nodes are submitted than there are workers, so every node that has not started is still pending and
+        # is never started once a node fails.
+        workers: int = self.max_workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.name) as executor:
+            while pending or running:
+                for name, node in list(pending.items()):
+                    if len(running) >= workers:
+                        break
+                    if all(dependency in results for dependency in node.dependencies):
+                        inputs: list[pd.DataFrame] = [results[dependency] for dependency in node.dependencies]
+                        running[executor.submit(node.run, *inputs)] = pending.pop(name)
+                if not running:
+                    raise ValueError(f"Pipeline DAG {self.name} cannot schedule nodes: {list(pending)}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node: PipelineNode = running.pop(future)
+                    try:
+                        results[node.name] = future.result()
+                    except Exception:
+                        logging.error("Pipeline node %s failed, cancelling the remaining nodes.", node.name)
+                        for remaining in running:
+                            remaining.cancel()
+                        raise
+        # The DAG moves no rows itself, so it reports the rows read and produced by all of its pipelines.
+        reports: list[dict] = [node.metrics_report for node in self.nodes.values() if node.metrics_report is not None]
+        self.metrics.stop(started, rows_in=sum(report['rows_in'] for report in reports),
+                          rows_out=sum(report['rows_out'] for report in reports))
+        logging.info("Pipeline DAG: %r finished.", self)
+        return results
+
+    def validation_reports(self) -> dict[str, ValidationReport]:
+        return {name: node.validation_report for name, node in self.nodes.items() if node.validation_report is not None}
+
+    def run_report(self) -> dict:
+        # Wall time and memory of the whole run, the CPU time of the DAG thread only, and the metrics of every pipeline.
+        return {**self.metrics.to_dict(),
+                'pipelines': {name: node.metrics_report for name, node in self.nodes.items()
+                              if node.metrics_report is not None}}
+
+    def __repr__(self):
+        return f"PipelineDAG(name={self.name}, nodes={list(self.nodes.values())})"
+
+    def __str__(self):
+        return f"{self.name}"
@@ -0,0 +1,68 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.patterns.strategy.validator import ValidatorStrategy
+
+# Strategies installed once per worker process by the pool initializer, so the strategies and their lookup sets are sent
+# once per pool instead of with every partition of every chunk.
+_worker_strategies: list[ValidatorStrategy] = []
+
+
+def _initialize_worker(strategies: list[ValidatorStrategy]):
+    global _worker_strategies
+    _worker_strategies = strategies
+
+
+def _evaluate_partition(partition: pd.DataFrame) -> list[np.ndarray]:
+    return [strategy.invalid_mask(partition).to_numpy(dtype=bool) for strategy in _worker_strategies]
+
+
+class PartitionedValidator:
+    START_METHOD: str = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    PRELOADED_MODULES: list[str] = ['src.patterns.builder.partition']
+    # Smaller partitions cost more to send to a worker and back than to validate in place, e.g. small streamed chunks.
+    MIN_PARTITION_ROWS: int = 10_000
+    # The fork server is started once per process, so its preloaded modules are only set before the first pool.
+    _preloaded: bool = False
+    _lock: threading.Lock = threading.Lock()
+
+    def __init__(self, strategies: list[ValidatorStrategy], workers: int):
+        self.strategies: list[ValidatorStrategy] = strategies
+        self.workers: int = workers
+        self.columns: list[str] = list(dict.fromkeys(strategy.column for strategy in strategies))
+        self.executor: ProcessPoolExecutor | None = None
+
+    def partitions(self, data: pd.DataFrame) -> list[pd.DataFrame]:
+        bounds: np.ndarray = np.linspace(0, len(data), num=self.workers + 1, dtype=np.int64)
+        projection: pd.DataFrame = data[self.columns]
+        return [projection.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+    def open(self) -> ProcessPoolExecutor:
+        # The pool and its workers live until close, so the chunks of a streamed pipeline reuse them.
+        if self.executor is None:
+            context = multiprocessing.get_context(self.START_METHOD)
+            with self._lock:
+                if self.START_METHOD == 'forkserver' and not PartitionedValidator._preloaded:
+                    context.set_forkserver_preload(self.PRELOADED_MODULES)
+                    PartitionedValidator._preloaded = True
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                mp_context=context,
+                                                initializer=_initialize_worker,
+                                                initargs=(self.strategies,))
+        return self.executor
+
+    def invalid_masks(self, data: pd.DataFrame) -> list[np.ndarray]:
+        results: list[list[np.ndarray]] = list(self.open().map(_evaluate_partition, self.partitions(data)))
+        return [np.concatenate([result[position] for result in results]) for position in range(len(self.strategies))]
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    def __repr__(self):
+        return f"PartitionedValidator(workers={self.workers}, strategies={self.strategies})"
@@ -2,36 +2,190 @@ import logging
 
 import pandas as pd
 
+from src.cache import MemoryCache, ValidationCache, fingerprint
+from src.configurations import ExecutionConfiguration, StorageConfiguration
 from src.patterns.builder.stage import PipelineStage
+from src.validator.models.enums import StageType
+from src.validator.models.metrics import ExecutionMetrics
+from src.validator.models.report import ValidationReport
 
 
 class Pipeline:
+    # Set by long-running processes to keep pipeline results in memory between runs instead of in the cache directory.
+    result_cache: MemoryCache | None = None
+
     def __init__(self,
                  name: str,
                  stages: list[PipelineStage] | None = None,
                  data: pd.DataFrame | None = None,
+                 chunk_size: int | None = None,
+                 output_columns: list[str] | None = None,
                  ):
         self.name: str = name
         self.stages: list[PipelineStage] = stages if stages is not None else []
         self.data: pd.DataFrame | None = data.copy() if data is not None else None
+        self.chunk_size: int | None = chunk_size
+        # Columns kept as the pipeline result for dependent pipelines, all of them when unset. Streamed pipelines only
+        # keep a result when these are set.
+        self.output_columns: list[str] | None = output_columns
+        self.metrics: ExecutionMetrics = ExecutionMetrics(name=name)
+        self.cached: bool = False
 
-    def run(self) -> pd.DataFrame:
-        logging.info(f"Pipeline: {repr(self)} started...")
-        for stage in self.stages:
-            self.data = stage.run(self.data)
-        logging.info(f"Pipeline: {repr(self)} finished.")
+    def run(self) -> pd.DataFrame | None:
+        logging.info("Pipeline: %r started...", self)
+        self.reset()
+        started: tuple = self.metrics.start()
+        rows_in: int = len(self.data) if self.data is not None else 0
+        cache: MemoryCache | ValidationCache | None = self.cache()
+        cache_key: str | None = self.cache_key() if cache is not None else None
+        if cache_key is not None and (entry := cache.get(cache_key)) is not None:
+            self.restore(entry)
+            self.cached = True
+            self.metrics.stop(started, rows_in=rows_in, rows_out=len(self.data) if self.data is not None else 0)
+            logging.info("Pipeline: %s unchanged since the cached run, skipped.", self.name)
+            return self.data
+        try:
+            if self.chunk_size is not None:
+                self.run_streaming()
+            else:
+                for stage in self.stages:
+                    if self.skips(stage):
+                        continue
+                    self.data = stage.run(self.data)
+                if self.output_columns is not None and self.data is not None:
+                    self.data = self.data[self.output_columns]
+        except Exception:
+            self.close_writers(commit=False)
+            self.reset_strategies()
+            self.close_stages()
+            raise
+        self.close_writers(commit=self.validation_report().is_valid)
+        self.reset_strategies()
+        self.close_stages()
+        if cache_key is not None:
+            cache.put(cache_key, self.snapshot())
+        self.metrics.stop(started, *self.row_counts(rows_in))
+        logging.info("Pipeline: %s finished.", self.metrics)
         return self.data
 
+    def run_streaming(self) -> None:
+        load_stage, *stages = self.stages
+        if self.data is not None or load_stage.stage_type != StageType.LOAD or len(load_stage.steps) != 1:
+            raise ValueError(f"Pipeline {self.name} can only stream when its first stage is a single-step load stage.")
+        rows: int = 0
+        outputs: list[pd.DataFrame] = []
+        for chunk in load_stage.steps[0].stream(self.chunk_size):
+            for stage in stages:
+                if self.skips(stage):
+                    continue
+                chunk = stage.run(chunk)
+            rows += len(chunk)
+            if self.output_columns is not None:
+                outputs.append(chunk[self.output_columns])
+        if self.output_columns is not None:
+            self.data = pd.concat(outputs, ignore_index=True) if outputs else None
+        logging.info("Pipeline: %s streamed %s rows.", self.name, rows)
+
+    def reset(self):
+        self.metrics.reset()
+        self.cached = False
+        for stage in self.stages:
+            stage.metrics.reset()
+            for step in stage.steps:
+                step.validation_failures.clear()
+                step.metrics.reset()
+        self.reset_strategies()
+
+    def row_counts(self, rows_in: int) -> tuple[int, int]:
+        # Loaded pipelines count the rows their load steps produced, the output is what the last executed stage returned.
+        rows_in += sum(step.metrics.rows_out for stage in self.stages if stage.stage_type == StageType.LOAD
+                       for step in stage.steps)
+        executed: list[PipelineStage] = [stage for stage in self.stages if stage.metrics.calls]
+        return rows_in, executed[-1].metrics.rows_out if executed else rows_in
+
+    def reset_strategies(self):
+        # Stateful strategies such as uniqueness checks carry state across the chunks of one run only.
+        for stage in self.stages:
+            for step in stage.steps:
+                if step.strategy is not None:
+                    step.strategy.reset()
+
+    def close_stages(self):
+        # Worker pools are shared by the chunks of one run only.
+        for stage in self.stages:
+            stage.close()
+
+    def skips(self, stage: PipelineStage) -> bool:
+        if stage.stage_type != StageType.STORE:
+            return False
+        if not StorageConfiguration.STORE_OUTPUT:
+            return True
+        if not self.validation_report().is_valid:
+            logging.warning("Pipeline: %s has validation failures, stage %s skipped.", self.name, stage.name)
+            return True
+        return False
+
+    def close_writers(self, commit: bool):
+        for stage in self.stages:
+            if stage.stage_type == StageType.STORE:
+                for step in stage.steps:
+                    step.close_writer(commit=commit)
+
+    def cache(self) -> MemoryCache | ValidationCache | None:
+        if self.result_cache is not None:
+            return self.result_cache
+        if ExecutionConfiguration.CACHE_DIRECTORY_PATH is not None:
+            return ValidationCache(directory=ExecutionConfiguration.CACHE_DIRECTORY_PATH,
+                                   max_size=ExecutionConfiguration.CACHE_MAX_SIZE)
+        return None
+
+    def cache_key(self) -> str | None:
+        if self.data is not None:
+            return None
+        input_fingerprints: list[str | None] = [step.input_fingerprint() for stage in self.stages for step in stage.steps
+                                                if step.reads_data]
+        if not input_fingerprints or None in input_fingerprints:
+            return None
+        # A cached run skips its store stage, so a run storing to another destination is not a cache hit.
+        output_fingerprints: list[str] = [step.output_fingerprint() for stage in self.stages for step in stage.steps
+                                          if step.writes_data] if StorageConfiguration.STORE_OUTPUT else []
+        return fingerprint(self.name, self.chunk_size, self.output_columns, StorageConfiguration.STORE_OUTPUT,
+                           ExecutionConfiguration.VALIDATION_MODE, ExecutionConfiguration.VALIDATION_SAMPLE_SIZE,
+                           *[stage.name for stage in self.stages],
+                           *[step.fingerprint() for stage in self.stages for step in stage.steps],
+                           *input_fingerprints, *output_fingerprints)
+
+    def snapshot(self) -> dict:
+        return {
+            'data': self.data,
+            'validation_failures': [[list(step.validation_failures) for step in stage.steps] for stage in self.stages],
+        }
+
+    def restore(self, entry: dict):
+        self.data = entry['data']
+        for stage, stage_failures in zip(self.stages, entry['validation_failures']):
+            for step, step_failures in zip(stage.steps, stage_failures):
+                step.validation_failures.extend(step_failures)
+
+    def metrics_report(self) -> dict:
+        return {**self.metrics.to_dict(), 'cached': self.cached,
+                'stages': [stage.metrics_report() for stage in self.stages]}
+
     def add_stage(self, stage: PipelineStage) -> 'Pipeline':
         self.stages.append(stage)
         return self
 
+    def validation_report(self) -> ValidationReport:
+        return ValidationReport(name=self.name,
+                                failures=[failure for stage in self.stages for failure in stage.validation_failures])
+
     def build(self) -> 'Pipeline':
         self.stages = [stage.build() for stage in self.stages]
         return self
 
     def __repr__(self):
-        return f"Pipeline(name={self.name}, stages={self.stages})"
+        return (f"Pipeline(name={self.name}, chunk_size={self.chunk_size}, output_columns={self.output_columns}, "
+                f"stages={self.stages})")
 
     def __str__(self):
         return f"{self.name}"
@@ -1,8 +1,13 @@
 import logging
 
+import numpy as np
 import pandas as pd
 
+from src.configurations import ExecutionConfiguration
 from src.validator.models.enums import StageType
+from src.validator.models.metrics import ExecutionMetrics
+from src.validator.models.report import ValidationFailure
+from src.patterns.builder.partition import PartitionedValidator
 from src.patterns.builder.step import PipelineStep
 
 
@@ -10,27 +15,96 @@ class PipelineStage:
     def __init__(self,
                  name: str,
                  stage_type: StageType,
-                 steps: list[PipelineStep] | None = None):
+                 steps: list[PipelineStep] | None = None,
+                 fused: bool | None = None,
+                 workers: int | None = None):
         self.name: str = name
         self.stage_type: StageType = stage_type
         self.steps: list[PipelineStep] | None = steps if steps is not None else []
+        self.fused: bool = fused if fused is not None else ExecutionConfiguration.FUSED_VALIDATION
+        self.workers: int = workers if workers is not None else ExecutionConfiguration.VALIDATION_WORKERS
+        self.metrics: ExecutionMetrics = ExecutionMetrics(name=name)
+        # Validators of each group of partitioned steps, kept with their worker pools until the pipeline run ends.
+        self.partitioned_validators: dict[tuple[PipelineStep, ...], PartitionedValidator] = {}
 
     def run(self, data: pd.DataFrame) -> pd.DataFrame:
-        logging.info(f"Stage: {repr(self)} started...")
+        logging.info("Stage: %s started...", self)
+        started: tuple = self.metrics.start()
+        rows_in: int = len(data) if data is not None else 0
+        if self.fused or self.workers > 1:
+            data = self.run_fused(data)
+        else:
+            for step in self.steps:
+                data = step.run(data)
+        self.metrics.stop(started, rows_in=rows_in, rows_out=len(data) if data is not None else 0)
+        logging.info("Stage: %s finished.", self.metrics)
+        return data
+
+    def run_fused(self, data: pd.DataFrame) -> pd.DataFrame:
+        validation_steps: list[PipelineStep] = []
         for step in self.steps:
+            if step.strategy is not None:
+                validation_steps.append(step)
+                continue
+            data = self.validate_fused(data, validation_steps)
+            validation_steps = []
             data = step.run(data)
-        logging.info(f"Stage: {repr(self)} finished.")
+        return self.validate_fused(data, validation_steps)
+
+    def validate_fused(self, data: pd.DataFrame, steps: list[PipelineStep]) -> pd.DataFrame:
+        if not steps:
+            return data
+        logging.info("Executing fused steps: %s...", steps)
+        partitioned_steps: list[PipelineStep] = [step for step in steps if step.strategy.partitionable] \
+            if self.workers > 1 and len(data) >= self.workers * PartitionedValidator.MIN_PARTITION_ROWS else []
+        partitioned_masks: dict[PipelineStep, np.ndarray] = dict(zip(
+            partitioned_steps, self.partitioned_validator(partitioned_steps).invalid_masks(data))) \
+            if partitioned_steps else {}
+        invalid_masks: list[np.ndarray] = [partitioned_masks[step] if step in partitioned_masks
+                                           else self.invalid_mask(step, data) for step in steps]
+        if np.logical_or.reduce(invalid_masks).any():
+            for step, invalid_mask in zip(steps, invalid_masks):
+                step.check(df=data, strategy=step.strategy, invalid_mask=pd.Series(invalid_mask, index=data.index))
+        logging.info("Finished executing fused steps: %s.", steps)
         return data
 
+    def partitioned_validator(self, steps: list[PipelineStep]) -> PartitionedValidator:
+        validator: PartitionedValidator | None = self.partitioned_validators.get(tuple(steps))
+        if validator is None:
+            validator = PartitionedValidator(strategies=[step.strategy for step in steps], workers=self.workers)
+            self.partitioned_validators[tuple(steps)] = validator
+        return validator
+
+    def close(self):
+        for validator in self.partitioned_validators.values():
+            validator.close()
+        self.partitioned_validators.clear()
+
+    @staticmethod
+    def invalid_mask(step: PipelineStep, data: pd.DataFrame) -> np.ndarray:
+        # Fused steps are not run one by one, so the evaluation of their strategies is measured here.
+        started: tuple = step.metrics.start()
+        invalid_mask: np.ndarray = step.strategy.invalid_mask(data).to_numpy(dtype=bool)
+        step.metrics.stop(started, rows_in=len(data), rows_out=len(data))
+        return invalid_mask
+
     def add_step(self, step: PipelineStep) -> 'PipelineStage':
         self.steps.append(step)
         return self
 
+    @property
+    def validation_failures(self) -> list[ValidationFailure]:
+        return [failure for step in self.steps for failure in step.validation_failures]
+
+    def metrics_report(self) -> dict:
+        return {**self.metrics.to_dict(), 'steps': [step.metrics.to_dict() for step in self.steps]}
+
     def build(self) -> 'PipelineStage':
-        return PipelineStage(name=self.name, stage_type=self.stage_type, steps=self.steps)
+        return PipelineStage(name=self.name, stage_type=self.stage_type, steps=self.steps, fused=self.fused,
+                             workers=self.workers)
 
     def __repr__(self):
-        return f"PipelineStage(name={self.name}, steps={self.steps})"
+        return f"PipelineStage(name={self.name}, fused={self.fused}, workers={self.workers}, steps={self.steps})"
 
     def __str__(self):
         return f"{self.name}"
@@ -1,26 +1,78 @@
 import logging
+from typing import Iterator
 
 import pandas as pd
 
+from src.cache import fingerprint
 from src.patterns.mixin.storage import FileStorageMixin
+from src.patterns.mixin.data_filtering import DataFilteringMixin
 from src.patterns.mixin.data_validation import DataValidationMixin
+from src.patterns.strategy.validator import ValidatorStrategy
+from src.validator.models.metrics import ExecutionMetrics
 
 
-class PipelineStep(FileStorageMixin, DataValidationMixin):
+class PipelineStep(FileStorageMixin, DataValidationMixin, DataFilteringMixin):
     def __init__(self, name: str, function: callable, *args, **kwargs):
         super().__init__()
         self.name: str = name
         self.function: callable = function
         self.args = args
         self.kwargs = kwargs
+        self.metrics: ExecutionMetrics = ExecutionMetrics(name=name)
+
+    @property
+    def strategy(self) -> ValidatorStrategy | None:
+        return self.kwargs.get('strategy') if self.function is PipelineStep.validate else None
+
+    @property
+    def reads_data(self) -> bool:
+        return self.function is PipelineStep.read_data
+
+    @property
+    def writes_data(self) -> bool:
+        return self.function is PipelineStep.write_data
+
+    def fingerprint(self) -> str:
+        arguments: list = [value.fingerprint() if hasattr(value, 'fingerprint') else value
+                           for value in [*self.args, *self.kwargs.values()]]
+        return fingerprint(self.name, self.function.__name__, *self.kwargs.keys(), *arguments)
+
+    def input_fingerprint(self) -> str | None:
+        if not self.reads_data:
+            return None
+        return self.fingerprint_data(*self.args, **self.kwargs)
+
+    def output_fingerprint(self) -> str | None:
+        if not self.writes_data:
+            return None
+        return self.fingerprint_output(*self.args, **self.kwargs)
+
+    def stream(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        if not self.reads_data:
+            raise ValueError(f"Step {self.name} cannot be streamed, only read_data steps yield chunks.")
+        logging.info("Streaming step: %r in chunks of %s rows...", self, chunk_size)
+        return self.measure_chunks(self.read_chunks(chunk_size=chunk_size, *self.args, **self.kwargs))
+
+    def measure_chunks(self, chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        while True:
+            # Only the decoding of each chunk is measured, not the time the consumer spends on it.
+            started: tuple = self.metrics.start()
+            chunk: pd.DataFrame | None = next(chunks, None)
+            if chunk is None:
+                return
+            self.metrics.stop(started, rows_in=0, rows_out=len(chunk))
+            yield chunk
 
     def run(self, data: pd.DataFrame | None = None) -> pd.DataFrame:
-        logging.info(f"Executing step: {repr(self)}...")
+        logging.info("Executing step: %s...", self)
+        started: tuple = self.metrics.start()
+        rows_in: int = len(data) if data is not None else 0
         if data is None:
             data = self.function(self, *self.args, **self.kwargs)
         else:
             data = self.function(self, df=data, *self.args, **self.kwargs)
-        logging.info(f"Finished executing step: {repr(self)}.")
+        self.metrics.stop(started, rows_in=rows_in, rows_out=len(data) if data is not None else 0)
+        logging.info("Finished executing step: %s.", self.metrics)
         return data
 
     def __repr__(self):
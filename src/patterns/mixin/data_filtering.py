@@ -0,0 +1,18 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.patterns.strategy.filter import FilteringStrategy
+
+
+class DataFilteringMixin:
+    def __init__(self):
+        super().__init__()
+
+    def filter(self, df: pd.DataFrame, strategy: FilteringStrategy) -> pd.DataFrame:
+        mask: np.ndarray = strategy.mask(df)
+        if mask.all():
+            return df
+        logging.info("Step %s kept %s of %s rows.", self.name, int(mask.sum()), len(df))
+        return df[mask]
@@ -1,11 +1,39 @@
 import pandas as pd
 
+from src.configurations import ExecutionConfiguration
 from src.patterns.strategy.validator import ValidatorStrategy
+from src.validator.models.enums import ValidationMode
+from src.validator.models.report import ValidationFailure
 
 
 class DataValidationMixin:
+    def __init__(self):
+        super().__init__()
+        self.validation_mode: ValidationMode = ExecutionConfiguration.VALIDATION_MODE
+        self.validation_failures: list[ValidationFailure] = []
 
     def validate(self, df: pd.DataFrame,
                  strategy: ValidatorStrategy,
                  ) -> pd.DataFrame:
-        return strategy.validate(df)
+        return self.check(df=df, strategy=strategy, invalid_mask=strategy.invalid_mask(df))
+
+    def check(self, df: pd.DataFrame,
+              strategy: ValidatorStrategy,
+              invalid_mask: pd.Series,
+              ) -> pd.DataFrame:
+        if self.validation_mode == ValidationMode.FAIL_FAST:
+            return strategy.check(df=df, invalid_mask=invalid_mask)
+        if invalid_mask.any():
+            failure: ValidationFailure = ValidationFailure.from_mask(
+                step_name=self.name,
+                strategy=strategy,
+                df=df,
+                invalid_mask=invalid_mask,
+                sample_size=ExecutionConfiguration.VALIDATION_SAMPLE_SIZE,
+            )
+            if self.validation_failures:
+                # Streamed pipelines validate chunk by chunk, so a step keeps one failure that grows per chunk.
+                self.validation_failures[-1].merge(failure, sample_size=ExecutionConfiguration.VALIDATION_SAMPLE_SIZE)
+            else:
+                self.validation_failures.append(failure)
+        return df
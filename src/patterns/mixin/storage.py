@@ -1,19 +1,66 @@
+from typing import Iterator
+
 import pandas as pd
 
+from src.cache import fingerprint
 from src.configurations import DatasetConfiguration, StorageConfiguration
-from src.patterns.strategy.storage import LocalStorage, MinioStorage
+from src.patterns.strategy.storage import DatasetWriter, LocalStorage, StorageStrategy
+
+
+def storage_strategy() -> StorageStrategy:
+    if StorageConfiguration.FILE_STORAGE_TYPE == 'LOCAL':
+        return LocalStorage()
+    if StorageConfiguration.FILE_STORAGE_TYPE == 'MINIO':
+        # The MinIO client and its HTTP stack are only imported when MinIO is used.
+        from src.patterns.strategy.minio_storage import MinioStorage
+        return MinioStorage()
+    raise ValueError(f"Unsupported storage type: {StorageConfiguration.FILE_STORAGE_TYPE}")
 
 
 class FileStorageMixin:
     def __init__(self):
-        if StorageConfiguration.FILE_STORAGE_TYPE == 'LOCAL':
-            self.file_storage_strategy = LocalStorage()
-        elif StorageConfiguration.FILE_STORAGE_TYPE == 'MINIO':
-            self.file_storage_strategy = MinioStorage()
-        else:
-            raise ValueError(f"Unsupported storage type: {StorageConfiguration.FILE_STORAGE_TYPE}")
+        super().__init__()
+        self.file_storage_strategy: StorageStrategy = storage_strategy()
+        self.dataset_writer: DatasetWriter | None = None
+
+    def load_schema(self, configuration: DatasetConfiguration) -> dict:
+        return self.file_storage_strategy.load_schema(configuration.schema_configuration.file_name)
 
     def read_data(self, configuration: DatasetConfiguration) -> pd.DataFrame:
-        df: pd.DataFrame = self.file_storage_strategy.read_data(configuration.input_io_configuration.file_name)
+        df: pd.DataFrame = self.file_storage_strategy.read_data(configuration.input_io_configuration.file_name,
+                                                                schema=self.load_schema(configuration))
+        return df
+
+    def read_chunks(self, configuration: DatasetConfiguration, chunk_size: int) -> Iterator[pd.DataFrame]:
+        return self.file_storage_strategy.read_chunks(configuration.input_io_configuration.file_name, chunk_size,
+                                                      schema=self.load_schema(configuration))
+
+    def write_data(self, df: pd.DataFrame, configuration: DatasetConfiguration) -> pd.DataFrame:
+        if self.dataset_writer is None:
+            schema: dict = self.load_schema(configuration)
+            if not schema:
+                raise ValueError(f"Cannot store {configuration.dataset_name} without its schema.")
+            self.dataset_writer = self.file_storage_strategy.open_writer(configuration.output_io_configuration.file_name,
+                                                                         schema)
+        self.dataset_writer.write(df)
         return df
 
+    def close_writer(self, commit: bool):
+        if self.dataset_writer is not None:
+            self.dataset_writer.close(commit=commit)
+            self.dataset_writer = None
+
+    def fingerprint_data(self, configuration: DatasetConfiguration) -> str | None:
+        data_fingerprint: str | None = self.file_storage_strategy.fingerprint(configuration.input_io_configuration.file_name)
+        if data_fingerprint is None:
+            return None
+        # The schema decides the decoded dtypes, so a changed schema invalidates the cached results as well.
+        return fingerprint(data_fingerprint,
+                           self.file_storage_strategy.schema_version(configuration.schema_configuration.file_name))
+
+    def check_output(self, configuration: DatasetConfiguration):
+        self.file_storage_strategy.check_output(configuration.input_io_configuration.file_name,
+                                                configuration.output_io_configuration.file_name)
+
+    def fingerprint_output(self, configuration: DatasetConfiguration) -> str:
+        return self.file_storage_strategy.output_location(configuration.output_io_configuration.file_name)
@@ -1,18 +1,39 @@
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from src.cache import fingerprint
+from src.key_index import GroupCodeRegistry, GroupCodes
 
-class FilteringStrategy:
 
+class FilteringStrategy:
     def __and__(self, other: 'FilteringStrategy') -> 'FilteringStrategy':
         return AndFilteringStrategy(self, other)
 
     def __or__(self, other: 'FilteringStrategy') -> 'FilteringStrategy':
         return OrFilteringStrategy(self, other)
 
+    def mask(self, df: pd.DataFrame, rows: np.ndarray | None = None) -> np.ndarray:
+        # Boolean mask over all rows of the frame. With rows given, only those positions are evaluated and the other
+        # rows are False.
+        raise NotImplementedError("Subclasses must implement the mask method.")
+
     def filter(self, df: pd.DataFrame) -> pd.DataFrame:
-        raise NotImplementedError("Subclasses must implement the filter method.")
+        return df[self.mask(df)]
+
+    def fingerprint(self) -> str:
+        return fingerprint(self.__class__.__name__, *[item for name, value in sorted(vars(self).items())
+                                                      for item in (name, value.fingerprint()
+                                                                   if isinstance(value, FilteringStrategy) else value)])
+
+    @staticmethod
+    def restrict(mask: np.ndarray, rows: np.ndarray | None) -> np.ndarray:
+        if rows is None:
+            return mask
+        restricted: np.ndarray = np.zeros(len(mask), dtype=bool)
+        restricted[rows] = mask[rows]
+        return restricted
 
 
 class AndFilteringStrategy(FilteringStrategy):
@@ -20,11 +41,13 @@ class AndFilteringStrategy(FilteringStrategy):
         self.left = left
         self.right = right
 
-    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
-        left_result: pd.DataFrame = self.left.filter(df)
-        right_result: pd.DataFrame = self.right.filter(df)
-        mask: pd.Series = df.index.isin(left_result.index) & df.index.isin(right_result.index)
-        return df.loc[mask]
+    def mask(self, df: pd.DataFrame, rows: np.ndarray | None = None) -> np.ndarray:
+        left_mask: np.ndarray = self.left.mask(df, rows)
+        # The right side only decides the rows the left side kept.
+        survivors: np.ndarray = np.flatnonzero(left_mask)
+        if not len(survivors):
+            return left_mask
+        return self.right.mask(df, survivors)
 
 
 class OrFilteringStrategy(FilteringStrategy):
@@ -32,36 +55,51 @@ class OrFilteringStrategy(FilteringStrategy):
         self.left = left
         self.right = right
 
-    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
-        left_result: pd.DataFrame = self.left.filter(df)
-        right_result: pd.DataFrame = self.right.filter(df)
-        mask: pd.Series = df.index.isin(left_result.index) | df.index.isin(right_result.index)
-        return df.loc[mask]
+    def mask(self, df: pd.DataFrame, rows: np.ndarray | None = None) -> np.ndarray:
+        left_mask: np.ndarray = self.left.mask(df, rows)
+        # The right side only decides the rows the left side rejected.
+        undecided: np.ndarray = np.flatnonzero(~left_mask) if rows is None else rows[~left_mask[rows]]
+        if not len(undecided):
+            return left_mask
+        return left_mask | self.right.mask(df, undecided)
 
-class ColumnValueFilteringStrategy(FilteringStrategy):
-    def __init__(self, column: str, value: Any):
-        self.column = column
-        self.value = value
 
 class ColumnReferenceFilteringStrategy(FilteringStrategy):
     def __init__(self, column: str):
         self.column = column
 
+    def evaluate(self, column: pd.Series) -> np.ndarray:
+        raise NotImplementedError("Subclasses must implement the evaluate method.")
+
+    def mask(self, df: pd.DataFrame, rows: np.ndarray | None = None) -> np.ndarray:
+        column: pd.Series = df[self.column]
+        if rows is None:
+            return self.evaluate(column)
+        mask: np.ndarray = np.zeros(len(column), dtype=bool)
+        mask[rows] = self.evaluate(column.iloc[rows])
+        return mask
+
+
+class ColumnValueFilteringStrategy(ColumnReferenceFilteringStrategy):
+    def __init__(self, column: str, value: Any):
+        super().__init__(column)
+        self.value = value
+
 
 class NotNullFilteringStrategy(ColumnReferenceFilteringStrategy):
     def __init__(self, column: str):
         super().__init__(column)
 
-    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
-        return df[df[self.column].notnull()]
+    def evaluate(self, column: pd.Series) -> np.ndarray:
+        return column.notnull().to_numpy(dtype=bool)
 
 
 class NotEqualFilteringStrategy(ColumnValueFilteringStrategy):
     def __init__(self, column: str, value: Any):
         super().__init__(column, value)
 
-    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
-        return df[df[self.column] != self.value]
+    def evaluate(self, column: pd.Series) -> np.ndarray:
+        return (column != self.value).to_numpy(dtype=bool)
 
 
 class GroupFilteringStrategy(FilteringStrategy):
@@ -69,26 +107,34 @@ class GroupFilteringStrategy(FilteringStrategy):
         self.group_by_columns = group_by_columns
         self.evaluated_columns = evaluated_columns
 
+    def group_mask(self, df: pd.DataFrame, codes: GroupCodes) -> np.ndarray:
+        raise NotImplementedError("Subclasses must implement the group_mask method.")
+
+    def present(self, df: pd.DataFrame) -> np.ndarray:
+        # A row is a member of its group when all of its evaluated columns are set.
+        values: pd.Series | pd.DataFrame = df[self.evaluated_columns]
+        present: pd.Series | pd.DataFrame = values.notnull()
+        return (present.all(axis=1) if isinstance(present, pd.DataFrame) else present).to_numpy(dtype=bool)
+
+    def mask(self, df: pd.DataFrame, rows: np.ndarray | None = None) -> np.ndarray:
+        # Groups are judged on all of their rows, so the whole frame is evaluated even when only some rows are needed.
+        # The group codes are factorized once per frame and shared by all group strategies on it.
+        return self.restrict(self.group_mask(df, GroupCodeRegistry.get(df, self.group_by_columns)), rows)
+
+
 class GroupExistsFilteringStrategy(GroupFilteringStrategy):
     def __init__(self, group_by_columns: str | list[str], evaluated_columns: str | list[str]):
         super().__init__(group_by_columns, evaluated_columns)
 
-    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
-        mask: pd.DataFrame = df.groupby(self.group_by_columns)[self.evaluated_columns].transform(
-            lambda x: x.notnull().any())
-        return df[mask]
+    def group_mask(self, df: pd.DataFrame, codes: GroupCodes) -> np.ndarray:
+        return codes.any(self.present(df))
 
 
 class GroupHasAtLeastNMembersFilteringStrategy(GroupFilteringStrategy):
     def __init__(self, group_by_columns: str | list[str], evaluated_columns: str | list[str],
-                 threshold_columns: str | list[str]):
+                 threshold_columns: str):
         super().__init__(group_by_columns, evaluated_columns)
         self.threshold_columns = threshold_columns
 
-    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
-        mask: pd.Series = (  # type: ignore
-                df.groupby(self.group_by_columns)[self.evaluated_columns].transform('count')
-                >=
-                df.groupby(self.group_by_columns)[self.threshold_columns].transform('first')
-        )
-        return df[mask]
+    def group_mask(self, df: pd.DataFrame, codes: GroupCodes) -> np.ndarray:
+        return codes.count(self.present(df)) >= codes.first(df[self.threshold_columns])
@@ -0,0 +1,162 @@
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+from fastavro import parse_schema
+from minio import S3Error, Minio
+from urllib3 import BaseHTTPResponse
+
+from src.avro import read_avro, read_avro_chunks
+from src.clients import MinioClient
+from src.configurations import StorageConfiguration
+from src.patterns.strategy.storage import DatasetWriter, StorageStrategy
+
+
+@contextmanager
+def open_minio_object(bucket_name: str, object_name: str) -> Iterator[BaseHTTPResponse]:
+    minio: Minio = MinioClient.connect()
+    response: BaseHTTPResponse = minio.get_object(bucket_name=bucket_name, object_name=object_name)
+    try:
+        yield response
+    finally:
+        response.close()
+        response.release_conn()
+
+
+class MinioPrefetcher:
+    _executor: ThreadPoolExecutor | None = None
+    _downloads: dict[str, Future] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def start(cls, input_file_names: list[Path]):
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=StorageConfiguration.MINIO_MAX_POOL_SIZE,
+                                                   thread_name_prefix='minio-prefetch')
+            for input_file_name in map(str, input_file_names):
+                if input_file_name not in cls._downloads:
+                    logging.info("Prefetching data from MinIO bucket: %s/%s",
+                                 StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, input_file_name)
+                    cls._downloads[input_file_name] = cls._executor.submit(cls.download, input_file_name)
+
+    @staticmethod
+    def download(input_file_name: str) -> bytes:
+        with open_minio_object(StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, input_file_name) as response:
+            return response.read()
+
+    @classmethod
+    def take(cls, input_file_name: Path) -> BytesIO | None:
+        with cls._lock:
+            download: Future | None = cls._downloads.pop(str(input_file_name), None)
+        if download is None:
+            return None
+        return BytesIO(download.result())
+
+    @classmethod
+    def shutdown(cls):
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+            cls._downloads.clear()
+
+
+class MinioStorage(StorageStrategy):
+
+    @staticmethod
+    def schema_object_name(schema_file_name: Path) -> str:
+        return "/".join([StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, str(schema_file_name)])
+
+    def read_schema(self, schema_file_name: Path) -> dict:
+        object_name: str = self.schema_object_name(schema_file_name)
+        try:
+            logging.info("Reading schema from MinIO bucket: %s/%s",
+                         StorageConfiguration.MINIO_SCHEMA_BUCKET_NAME, object_name)
+            with open_minio_object(StorageConfiguration.MINIO_SCHEMA_BUCKET_NAME, object_name) as response:
+                return parse_schema(json.load(response))
+        except S3Error as e:
+            logging.error("Failed to read schema from MinIO bucket %s/%s: %s",
+                          StorageConfiguration.MINIO_SCHEMA_BUCKET_NAME, object_name, e)
+            return {}
+
+    def schema_version(self, schema_file_name: Path) -> str | None:
+        try:
+            minio: Minio = MinioClient.connect()
+            return minio.stat_object(StorageConfiguration.MINIO_SCHEMA_BUCKET_NAME,
+                                     self.schema_object_name(schema_file_name)).etag
+        except S3Error:
+            return None
+
+    def read_data(self, input_file_name: Path, schema: dict | None = None) -> pd.DataFrame:
+        try:
+            logging.info("Reading data from MinIO bucket: %s/%s",
+                         StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, input_file_name)
+            buffer: BytesIO | None = MinioPrefetcher.take(input_file_name)
+            if buffer is not None:
+                return read_avro(buffer, schema=schema)
+            # Decode straight from the response body, without buffering the whole object in memory first.
+            with open_minio_object(StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, str(input_file_name)) as response:
+                return read_avro(response, schema=schema)
+        except S3Error as e:
+            logging.error("Failed to read data from MinIO bucket %s: %s",
+                          StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, e)
+            return pd.DataFrame()
+
+    def read_chunks(self, input_file_name: Path, chunk_size: int, schema: dict | None = None) -> Iterator[pd.DataFrame]:
+        try:
+            logging.info("Streaming data from MinIO bucket: %s/%s in chunks of %s rows",
+                         StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, input_file_name, chunk_size)
+            buffer: BytesIO | None = MinioPrefetcher.take(input_file_name)
+            if buffer is not None:
+                yield from read_avro_chunks(buffer, chunk_size, schema=schema)
+                return
+            with open_minio_object(StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, str(input_file_name)) as response:
+                yield from read_avro_chunks(response, chunk_size, schema=schema)
+        except S3Error as e:
+            logging.error("Failed to read data from MinIO bucket %s: %s",
+                          StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, e)
+            yield pd.DataFrame()
+
+    def open_writer(self, output_file_name: Path, schema: dict) -> DatasetWriter:
+        logging.info("Writing data to MinIO bucket: %s/%s",
+                     StorageConfiguration.MINIO_OUTPUT_DATA_BUCKET_NAME, output_file_name)
+        return DatasetWriter(output_file_name, schema, directory=None, commit=partial(self.upload, output_file_name))
+
+    def check_output(self, input_file_name: Path, output_file_name: Path):
+        if not StorageConfiguration.MINIO_OUTPUT_DATA_BUCKET_NAME:
+            raise ValueError("MINIO_OUTPUT_DATA_BUCKET_NAME must be set to store the validated datasets.")
+        if StorageConfiguration.MINIO_OUTPUT_DATA_BUCKET_NAME == StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME \
+                and str(output_file_name) == str(input_file_name):
+            raise ValueError(f"Output data {StorageConfiguration.MINIO_OUTPUT_DATA_BUCKET_NAME}/{output_file_name} would "
+                             f"overwrite the input data, set MINIO_OUTPUT_DATA_BUCKET_NAME or the output file name to "
+                             f"another location.")
+
+    def output_location(self, output_file_name: Path) -> str:
+        return f"minio:{StorageConfiguration.MINIO_OUTPUT_DATA_BUCKET_NAME}/{output_file_name}"
+
+    @staticmethod
+    def upload(output_file_name: Path, path: Path):
+        minio: Minio = MinioClient.connect()
+        try:
+            minio.fput_object(StorageConfiguration.MINIO_OUTPUT_DATA_BUCKET_NAME, str(output_file_name), str(path))
+        except S3Error as e:
+            # Reported like the failures of local storage when the dataset writers are awaited.
+            raise OSError(f"Failed to upload {output_file_name} to MinIO bucket "
+                          f"{StorageConfiguration.MINIO_OUTPUT_DATA_BUCKET_NAME}: {e}") from e
+
+    def fingerprint(self, input_file_name: Path) -> str | None:
+        try:
+            minio: Minio = MinioClient().connect()
+            return minio.stat_object(StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, str(input_file_name)).etag
+        except S3Error as e:
+            logging.error("Failed to fingerprint data in MinIO bucket %s: %s",
+                          StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, e)
+            return None
@@ -1,89 +1,238 @@
+import hashlib
 import json
 import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Callable, Iterator
 
 import pandas as pd
-from fastavro import writer, parse_schema, reader
-from minio import S3Error, Minio
-from urllib3 import BaseHTTPResponse
+from fastavro import parse_schema
 
-from src.clients import MinioClient
-from src.configurations import StorageConfiguration
+from src.avro import AvroColumnarWriter, MappedAvroReader, read_avro, read_avro_chunks, write_avro
+from src.cache import SchemaCache, ValidationCache
+from src.configurations import ExecutionConfiguration, StorageConfiguration
 
 
 class StorageStrategy:
+    # Parsed schemas are shared by all strategies and pipelines of the process and revalidated by their version. On
+    # disk they are stored next to the pipeline results, so both are evicted together within one CACHE_MAX_SIZE.
+    schema_cache: SchemaCache = SchemaCache(
+        max_entries=ExecutionConfiguration.SCHEMA_CACHE_SIZE,
+        disk_cache=ValidationCache(directory=ExecutionConfiguration.CACHE_DIRECTORY_PATH,
+                                   max_size=ExecutionConfiguration.CACHE_MAX_SIZE)
+        if ExecutionConfiguration.CACHE_DIRECTORY_PATH is not None else None,
+    )
 
-    def load_schema(self, schema_file_name: Path):
+    def load_schema(self, schema_file_name: Path) -> dict:
+        return self.schema_cache.get(name=f"{self.__class__.__name__}/{schema_file_name}",
+                                     version=self.schema_version(schema_file_name),
+                                     load=partial(self.read_schema, schema_file_name))
+
+    def read_schema(self, schema_file_name: Path) -> dict:
+        raise NotImplementedError
+
+    def schema_version(self, schema_file_name: Path) -> str | None:
+        raise NotImplementedError
+
+    def read_data(self, input_file_name: Path, schema: dict | None = None) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def read_chunks(self, input_file_name: Path, chunk_size: int, schema: dict | None = None) -> Iterator[pd.DataFrame]:
+        raise NotImplementedError
+
+    def fingerprint(self, input_file_name: Path) -> str | None:
+        raise NotImplementedError
+
+    def open_writer(self, output_file_name: Path, schema: dict) -> 'DatasetWriter':
         raise NotImplementedError
 
-    def read_data(self, input_file_name: Path) -> pd.DataFrame:
+    def output_location(self, output_file_name: Path) -> str:
+        raise NotImplementedError
+
+    def check_output(self, input_file_name: Path, output_file_name: Path):
+        # Raises ValueError when the dataset cannot be stored safely, before any pipeline runs.
         raise NotImplementedError
 
     @classmethod
     def serialize(cls, data: pd.DataFrame, schema: dict) -> BytesIO:
         buffer = BytesIO()
-        writer(buffer, schema, [record for record in data.to_dict('records')])
+        write_avro(buffer, data, schema, codec=StorageConfiguration.OUTPUT_CODEC,
+                   sync_interval=StorageConfiguration.OUTPUT_SYNC_INTERVAL)
         buffer.seek(0)
         return buffer
 
+
+class DatasetWriter:
+    # Finished writers still flushing or uploading in the background, awaited once at the end of the run.
+    _pending: list[Future] = []
+    _lock: threading.Lock = threading.Lock()
+
+    def __init__(self, output_file_name: Path, schema: dict, directory: Path | None, commit: Callable[[Path], None]):
+        self.output_file_name: Path = output_file_name
+        self.file = tempfile.NamedTemporaryFile(dir=directory, prefix=f".{Path(output_file_name).name}.", suffix=".tmp",
+                                                delete=False)
+        self.avro_writer: AvroColumnarWriter = AvroColumnarWriter(self.file, schema,
+                                                                  codec=StorageConfiguration.OUTPUT_CODEC,
+                                                                  sync_interval=StorageConfiguration.OUTPUT_SYNC_INTERVAL)
+        self.commit_file: Callable[[Path], None] = commit
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dataset-writer')
+        self.pending_write: Future | None = None
+
+    def write(self, df: pd.DataFrame):
+        # At most one chunk waits behind the one being encoded, so streamed writes keep memory bounded.
+        if self.pending_write is not None:
+            self.pending_write.result()
+        self.pending_write = self.executor.submit(self.avro_writer.write, df)
+
+    def commit(self):
+        self.close(commit=True)
+
+    def abort(self):
+        self.close(commit=False)
+
+    def close(self, commit: bool):
+        finished: Future = self.executor.submit(self.finish, commit)
+        self.executor.shutdown(wait=False)
+        with self._lock:
+            self._pending.append(finished)
+
+    def finish(self, commit: bool):
+        path: Path = Path(self.file.name)
+        try:
+            if self.pending_write is not None:
+                self.pending_write.result()
+            if commit:
+                self.avro_writer.flush()
+                self.file.close()
+                self.commit_file(path)
+                logging.info("Stored data: %s", self.output_file_name)
+            else:
+                logging.warning("Discarded data: %s", self.output_file_name)
+        finally:
+            self.file.close()
+            path.unlink(missing_ok=True)
+
+    @classmethod
+    def wait_all(cls) -> bool:
+        with cls._lock:
+            pending: list[Future] = list(cls._pending)
+            cls._pending.clear()
+        succeeded: bool = True
+        for finished in pending:
+            try:
+                finished.result()
+            except (OSError, ValueError) as e:
+                logging.error("Failed to store data: %s", e)
+                succeeded = False
+        return succeeded
+
+
 class LocalStorage(StorageStrategy):
+    # Input file digests by path, reused while the file keeps its modification time and size, so a long-running
+    # process does not hash unchanged inputs again.
+    digests: dict[Path, tuple[str, str]] = {}
+    digests_lock: threading.Lock = threading.Lock()
 
-    def load_schema(self, schema_file_name: Path) -> str | list | dict | None:
+    @staticmethod
+    def file_version(path: Path) -> str:
+        stat: os.stat_result = path.stat()
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def read_schema(self, schema_file_name: Path) -> str | list | dict | None:
         path: Path = StorageConfiguration.SCHEMA_DIRECTORY_PATH / schema_file_name
         try:
-            logging.info(f"Reading schema from local storage: {path}")
+            logging.info("Reading schema from local storage: %s", path)
             with open(path, "r", encoding="utf-8") as f:
                 raw: dict = json.load(f)
                 return parse_schema(raw)
         except OSError as e:
-            logging.error(f"Failed to read schema from local storage: {path} {e}")
+            logging.error("Failed to read schema from local storage: %s %s", path, e)
             return {}
 
-    def read_data(self, input_file_name: Path) -> pd.DataFrame:
+    def schema_version(self, schema_file_name: Path) -> str | None:
+        path: Path = StorageConfiguration.SCHEMA_DIRECTORY_PATH / schema_file_name
+        try:
+            return self.file_version(path)
+        except OSError:
+            return None
+
+    def read_data(self, input_file_name: Path, schema: dict | None = None) -> pd.DataFrame:
         path: Path = StorageConfiguration.INPUT_DATA_DIRECTORY_PATH / input_file_name
         try:
-            logging.info(f"Reading data from local storage {path}")
+            logging.info("Reading data from local storage %s", path)
+            if ExecutionConfiguration.MMAP_INPUT:
+                return MappedAvroReader(path, schema=schema, workers=ExecutionConfiguration.DECODING_WORKERS).read()
             with open(path, "rb") as f:
-                records: list[dict[str, Any]] = list(reader(f))
-            return pd.DataFrame(records)
+                return read_avro(f, schema=schema)
         except FileNotFoundError as e:
-            logging.error(f"File not found: {path}, {e}")
+            logging.error("File not found: %s, %s", path, e)
             return pd.DataFrame()
         except OSError as e:
-            logging.error(f"Failed to read data from local storage {path}: {e}")
+            logging.error("Failed to read data from local storage %s: %s", path, e)
             return pd.DataFrame()
 
-class MinioStorage(StorageStrategy):
-
-    def load_schema(self, schema_file_name: Path) -> dict:
-        object_name: str = "/".join([StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, str(schema_file_name)])
+    def read_chunks(self, input_file_name: Path, chunk_size: int, schema: dict | None = None) -> Iterator[pd.DataFrame]:
+        path: Path = StorageConfiguration.INPUT_DATA_DIRECTORY_PATH / input_file_name
         try:
-            logging.info(
-                f"Reading schema from MinIO bucket: {StorageConfiguration.MINIO_SCHEMA_BUCKET_NAME}/{object_name}")
-            minio: Minio = MinioClient.connect()
-            response: BaseHTTPResponse = minio.get_object(
-                bucket_name=StorageConfiguration.MINIO_SCHEMA_BUCKET_NAME,
-                object_name=object_name,
-            )
-            data: bytes = response.read()
-            buffer: BytesIO = BytesIO(data)
-            return parse_schema(json.load(buffer))
-        except S3Error as e:
-            logging.error(
-                f"Failed to read schema from MinIO bucket {StorageConfiguration.MINIO_SCHEMA_BUCKET_NAME}/{object_name}: {e}")
-            return {}
+            logging.info("Streaming data from local storage %s in chunks of %s rows", path, chunk_size)
+            if ExecutionConfiguration.MMAP_INPUT:
+                yield from MappedAvroReader(path, schema=schema).read_chunks(chunk_size)
+                return
+            with open(path, "rb") as f:
+                yield from read_avro_chunks(f, chunk_size, schema=schema)
+        except FileNotFoundError as e:
+            logging.error("File not found: %s, %s", path, e)
+            yield pd.DataFrame()
+        except OSError as e:
+            logging.error("Failed to read data from local storage %s: %s", path, e)
+            yield pd.DataFrame()
+
+    @staticmethod
+    def output_path(output_file_name: Path) -> Path:
+        if StorageConfiguration.OUTPUT_DATA_DIRECTORY_PATH is None:
+            raise ValueError("OUTPUT_DATA_DIRECTORY_PATH must be set to store the validated datasets.")
+        return StorageConfiguration.OUTPUT_DATA_DIRECTORY_PATH / output_file_name
+
+    def check_output(self, input_file_name: Path, output_file_name: Path):
+        path: Path = self.output_path(output_file_name)
+        if path.resolve() == (StorageConfiguration.INPUT_DATA_DIRECTORY_PATH / input_file_name).resolve():
+            raise ValueError(f"Output data {path} would overwrite the input data, set OUTPUT_DATA_DIRECTORY_PATH or the "
+                             f"output file name to another location.")
+
+    def open_writer(self, output_file_name: Path, schema: dict) -> DatasetWriter:
+        path: Path = self.output_path(output_file_name)
+        logging.info("Writing data to local storage %s", path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return DatasetWriter(output_file_name, schema, directory=path.parent, commit=partial(self.move, destination=path))
+
+    def output_location(self, output_file_name: Path) -> str:
+        return str(self.output_path(output_file_name).resolve())
 
-    def read_data(self, input_file_name: Path) -> pd.DataFrame:
+    @staticmethod
+    def move(path: Path, destination: Path):
+        # Temporary files are private to the owner, the stored dataset gets the usual permissions.
+        os.chmod(path, 0o644)
+        os.replace(path, destination)
+
+    def fingerprint(self, input_file_name: Path) -> str | None:
+        path: Path = StorageConfiguration.INPUT_DATA_DIRECTORY_PATH / input_file_name
         try:
-            logging.info(f"Reading data from MinIO bucket: {StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME}/{input_file_name}")
-            input_file_name: str = str(input_file_name)
-            minio: Minio = MinioClient().connect()
-            data: bytes = minio.get_object(StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME, input_file_name).read()
-            buffer: BytesIO = BytesIO(data)
-            return pd.DataFrame(list(reader(buffer)))
-        except S3Error as e:
-            logging.error(
-                f"Failed to read data from MinIO bucket {StorageConfiguration.MINIO_INPUT_DATA_BUCKET_NAME}: {e}")
-            return pd.DataFrame()
+            version: str = self.file_version(path)
+            with self.digests_lock:
+                entry: tuple[str, str] | None = self.digests.get(path)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+            with open(path, "rb") as f:
+                digest: str = hashlib.file_digest(f, "sha256").hexdigest()
+            # A file replaced while it was hashed gets a new version, so the stale digest is never looked up.
+            with self.digests_lock:
+                self.digests[path] = (version, digest)
+            return digest
+        except OSError as e:
+            logging.error("Failed to fingerprint data in local storage %s: %s", path, e)
+            return None
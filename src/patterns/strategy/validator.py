@@ -1,21 +1,47 @@
 import re
+from functools import lru_cache
 from typing import Hashable
 
+import numpy as np
 import pandas as pd
 import validators
 
+from src.cache import fingerprint
+from src.configurations import ExecutionConfiguration
+from src.graph import PrerequisiteGraph
+from src.key_set import SpillingKeySet, encode_keys, hash_keys
+
 
 class ValidatorStrategy:
+    # Whether row partitions can be validated independently of each other, e.g. in separate worker processes.
+    partitionable: bool = True
+
     def __init__(self, column: str):
         self.column = column
 
+    def invalid_mask(self, df: pd.DataFrame) -> pd.Series:
+        raise NotImplementedError("Subclasses must implement the invalid_mask method.")
+
+    def reset(self):
+        pass
+
+    def sample(self, df: pd.DataFrame, invalid_mask: pd.Series, sample_size: int) -> list[dict]:
+        positions: np.ndarray = np.flatnonzero(invalid_mask.to_numpy(dtype=bool))[:sample_size]
+        return df.iloc[positions].to_dict('records')
+
+    def fingerprint(self) -> str:
+        return fingerprint(self.__class__.__name__, *[item for name, value in sorted(vars(self).items())
+                                                      for item in (name, value)])
+
     def validate(self, df: pd.DataFrame) -> pd.DataFrame:
-        raise NotImplementedError("Subclasses must implement the validate method.")
+        return self.check(df=df, invalid_mask=self.invalid_mask(df))
 
     def check(self, df: pd.DataFrame, invalid_mask: pd.Series) -> pd.DataFrame:
         if invalid_mask.any():
-            invalid_records = df[invalid_mask]
-            raise ValueError(f"{self.__class__.__name__} validation failed for records: {invalid_records.values.tolist()}")
+            invalid_positions: np.ndarray = np.flatnonzero(invalid_mask.to_numpy(dtype=bool))
+            invalid_records = df.iloc[invalid_positions[:ExecutionConfiguration.VALIDATION_SAMPLE_SIZE]]
+            raise ValueError(f"{self.__class__.__name__} validation failed for {len(invalid_positions)} records, "
+                             f"first {len(invalid_records)}: {invalid_records.values.tolist()}")
         return df
 
 class RegexValidatorStrategy(ValidatorStrategy):
@@ -23,37 +49,91 @@ class RegexValidatorStrategy(ValidatorStrategy):
         super().__init__(column)
         self.pattern = pattern
 
-    def validate(self, df: pd.DataFrame) -> pd.DataFrame:
-        invalid_mask = ~df[self.column].str.match(self.pattern, na=False)
-        return self.check(df=df, invalid_mask=invalid_mask)
+    def invalid_mask(self, df: pd.DataFrame) -> pd.Series:
+        return ~df[self.column].str.match(self.pattern, na=False)
 
 
 class UrlValidatorStrategy(ValidatorStrategy):
+    # A value can only pass validators.url when it has a scheme followed by "://" and contains no whitespace.
+    # Leading C0 control characters are allowed because urlsplit strips them before parsing the scheme.
+    URL_STRUCTURE_REGEX: re.Pattern[str] = re.compile(r"[\x00-\x08\x0e-\x1b]*[A-Za-z][A-Za-z0-9+.\-]*://\S+")
+    URL_CACHE_SIZE: int = 65536
 
-    def validate(self, df: pd.DataFrame) -> pd.DataFrame:
-        def is_valid_url(url: str) -> bool:
-            return validators.url(url) if pd.notnull(url) else False
-        invalid_mask = ~df[self.column].apply(is_valid_url)
-        return self.check(df=df, invalid_mask=invalid_mask)
+    def __init__(self, column: str, fast_path: bool = True):
+        super().__init__(column)
+        self.fast_path = fast_path
+
+    @staticmethod
+    @lru_cache(maxsize=URL_CACHE_SIZE)
+    def is_valid_url(url: str) -> bool:
+        return bool(validators.url(url))
+
+    def invalid_mask(self, df: pd.DataFrame) -> pd.Series:
+        column: pd.Series = df[self.column]
+        if not self.fast_path:
+            return ~column.apply(lambda url: bool(validators.url(url)) if pd.notnull(url) else False)
+        try:
+            # Updated in place below, so it must not share memory with the match result.
+            valid_mask: np.ndarray = column.str.fullmatch(self.URL_STRUCTURE_REGEX, na=False).to_numpy(dtype=bool,
+                                                                                                     copy=True)
+        except AttributeError:
+            valid_mask: np.ndarray = np.zeros(len(column), dtype=bool)
+        if valid_mask.any():
+            # Memoized by the exact string through the cache of is_valid_url. pd.factorize compares object strings only
+            # up to the first NUL, so values differing after one would share the verdict of whichever came first.
+            urls: np.ndarray = column.to_numpy(dtype=object)[valid_mask]
+            valid_mask[valid_mask] = np.fromiter(map(self.is_valid_url, urls), dtype=bool, count=len(urls))
+        return pd.Series(~valid_mask, index=column.index)
 
 
 class UUIDValidatorStrategy(ValidatorStrategy):
-
-    def validate(self, df: pd.DataFrame) -> pd.DataFrame:
+    UUID_LENGTH: int = 36
+    UUID_DASH_POSITIONS: list[int] = [8, 13, 18, 23]
+    BLOCK_SIZE: int = 65536
+
+    # Character classes of the canonical 8-4-4-4-12 form: 0 = other, 1 = hex digit, 2 = dash.
+    CHARACTER_CLASSES: np.ndarray = np.zeros(129, dtype=np.uint8)
+    CHARACTER_CLASSES[np.frombuffer(b"0123456789abcdefABCDEF", dtype=np.uint8)] = 1
+    CHARACTER_CLASSES[ord("-")] = 2
+    CANONICAL_LAYOUT: np.ndarray = np.ones(UUID_LENGTH, dtype=np.uint8)
+    CANONICAL_LAYOUT[UUID_DASH_POSITIONS] = 2
+
+    @classmethod
+    def canonical_mask(cls, values: np.ndarray) -> np.ndarray:
+        mask: np.ndarray = np.empty(len(values), dtype=bool)
+        for start in range(0, len(values), cls.BLOCK_SIZE):
+            block: np.ndarray = values[start:start + cls.BLOCK_SIZE]
+            # Fixed-width unicode truncates longer values and pads shorter ones with NUL code points,
+            # so the exact length is checked separately for the values whose layout matched.
+            code_points: np.ndarray = block.astype(f"U{cls.UUID_LENGTH}").view(np.uint32).reshape(-1, cls.UUID_LENGTH)
+            block_mask: np.ndarray = (cls.CHARACTER_CLASSES[np.minimum(code_points, 128)] == cls.CANONICAL_LAYOUT).all(axis=1)
+            block_mask[block_mask] = np.fromiter(map(len, map(str, block[block_mask])), dtype=np.int64) == cls.UUID_LENGTH
+            mask[start:start + cls.BLOCK_SIZE] = block_mask
+        return mask
+
+    def invalid_mask(self, df: pd.DataFrame) -> pd.Series:
         def is_valid_uuid(uuid: str) -> bool:
-            return validators.uuid(uuid) if pd.notnull(uuid) else False
-        invalid_mask = ~df[self.column].apply(is_valid_uuid)
-        return self.check(df=df, invalid_mask=invalid_mask)
+            return bool(validators.uuid(uuid)) if pd.notnull(uuid) else False
+        column: pd.Series = df[self.column]
+        values: np.ndarray = column.to_numpy(dtype=object)
+        valid_mask: np.ndarray = self.canonical_mask(values)
+        undecided_mask: np.ndarray = ~valid_mask & column.notnull().to_numpy()
+        if undecided_mask.any():
+            valid_mask[undecided_mask] = [is_valid_uuid(uuid) for uuid in values[undecided_mask]]
+        return pd.Series(~valid_mask, index=column.index)
 
 
 class ChoiceValidatorStrategy(ValidatorStrategy):
-    def __init__(self, column: str, values: set[Hashable]):
+    def __init__(self, column: str, values: set[Hashable] | pd.Index):
         super().__init__(column)
         self.values = values
 
-    def validate(self, df: pd.DataFrame) -> pd.DataFrame:
-        invalid_mask = ~df[self.column].isin(self.values)
-        return self.check(df=df, invalid_mask=invalid_mask)
+    def invalid_mask(self, df: pd.DataFrame) -> pd.Series:
+        column: pd.Series = df[self.column]
+        if isinstance(self.values, pd.Index):
+            # Probes the hash table the index already holds instead of hashing all allowed values on every call.
+            return pd.Series(self.values.get_indexer(column) < 0, index=column.index)
+        return ~column.isin(self.values)
 
 class RangeValidatorStrategy(ValidatorStrategy):
     def __init__(self, column: str, min: int, max: int):
@@ -61,6 +141,85 @@ class RangeValidatorStrategy(ValidatorStrategy):
         self.min = min
         self.max = max
 
-    def validate(self, df: pd.DataFrame) -> pd.DataFrame:
-        invalid_mask = ~df[self.column].between(self.min, self.max, inclusive='both')
-        return self.check(df=df, invalid_mask=invalid_mask)
+    def invalid_mask(self, df: pd.DataFrame) -> pd.Series:
+        return ~df[self.column].between(self.min, self.max, inclusive='both')
+
+
+class UniqueValidatorStrategy(ValidatorStrategy):
+    partitionable: bool = False
+
+    def __init__(self, column: str | list[str], memory_limit: int | None = None):
+        self.columns: list[str] = [column] if isinstance(column, str) else list(column)
+        super().__init__(", ".join(self.columns))
+        # Keys of the earlier chunks of the run, spilled to disk beyond the memory limit.
+        self.seen_keys: SpillingKeySet = SpillingKeySet(
+            memory_limit=memory_limit if memory_limit is not None else ExecutionConfiguration.UNIQUE_MEMORY_LIMIT)
+        # Sampled duplicate groups by key, the same dicts the failure report holds, so they grow with later chunks.
+        self.groups: dict[bytes, dict] = {}
+
+    def fingerprint(self) -> str:
+        return fingerprint(self.__class__.__name__, *self.columns)
+
+    def reset(self):
+        self.seen_keys.clear()
+        self.groups = {}
+
+    def invalid_mask(self, df: pd.DataFrame) -> pd.Series:
+        keys: np.ndarray = encode_keys(df[self.columns])
+        hashes: np.ndarray = hash_keys(keys)
+        duplicated: np.ndarray = pd.Series(keys).duplicated().to_numpy() | self.seen_keys.contains(hashes, keys)
+        self.seen_keys.add(hashes[~duplicated], keys[~duplicated])
+        return pd.Series(duplicated, index=df.index)
+
+    def sample(self, df: pd.DataFrame, invalid_mask: pd.Series, sample_size: int) -> list[dict]:
+        # Every flagged row repeats the first row of its key, which is not flagged, so a group has one row more than its
+        # flagged rows across all chunks.
+        flagged: pd.DataFrame = df[self.columns].iloc[np.flatnonzero(invalid_mask.to_numpy(dtype=bool))]
+        keys: pd.Series = pd.Series(encode_keys(flagged))
+        counts: pd.Series = keys.value_counts()
+        first: np.ndarray = ~keys.duplicated().to_numpy()
+        new_groups: list[dict] = []
+        for key, record in zip(keys[first].tolist(), flagged[first].to_dict('records')):
+            group: dict | None = self.groups.get(key)
+            if group is not None:
+                group['group_size'] += int(counts[key])
+            elif len(self.groups) < sample_size:
+                group = {**record, 'group_size': int(counts[key]) + 1}
+                self.groups[key] = group
+                new_groups.append(group)
+        return new_groups
+
+    def check(self, df: pd.DataFrame, invalid_mask: pd.Series) -> pd.DataFrame:
+        if invalid_mask.any():
+            groups: list[dict] = self.sample(df, invalid_mask, ExecutionConfiguration.VALIDATION_SAMPLE_SIZE)
+            raise ValueError(f"{self.__class__.__name__} validation failed for {int(invalid_mask.sum())} duplicate "
+                             f"records of {self.column}, first {len(groups)} keys: {groups}")
+        return df
+
+
+class PrerequisiteCycleValidatorStrategy(ValidatorStrategy):
+    partitionable: bool = False
+
+    def __init__(self, column: str, graph: PrerequisiteGraph):
+        super().__init__(column)
+        self.graph = graph
+
+    def invalid_mask(self, df: pd.DataFrame) -> pd.Series:
+        return pd.Series(self.graph.is_cyclic(df[self.column]), index=df.index)
+
+
+class SatisfiableRequisiteValidatorStrategy(ValidatorStrategy):
+    partitionable: bool = False
+
+    def __init__(self, column: str, graph: PrerequisiteGraph, minimum_column: str | None = None):
+        super().__init__(column)
+        self.graph = graph
+        self.minimum_column = minimum_column
+
+    def invalid_mask(self, df: pd.DataFrame) -> pd.Series:
+        # Without a minimum column a requisite needs at least one satisfying course, otherwise it needs as many distinct
+        # satisfying courses as its minimum.
+        satisfying_courses: np.ndarray = self.graph.satisfying_courses(df[self.column])
+        required: np.ndarray = df[self.minimum_column].to_numpy(dtype=np.int64) if self.minimum_column is not None \
+            else np.ones(len(df), dtype=np.int64)
+        return pd.Series(satisfying_courses < required, index=df.index)
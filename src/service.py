@@ -0,0 +1,184 @@
+import argparse
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+
+from src.cache import IndexFingerprintRegistry, MemoryCache
+from src.configurations import ServiceConfiguration
+from src.key_index import GroupCodeRegistry, KeyIndexRegistry
+from src.main import run_dag, validator_dag
+from src.service_client import encode
+from src.patterns.builder.dag import PipelineDAG
+from src.patterns.builder.pipeline import Pipeline
+from src.patterns.strategy.storage import StorageStrategy
+from src.validator.models.metrics import max_rss
+from src.validator.models.report import ValidationReport
+
+
+class ValidationRequestHandler(socketserver.StreamRequestHandler):
+    # One JSON request line per connection, answered with one JSON response line. Connections that send nothing are
+    # dropped, so they cannot hold up the shutdown.
+    timeout: float = 60.0
+
+    def handle(self):
+        try:
+            request: dict = json.loads(self.rfile.readline())
+            response: dict = self.server.service.handle(request)
+        except socket.timeout:
+            return
+        except (ValueError, TypeError, AttributeError) as e:
+            response = {'status': 'error', 'error': f"Invalid request: {e}"}
+        self.wfile.write(encode(response))
+
+
+class ValidationServer(socketserver.ThreadingUnixStreamServer):
+    # Closing the server waits for the requests in progress, so a running job finishes and is answered on shutdown.
+    daemon_threads: bool = False
+    block_on_close: bool = True
+
+    def __init__(self, socket_path: Path, service: 'ValidationService'):
+        self.service: ValidationService = service
+        super().__init__(str(socket_path), ValidationRequestHandler)
+
+    def server_bind(self):
+        # Jobs read and write the configured datasets, so only the owner of the service may submit them. The socket is
+        # created with mode 0600 by binding under a restrictive umask, instead of being opened up until a later chmod.
+        umask: int = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+
+class ValidationService:
+    def __init__(self, socket_path: Path, cache_size: int):
+        self.socket_path: Path = socket_path
+        # Pipeline results of unchanged inputs are reused between jobs, so the parent frames and the key indexes built
+        # on them stay resident. Parsed schemas are kept by the storage strategies of the process.
+        self.result_cache: MemoryCache = MemoryCache(max_entries=cache_size)
+        # Configuration is process wide, so jobs run one at a time while status requests are still answered.
+        self.job_lock: threading.Lock = threading.Lock()
+        self.jobs: int = 0
+        self.started: float = time.time()
+        self.server: ValidationServer | None = None
+
+    def serve(self, warm: bool = False):
+        if self.socket_path.exists():
+            if self.is_listening(self.socket_path):
+                raise ValueError(f"Validation service is already listening on {self.socket_path}")
+            self.socket_path.unlink()
+        Pipeline.result_cache = self.result_cache
+        self.server = ValidationServer(self.socket_path, self)
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signal_number, lambda *_: self.stop())
+        try:
+            if warm:
+                self.validate(datasets=None)
+            logging.info("Validation service listening on %s", self.socket_path)
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            Pipeline.result_cache = None
+            logging.info("Validation service stopped after %s jobs.", self.jobs)
+
+    def stop(self):
+        # serve_forever waits for shutdown to return, so shutdown is never called from its own thread.
+        if self.server is not None:
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+    def handle(self, request: dict) -> dict:
+        command: str = request.get('command', 'validate')
+        if command == 'validate':
+            return self.validate(datasets=request.get('datasets'))
+        if command == 'status':
+            return self.status()
+        if command == 'clear':
+            return self.clear()
+        if command == 'shutdown':
+            self.stop()
+            return {'status': 'ok'}
+        raise ValueError(f"Unknown command: {command}")
+
+    def validate(self, datasets: list[str] | None) -> dict:
+        with self.job_lock:
+            start: float = time.perf_counter()
+            dag: PipelineDAG = validator_dag(datasets).build()
+            logging.info("Validation job %s started: %s", self.jobs + 1, list(dag.nodes))
+            error: str | None = None
+            stored: bool = False
+            try:
+                stored = run_dag(dag)
+            except Exception as e:
+                logging.error("Validation job %s failed: %s", self.jobs + 1, e)
+                error = f"{e.__class__.__name__}: {e}"
+            self.jobs += 1
+            elapsed: float = time.perf_counter() - start
+            reports: dict[str, ValidationReport] = dag.validation_reports()
+            valid: bool = error is None and stored and all(report.is_valid for report in reports.values())
+            logging.info("Validation job %s finished in %.3f seconds, valid: %s", self.jobs, elapsed, valid)
+            return {
+                'status': 'ok' if error is None else 'error',
+                'error': error,
+                'valid': valid,
+                'stored': stored,
+                'wall_time': elapsed,
+                'datasets': {name: {**report.to_dict(), 'cached': dag.nodes[name].metrics_report['cached'],
+                                    'wall_time': dag.nodes[name].metrics_report['wall_time']}
+                             for name, report in reports.items()},
+            }
+
+    def status(self) -> dict:
+        return {
+            'status': 'ok',
+            'pid': os.getpid(),
+            'uptime': time.time() - self.started,
+            'jobs': self.jobs,
+            'busy': self.job_lock.locked(),
+            'cached_results': len(self.result_cache),
+            'key_indexes': KeyIndexRegistry.size(),
+            'schemas': len(StorageStrategy.schema_cache),
+            'max_rss': max_rss(),
+        }
+
+    def clear(self) -> dict:
+        with self.job_lock:
+            self.result_cache.clear()
+            StorageStrategy.schema_cache.clear()
+            KeyIndexRegistry.clear()
+            GroupCodeRegistry.clear()
+            IndexFingerprintRegistry.clear()
+        return {'status': 'ok'}
+
+    @staticmethod
+    def is_listening(socket_path: Path) -> bool:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            try:
+                connection.connect(str(socket_path))
+                return True
+            except OSError:
+                return False
+
+    def __repr__(self):
+        return (f"ValidationService(socket_path={self.socket_path}, jobs={self.jobs}, "
+                f"cached_results={len(self.result_cache)})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep the validator warm and run validation jobs sent over a socket.")
+    parser.add_argument("--socket", type=Path, default=ServiceConfiguration.SOCKET_PATH)
+    parser.add_argument("--warm", action="store_true",
+                        help="Validate all datasets once before accepting jobs, so the first job is also fast.")
+    arguments = parser.parse_args()
+    ValidationService(socket_path=arguments.socket, cache_size=ServiceConfiguration.RESULT_CACHE_SIZE) \
+        .serve(warm=arguments.warm)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+# The client only needs the socket of the service, so it does not load the dataset configuration or the validators.
+DEFAULT_SOCKET_PATH: Path = Path(os.environ.get("SERVICE_SOCKET_PATH", "validator.sock"))
+
+
+def encode(message: dict) -> bytes:
+    # Validation samples hold numpy scalars, which are sent as the equivalent Python values.
+    return json.dumps(message, default=lambda value: value.item() if hasattr(value, 'item') else str(value)).encode() \
+        + b"\n"
+
+
+def submit(socket_path: Path, request: dict, timeout: float | None = None) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(str(socket_path))
+        connection.sendall(encode(request))
+        with connection.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send a job to the running validation service.")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH)
+    parser.add_argument("--timeout", type=float, default=None)
+    commands = parser.add_subparsers(dest="command", required=True)
+    validate_parser = commands.add_parser("validate", help="Validate datasets and the datasets they depend on.")
+    validate_parser.add_argument("datasets", nargs="*", help="Dataset names, all datasets when none are given.")
+    commands.add_parser("status", help="Show the state of the service.")
+    commands.add_parser("clear", help="Drop the cached results, schemas and key indexes of the service.")
+    commands.add_parser("shutdown", help="Stop the service.")
+    arguments = parser.parse_args()
+
+    request: dict[str, Any] = {'command': arguments.command}
+    if arguments.command == "validate":
+        request['datasets'] = [dataset.upper() for dataset in arguments.datasets]
+    try:
+        response: dict = submit(arguments.socket, request, timeout=arguments.timeout)
+    except OSError as e:
+        print(f"Failed to reach the validation service on {arguments.socket}: {e}", file=sys.stderr)
+        sys.exit(2)
+    print(json.dumps(response, indent=2))
+    if response.get('status') != 'ok' or response.get('valid') is False:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,7 @@ from src.patterns.builder.pipeline import Pipeline
 from src.patterns.builder.stage import PipelineStage
 from src.patterns.builder.step import PipelineStep
 from src.patterns.strategy.validator import UrlValidatorStrategy, RegexValidatorStrategy, UUIDValidatorStrategy, \
-    ChoiceValidatorStrategy
+    ChoiceValidatorStrategy, UniqueValidatorStrategy
 from src.validator.models.enums import StageType
 
 
@@ -36,6 +36,13 @@ def course_validator() -> Pipeline:
                 strategy=UUIDValidatorStrategy(column='course_id'),
             )
         )
+        .add_step(
+            PipelineStep(
+                name='validate-course-id-unique',
+                function=PipelineStep.validate,
+                strategy=UniqueValidatorStrategy(column='course_id'),
+            )
+        )
         .add_step(
             PipelineStep(
                 name='validate-course-code',
@@ -60,4 +67,17 @@ def course_validator() -> Pipeline:
             )
         )
     )
+    .add_stage(
+        PipelineStage(
+            name='store-data',
+            stage_type=StageType.STORE
+        )
+        .add_step(
+            PipelineStep(
+                name='store-course-data',
+                function=PipelineStep.write_data,
+                configuration=DatasetConfiguration.COURSES,
+            )
+        )
+    )
     )
@@ -2,7 +2,8 @@ from src.configurations import DatasetConfiguration, ApplicationConfiguration
 from src.patterns.builder.pipeline import Pipeline
 from src.patterns.builder.stage import PipelineStage
 from src.patterns.builder.step import PipelineStep
-from src.patterns.strategy.validator import ChoiceValidatorStrategy, RangeValidatorStrategy, UUIDValidatorStrategy
+from src.patterns.strategy.validator import ChoiceValidatorStrategy, RangeValidatorStrategy, UUIDValidatorStrategy, \
+    UniqueValidatorStrategy
 from src.validator.models.enums import StageType
 
 
@@ -34,6 +35,13 @@ def curriculum_validator() -> Pipeline:
                     strategy=UUIDValidatorStrategy(column='curriculum_id')
                 )
             )
+            .add_step(
+                PipelineStep(
+                    name='validate-curriculum-id-unique',
+                    function=PipelineStep.validate,
+                    strategy=UniqueValidatorStrategy(column='curriculum_id')
+                )
+            )
             .add_step(
                 PipelineStep(
                     name='validate-course-type',
@@ -69,4 +77,17 @@ def curriculum_validator() -> Pipeline:
                 )
             )
         )
+        .add_stage(
+            PipelineStage(
+                name='store-data',
+                stage_type=StageType.STORE
+            )
+            .add_step(
+                PipelineStep(
+                    name='store-curricula-data',
+                    function=PipelineStep.write_data,
+                    configuration=DatasetConfiguration.CURRICULA
+                )
+            )
+        )
     )
@@ -1,16 +1,18 @@
 import pandas as pd
 
-from src.configurations import DatasetConfiguration
+from src.configurations import DatasetConfiguration, ExecutionConfiguration
+from src.key_index import KeyIndexRegistry
 from src.patterns.builder.pipeline import Pipeline
 from src.patterns.builder.stage import PipelineStage
 from src.patterns.builder.step import PipelineStep
-from src.patterns.strategy.validator import ChoiceValidatorStrategy, UUIDValidatorStrategy
+from src.patterns.strategy.validator import ChoiceValidatorStrategy, UUIDValidatorStrategy, UniqueValidatorStrategy
 from src.validator.models.enums import StageType
 
 
 def includes_validator(df_curricula: pd.DataFrame, df_courses: pd.DataFrame) -> Pipeline:
     return (Pipeline(
-        name='includes-validator-pipeline'
+        name='includes-validator-pipeline',
+        chunk_size=ExecutionConfiguration.CHUNK_SIZE,
     )
     .add_stage(
         PipelineStage(
@@ -37,12 +39,19 @@ def includes_validator(df_curricula: pd.DataFrame, df_courses: pd.DataFrame) ->
                 strategy=UUIDValidatorStrategy(column='includes_id')
             )
         )
+        .add_step(
+            PipelineStep(
+                name='validate-includes-id-unique',
+                function=PipelineStep.validate,
+                strategy=UniqueValidatorStrategy(column='includes_id')
+            )
+        )
         .add_step(
             PipelineStep(
                 name='validate-course-id',
                 function=PipelineStep.validate,
                 strategy=ChoiceValidatorStrategy(column='course_id',
-                                                  values=set(df_courses['course_id'].values.tolist())),
+                                                  values=KeyIndexRegistry.get(df_courses, 'course_id')),
             )
         )
         .add_step(
@@ -50,7 +59,20 @@ def includes_validator(df_curricula: pd.DataFrame, df_courses: pd.DataFrame) ->
                 name='validate-curriculum-id',
                 function=PipelineStep.validate,
                 strategy=ChoiceValidatorStrategy(column='curriculum_id',
-                                                  values=set(df_curricula['curriculum_id'].values.tolist())),
+                                                  values=KeyIndexRegistry.get(df_curricula, 'curriculum_id')),
+            )
+        )
+    )
+    .add_stage(
+        PipelineStage(
+            name='store-data',
+            stage_type=StageType.STORE
+        )
+        .add_step(
+            PipelineStep(
+                name='store-includes-data',
+                function=PipelineStep.write_data,
+                configuration=DatasetConfiguration.INCLUDES,
             )
         )
     )
@@ -11,6 +11,10 @@ class StageType(UpperStrEnum):
     VALIDATE = auto()
     STORE = auto()
 
+class ValidationMode(UpperStrEnum):
+    FAIL_FAST = auto()
+    COLLECT = auto()
+
 class CourseType(UpperStrEnum):
     MANDATORY = auto()
     ELECTIVE = auto()
@@ -39,4 +43,5 @@ class DatasetType(UpperStrEnum):
     INCLUDES: str = auto()
     PREREQUISITES: str = auto()
     POSTREQUISITES: str = auto()
-    TEACHES: str = auto()
\ No newline at end of file
+    TEACHES: str = auto()
+    PREREQUISITE_GRAPH: str = auto()
\ No newline at end of file
@@ -0,0 +1,76 @@
+import time
+import tracemalloc
+from typing import Any
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def max_rss() -> int | None:
+    # High-water mark of the resident set of the whole process, in bytes (ru_maxrss is in kilobytes on Linux).
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class ExecutionMetrics:
+    def __init__(self, name: str):
+        self.name: str = name
+        self.reset()
+
+    def reset(self):
+        self.calls: int = 0
+        self.wall_time: float = 0.0
+        self.cpu_time: float = 0.0
+        self.rows_in: int = 0
+        self.rows_out: int = 0
+        self.allocated: int | None = None
+        self.max_rss: int | None = None
+
+    def start(self) -> tuple[float, float, int | None]:
+        return (time.perf_counter(), time.thread_time(),
+                tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None)
+
+    def stop(self, started: tuple[float, float, int | None], rows_in: int, rows_out: int):
+        wall_started, cpu_started, allocated_started = started
+        self.calls += 1
+        self.wall_time += time.perf_counter() - wall_started
+        # Thread CPU time, so concurrently running pipelines are not charged for each other. Work done in worker
+        # processes is not included.
+        self.cpu_time += time.thread_time() - cpu_started
+        self.rows_in += rows_in
+        self.rows_out += rows_out
+        if allocated_started is not None and tracemalloc.is_tracing():
+            self.allocated = (self.allocated or 0) + tracemalloc.get_traced_memory()[0] - allocated_started
+        # The peak of the whole process so far, not of this measurement: it includes everything that ran before and
+        # concurrently, so only the largest value of a run is meaningful.
+        self.max_rss = max_rss()
+
+    @property
+    def rows_per_second(self) -> float | None:
+        rows: int = max(self.rows_in, self.rows_out)
+        return rows / self.wall_time if rows and self.wall_time > 0 else None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'rows_in': self.rows_in,
+            'rows_out': self.rows_out,
+            'rows_per_second': self.rows_per_second,
+            'allocated': self.allocated,
+            'max_rss': self.max_rss,
+        }
+
+    def __repr__(self):
+        return (f"ExecutionMetrics(name={self.name}, calls={self.calls}, wall_time={self.wall_time:.3f}, "
+                f"cpu_time={self.cpu_time:.3f}, rows_in={self.rows_in}, rows_out={self.rows_out})")
+
+    def __str__(self):
+        rows_per_second: float | None = self.rows_per_second
+        return (f"{self.name}: {self.wall_time:.3f}s wall, {self.cpu_time:.3f}s cpu, {self.rows_in} -> {self.rows_out} "
+                f"rows" + (f", {rows_per_second:,.0f} rows/s" if rows_per_second is not None else ""))
@@ -0,0 +1,88 @@
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+class ValidationFailure:
+    def __init__(self,
+                 step_name: str,
+                 strategy_name: str,
+                 column: str,
+                 invalid_mask: pd.Series,
+                 sample: list[dict[str, Any]],
+                 ):
+        self.step_name: str = step_name
+        self.strategy_name: str = strategy_name
+        self.column: str = column
+        # Only the invalid row labels are kept, not the mask over all rows of the validated frame or chunk.
+        self.invalid_indices: np.ndarray = invalid_mask.index.to_numpy()[invalid_mask.to_numpy(dtype=bool)]
+        self.sample: list[dict[str, Any]] = sample
+
+    @classmethod
+    def from_mask(cls,
+                  step_name: str,
+                  strategy: Any,
+                  df: pd.DataFrame,
+                  invalid_mask: pd.Series,
+                  sample_size: int,
+                  ) -> 'ValidationFailure':
+        return cls(step_name=step_name,
+                   strategy_name=strategy.__class__.__name__,
+                   column=strategy.column,
+                   invalid_mask=invalid_mask,
+                   sample=strategy.sample(df=df, invalid_mask=invalid_mask, sample_size=sample_size))
+
+    @property
+    def invalid_count(self) -> int:
+        return len(self.invalid_indices)
+
+    def merge(self, other: 'ValidationFailure', sample_size: int) -> 'ValidationFailure':
+        self.invalid_indices = np.concatenate([self.invalid_indices, other.invalid_indices])
+        self.sample = (self.sample + other.sample)[:sample_size]
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'step': self.step_name,
+            'strategy': self.strategy_name,
+            'column': self.column,
+            'invalid_count': self.invalid_count,
+            'invalid_indices': self.invalid_indices.tolist(),
+            'sample': self.sample,
+        }
+
+    def __repr__(self):
+        return (f"ValidationFailure(step={self.step_name}, strategy={self.strategy_name}, column={self.column}, "
+                f"invalid_count={self.invalid_count}, sample={self.sample})")
+
+    def __str__(self):
+        return f"{self.step_name}: {self.invalid_count} invalid records in column {self.column}"
+
+
+class ValidationReport:
+    def __init__(self, name: str, failures: list[ValidationFailure] | None = None):
+        self.name: str = name
+        self.failures: list[ValidationFailure] = failures if failures is not None else []
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.failures
+
+    @property
+    def invalid_count(self) -> int:
+        return sum(failure.invalid_count for failure in self.failures)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'name': self.name,
+            'is_valid': self.is_valid,
+            'invalid_count': self.invalid_count,
+            'failures': [failure.to_dict() for failure in self.failures],
+        }
+
+    def __repr__(self):
+        return f"ValidationReport(name={self.name}, failures={self.failures})"
+
+    def __str__(self):
+        return f"{self.name}: {len(self.failures)} failed steps, {self.invalid_count} invalid records"
@@ -1,16 +1,18 @@
 import pandas as pd
 
-from src.configurations import DatasetConfiguration
+from src.configurations import DatasetConfiguration, ExecutionConfiguration
+from src.key_index import KeyIndexRegistry
 from src.patterns.builder.pipeline import Pipeline
 from src.patterns.builder.stage import PipelineStage
 from src.patterns.builder.step import PipelineStep
-from src.patterns.strategy.validator import ChoiceValidatorStrategy, UUIDValidatorStrategy
+from src.patterns.strategy.validator import ChoiceValidatorStrategy, UUIDValidatorStrategy, UniqueValidatorStrategy
 from src.validator.models.enums import StageType
 
 
 def offers_validator(df_curricula: pd.DataFrame, df_study_programs: pd.DataFrame) -> Pipeline:
     return (Pipeline(
-        name='offers-validator-pipeline'
+        name='offers-validator-pipeline',
+        chunk_size=ExecutionConfiguration.CHUNK_SIZE,
     )
     .add_stage(
         PipelineStage(
@@ -37,12 +39,19 @@ def offers_validator(df_curricula: pd.DataFrame, df_study_programs: pd.DataFrame
                 strategy=UUIDValidatorStrategy(column='offers_id')
             )
         )
+        .add_step(
+            PipelineStep(
+                name='validate-offers-id-unique',
+                function=PipelineStep.validate,
+                strategy=UniqueValidatorStrategy(column='offers_id')
+            )
+        )
         .add_step(
             PipelineStep(
                 name='validate-study-program-id',
                 function=PipelineStep.validate,
                 strategy=ChoiceValidatorStrategy(column='study_program_id',
-                                                  values=set(df_study_programs['study_program_id'].values.tolist())),
+                                                  values=KeyIndexRegistry.get(df_study_programs, 'study_program_id')),
             )
         )
         .add_step(
@@ -50,7 +59,20 @@ def offers_validator(df_curricula: pd.DataFrame, df_study_programs: pd.DataFrame
                 name='validate-curriculum-id',
                 function=PipelineStep.validate,
                 strategy=ChoiceValidatorStrategy(column='curriculum_id',
-                                                  values=set(df_curricula['curriculum_id'].values.tolist())),
+                                                  values=KeyIndexRegistry.get(df_curricula, 'curriculum_id')),
+            )
+        )
+    )
+    .add_stage(
+        PipelineStage(
+            name='store-data',
+            stage_type=StageType.STORE
+        )
+        .add_step(
+            PipelineStep(
+                name='store-offers-data',
+                function=PipelineStep.write_data,
+                configuration=DatasetConfiguration.OFFERS,
             )
         )
     )
@@ -0,0 +1,65 @@
+import pandas as pd
+
+from src.graph import PrerequisiteGraph
+from src.patterns.builder.pipeline import Pipeline
+from src.patterns.builder.stage import PipelineStage
+from src.patterns.builder.step import PipelineStep
+from src.patterns.strategy.filter import NotEqualFilteringStrategy
+from src.patterns.strategy.validator import PrerequisiteCycleValidatorStrategy, SatisfiableRequisiteValidatorStrategy
+from src.validator.models.enums import CoursePrerequisiteType, StageType
+
+
+def prerequisite_graph_validator(df_requisites: pd.DataFrame, df_satisfies: pd.DataFrame,
+                                 df_requires: pd.DataFrame) -> Pipeline:
+    graph: PrerequisiteGraph = PrerequisiteGraph(requisites=df_requisites, satisfies=df_satisfies, requires=df_requires)
+    return (Pipeline(
+        name='prerequisite-graph-validator-pipeline',
+        data=df_requisites,
+    )
+    .add_stage(
+        PipelineStage(
+            name='validate-graph',
+            stage_type=StageType.VALIDATE,
+        )
+        .add_step(
+            PipelineStep(
+                name='validate-requisite-acyclic',
+                function=PipelineStep.validate,
+                strategy=PrerequisiteCycleValidatorStrategy(column='requisite_id', graph=graph)
+            )
+        )
+        .add_step(
+            PipelineStep(
+                name='filter-linked-course-requisites',
+                function=PipelineStep.filter,
+                strategy=(NotEqualFilteringStrategy(column='course_prerequisite_type',
+                                                    value=CoursePrerequisiteType.NONE)
+                          & NotEqualFilteringStrategy(column='course_prerequisite_type',
+                                                      value=CoursePrerequisiteType.TOTAL))
+            )
+        )
+        .add_step(
+            PipelineStep(
+                name='validate-requisite-satisfiable',
+                function=PipelineStep.validate,
+                strategy=SatisfiableRequisiteValidatorStrategy(column='requisite_id', graph=graph)
+            )
+        )
+        .add_step(
+            PipelineStep(
+                name='filter-any-course-requisites',
+                function=PipelineStep.filter,
+                strategy=NotEqualFilteringStrategy(column='course_prerequisite_type',
+                                                   value=CoursePrerequisiteType.ONE)
+            )
+        )
+        .add_step(
+            PipelineStep(
+                name='validate-minimum-required-number-of-courses-satisfiable',
+                function=PipelineStep.validate,
+                strategy=SatisfiableRequisiteValidatorStrategy(column='requisite_id', graph=graph,
+                                                               minimum_column='minimum_required_number_of_courses')
+            )
+        )
+    )
+    )
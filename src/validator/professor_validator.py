@@ -2,13 +2,13 @@ from src.configurations import DatasetConfiguration
 from src.patterns.builder.pipeline import Pipeline
 from src.patterns.builder.stage import PipelineStage
 from src.patterns.builder.step import PipelineStep
-from src.patterns.strategy.validator import UUIDValidatorStrategy
+from src.patterns.strategy.validator import UUIDValidatorStrategy, UniqueValidatorStrategy
 from src.validator.models.enums import StageType
 
 
 def professor_validator() -> Pipeline:
     return (Pipeline(
-        name='course-validator-pipeline'
+        name='professor-validator-pipeline'
     )
     .add_stage(
         PipelineStage(
@@ -35,5 +35,25 @@ def professor_validator() -> Pipeline:
                 strategy=UUIDValidatorStrategy(column='professor_id')
             )
         )
+        .add_step(
+            PipelineStep(
+                name='validate-professor-id-unique',
+                function=PipelineStep.validate,
+                strategy=UniqueValidatorStrategy(column='professor_id')
+            )
+        )
+    )
+    .add_stage(
+        PipelineStage(
+            name='store-data',
+            stage_type=StageType.STORE
+        )
+        .add_step(
+            PipelineStep(
+                name='store-professor-data',
+                function=PipelineStep.write_data,
+                configuration=DatasetConfiguration.PROFESSORS,
+            )
+        )
     )
     )
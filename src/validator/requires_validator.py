@@ -1,16 +1,19 @@
 import pandas as pd
 
-from src.configurations import DatasetConfiguration
+from src.configurations import DatasetConfiguration, ExecutionConfiguration
+from src.key_index import KeyIndexRegistry
 from src.patterns.builder.pipeline import Pipeline
 from src.patterns.builder.stage import PipelineStage
 from src.patterns.builder.step import PipelineStep
-from src.patterns.strategy.validator import ChoiceValidatorStrategy, UUIDValidatorStrategy
+from src.patterns.strategy.validator import ChoiceValidatorStrategy, UUIDValidatorStrategy, UniqueValidatorStrategy
 from src.validator.models.enums import StageType
 
 
 def requires_validator(df_requisites: pd.DataFrame, df_courses: pd.DataFrame) -> Pipeline:
     return (Pipeline(
-        name='requires-validator-pipeline'
+        name='requires-validator-pipeline',
+        chunk_size=ExecutionConfiguration.CHUNK_SIZE,
+        output_columns=['requisite_id', 'course_id'],
     )
     .add_stage(
         PipelineStage(
@@ -37,12 +40,19 @@ def requires_validator(df_requisites: pd.DataFrame, df_courses: pd.DataFrame) ->
                 strategy=UUIDValidatorStrategy(column='requires_id')
             )
         )
+        .add_step(
+            PipelineStep(
+                name='validate-requires-id-unique',
+                function=PipelineStep.validate,
+                strategy=UniqueValidatorStrategy(column='requires_id')
+            )
+        )
         .add_step(
             PipelineStep(
                 name='validate-course-id',
                 function=PipelineStep.validate,
                 strategy=ChoiceValidatorStrategy(column='course_id',
-                                                  values=set(df_courses['course_id'].values.tolist())),
+                                                  values=KeyIndexRegistry.get(df_courses, 'course_id')),
             )
         )
         .add_step(
@@ -50,7 +60,20 @@ def requires_validator(df_requisites: pd.DataFrame, df_courses: pd.DataFrame) ->
                 name='validate-requisite-id',
                 function=PipelineStep.validate,
                 strategy=ChoiceValidatorStrategy(column='requisite_id',
-                                                  values=set(df_requisites['requisite_id'].values.tolist())),
+                                                  values=KeyIndexRegistry.get(df_requisites, 'requisite_id')),
+            )
+        )
+    )
+    .add_stage(
+        PipelineStage(
+            name='store-data',
+            stage_type=StageType.STORE
+        )
+        .add_step(
+            PipelineStep(
+                name='store-requires-data',
+                function=PipelineStep.write_data,
+                configuration=DatasetConfiguration.REQUIRES,
             )
         )
     )
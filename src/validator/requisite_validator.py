@@ -2,7 +2,8 @@ from src.configurations import DatasetConfiguration, ApplicationConfiguration
 from src.patterns.builder.pipeline import Pipeline
 from src.patterns.builder.stage import PipelineStage
 from src.patterns.builder.step import PipelineStep
-from src.patterns.strategy.validator import ChoiceValidatorStrategy, RangeValidatorStrategy, UUIDValidatorStrategy
+from src.patterns.strategy.validator import ChoiceValidatorStrategy, RangeValidatorStrategy, UUIDValidatorStrategy, \
+    UniqueValidatorStrategy
 from src.validator.models.enums import StageType
 
 
@@ -36,6 +37,13 @@ def requisite_validator() -> Pipeline:
                 strategy=UUIDValidatorStrategy(column='requisite_id')
             )
         )
+        .add_step(
+            PipelineStep(
+                name='validate-requisite-id-unique',
+                function=PipelineStep.validate,
+                strategy=UniqueValidatorStrategy(column='requisite_id')
+            )
+        )
         .add_step(
             PipelineStep(
                 name='validate-course-prerequisite-types',
@@ -55,4 +63,17 @@ def requisite_validator() -> Pipeline:
             )
         )
     )
+    .add_stage(
+        PipelineStage(
+            name='store-data',
+            stage_type=StageType.STORE
+        )
+        .add_step(
+            PipelineStep(
+                name='store-requisite-data',
+                function=PipelineStep.write_data,
+                configuration=DatasetConfiguration.REQUISITES,
+            )
+        )
+    )
     )
@@ -3,7 +3,7 @@ from src.patterns.builder.pipeline import Pipeline
 from src.patterns.builder.stage import PipelineStage
 from src.patterns.builder.step import PipelineStep
 from src.patterns.strategy.validator import UrlValidatorStrategy, RegexValidatorStrategy, UUIDValidatorStrategy, \
-    ChoiceValidatorStrategy
+    ChoiceValidatorStrategy, UniqueValidatorStrategy
 from src.validator.models.enums import StageType
 
 
@@ -36,6 +36,13 @@ def study_program_validator():
                 strategy=UUIDValidatorStrategy(column='study_program_id'),
             )
         )
+        .add_step(
+            PipelineStep(
+                name='validate-study-program-id-unique',
+                function=PipelineStep.validate,
+                strategy=UniqueValidatorStrategy(column='study_program_id'),
+            )
+        )
         .add_step(
             PipelineStep(
                 name='validate-study-program-code',
@@ -60,4 +67,17 @@ def study_program_validator():
             )
         )
     )
+    .add_stage(
+        PipelineStage(
+            name='store-data',
+            stage_type=StageType.STORE
+        )
+        .add_step(
+            PipelineStep(
+                name='store-study-program-data',
+                function=PipelineStep.write_data,
+                configuration=DatasetConfiguration.STUDY_PROGRAMS,
+            )
+        )
+    )
     )
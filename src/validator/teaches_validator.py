@@ -1,16 +1,18 @@
 import pandas as pd
 
-from src.configurations import DatasetConfiguration
+from src.configurations import DatasetConfiguration, ExecutionConfiguration
+from src.key_index import KeyIndexRegistry
 from src.patterns.builder.pipeline import Pipeline
 from src.patterns.builder.stage import PipelineStage
 from src.patterns.builder.step import PipelineStep
-from src.patterns.strategy.validator import ChoiceValidatorStrategy, UUIDValidatorStrategy
+from src.patterns.strategy.validator import ChoiceValidatorStrategy, UUIDValidatorStrategy, UniqueValidatorStrategy
 from src.validator.models.enums import StageType
 
 
 def teaches_validator(df_courses: pd.DataFrame, df_professors: pd.DataFrame) -> Pipeline:
     return (Pipeline(
-        name='teaches-validator-pipeline'
+        name='teaches-validator-pipeline',
+        chunk_size=ExecutionConfiguration.CHUNK_SIZE,
     )
     .add_stage(
         PipelineStage(
@@ -37,12 +39,19 @@ def teaches_validator(df_courses: pd.DataFrame, df_professors: pd.DataFrame) ->
                 strategy=UUIDValidatorStrategy(column='teaches_id')
             )
         )
+        .add_step(
+            PipelineStep(
+                name='validate-teaches-id-unique',
+                function=PipelineStep.validate,
+                strategy=UniqueValidatorStrategy(column='teaches_id')
+            )
+        )
         .add_step(
             PipelineStep(
                 name='validate-professor-id',
                 function=PipelineStep.validate,
                 strategy=ChoiceValidatorStrategy(column='professor_id',
-                                                 values=set(df_professors['professor_id'].values.tolist())),
+                                                 values=KeyIndexRegistry.get(df_professors, 'professor_id')),
             )
         )
         .add_step(
@@ -50,7 +59,20 @@ def teaches_validator(df_courses: pd.DataFrame, df_professors: pd.DataFrame) ->
                 name='validate-course-id',
                 function=PipelineStep.validate,
                 strategy=ChoiceValidatorStrategy(column='course_id',
-                                                 values=set(df_courses['course_id'].values.tolist())),
+                                                 values=KeyIndexRegistry.get(df_courses, 'course_id')),
+            )
+        )
+    )
+    .add_stage(
+        PipelineStage(
+            name='store-data',
+            stage_type=StageType.STORE
+        )
+        .add_step(
+            PipelineStep(
+                name='store-teaches-data',
+                function=PipelineStep.write_data,
+                configuration=DatasetConfiguration.TEACHES,
             )
         )
     )
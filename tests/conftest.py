@@ -0,0 +1,85 @@
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_datasets import dataset_environment, generate_frames
+from src.configurations import ENVIRONMENT_VARIABLES, StorageConfiguration
+from src.patterns.builder.pipeline import Pipeline
+from src.validator.course_validator import course_validator
+from src.validator.curriculum_validator import curriculum_validator
+from src.validator.includes_validator import includes_validator
+from src.validator.offers_validator import offers_validator
+from src.validator.prerequisite_graph_validator import prerequisite_graph_validator
+from src.validator.professor_validator import professor_validator
+from src.validator.requires_validator import requires_validator
+from src.validator.requisite_validator import requisite_validator
+from src.validator.satisfies_validator import satisfies_validator
+from src.validator.study_program_validator import study_program_validator
+from src.validator.teaches_validator import teaches_validator
+
+
+@pytest.fixture
+def local_storage(monkeypatch, tmp_path):
+    # Every pipeline step creates its storage strategy and dataset configuration, even when its pipeline only validates
+    # frames in memory. The file names are the same in every test, the directories are the test's own.
+    for name, value in dataset_environment(tmp_path).items():
+        if name.endswith('_FILE_NAME'):
+            monkeypatch.setitem(ENVIRONMENT_VARIABLES, name, value)
+    monkeypatch.setattr(StorageConfiguration, 'FILE_STORAGE_TYPE', 'LOCAL')
+    monkeypatch.setattr(StorageConfiguration, 'INPUT_DATA_DIRECTORY_PATH', tmp_path / 'data')
+    monkeypatch.setattr(StorageConfiguration, 'SCHEMA_DIRECTORY_PATH', tmp_path / 'schemas')
+    monkeypatch.setattr(StorageConfiguration, 'OUTPUT_DATA_DIRECTORY_PATH', tmp_path / 'output')
+    return tmp_path
+
+
+def inject_errors(frames: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    # Invalid values spread over every dataset, so every kind of validator reports failures at known rows.
+    frames = {name: frame.copy() for name, frame in frames.items()}
+    courses: pd.DataFrame = frames['COURSES']
+    courses.loc[3, 'course_id'] = 'not-a-uuid'
+    courses.loc[5, 'course_url'] = 'finki dot mk'
+    courses.loc[[7, 170], 'course_level'] = 9
+    courses.loc[[11, 110], 'course_id'] = courses.loc[10, 'course_id']
+    courses.loc[13, 'course_code'] = None
+    frames['CURRICULA'].loc[[1, 15, 99, 100, 1500], 'course_semester'] = 42
+    frames['STUDY_PROGRAMS'].loc[[2, 17], 'study_program_duration'] = 5
+    frames['PROFESSORS'].loc[[4, 35], 'professor_id'] = frames['PROFESSORS'].loc[0, 'professor_id']
+    frames['REQUISITES'].loc[[6, 150], 'minimum_required_number_of_courses'] = 40
+    teaches: pd.DataFrame = frames['TEACHES']
+    teaches.loc[np.arange(0, min(len(teaches), 2000), 40), 'course_id'] = '00000000-0000-0000-0000-000000000000'
+    frames['OFFERS'].loc[[8, 900], 'study_program_id'] = None
+    frames['INCLUDES'].loc[9, 'includes_id'] = 'x' * 36
+    satisfies: pd.DataFrame = frames['SATISFIES']
+    satisfies.loc[12, 'requisite_id'] = 'unknown-requisite'
+    # The course required by a requisite now also satisfies it, a prerequisite cycle of one course.
+    required_courses: pd.Series = frames['REQUIRES'].set_index('requisite_id')['course_id']
+    satisfies.loc[20, 'prerequisite_course_id'] = required_courses[satisfies.loc[20, 'requisite_id']]
+    return frames
+
+
+@pytest.fixture(scope='session')
+def injected_frames() -> dict[str, pd.DataFrame]:
+    return inject_errors(generate_frames(rows=2000))
+
+
+@pytest.fixture
+def validation_cases(local_storage, injected_frames) -> dict[str, Callable[[], tuple[Pipeline, pd.DataFrame]]]:
+    # A fresh pipeline of every validator with the frame its validation stages run on, since steps and strategies
+    # keep their failures and state.
+    frames: dict[str, pd.DataFrame] = injected_frames
+    return {
+        'courses': lambda: (course_validator(), frames['COURSES']),
+        'curricula': lambda: (curriculum_validator(), frames['CURRICULA']),
+        'professors': lambda: (professor_validator(), frames['PROFESSORS']),
+        'requisites': lambda: (requisite_validator(), frames['REQUISITES']),
+        'study_programs': lambda: (study_program_validator(), frames['STUDY_PROGRAMS']),
+        'offers': lambda: (offers_validator(frames['CURRICULA'], frames['STUDY_PROGRAMS']), frames['OFFERS']),
+        'includes': lambda: (includes_validator(frames['CURRICULA'], frames['COURSES']), frames['INCLUDES']),
+        'requires': lambda: (requires_validator(frames['REQUISITES'], frames['COURSES']), frames['REQUIRES']),
+        'satisfies': lambda: (satisfies_validator(frames['REQUISITES'], frames['COURSES']), frames['SATISFIES']),
+        'teaches': lambda: (teaches_validator(frames['COURSES'], frames['PROFESSORS']), frames['TEACHES']),
+        'prerequisite_graph': lambda: (prerequisite_graph_validator(frames['REQUISITES'], frames['SATISFIES'],
+                                                                    frames['REQUIRES']), frames['REQUISITES']),
+    }
@@ -0,0 +1,39 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from fastavro import parse_schema
+
+from src.avro import AvroColumnarWriter, read_avro, read_avro_chunks
+
+SCHEMA: dict = parse_schema({"type": "record", "name": "Curriculum", "fields": [
+    {"name": "curriculum_id", "type": "string"},
+    {"name": "course_semester", "type": "int"},
+    {"name": "credits", "type": "int"},
+]})
+
+
+def avro_file(df: pd.DataFrame) -> BytesIO:
+    # One block per row, so every row becomes a chunk of its own.
+    buffer: BytesIO = BytesIO()
+    writer: AvroColumnarWriter = AvroColumnarWriter(buffer, SCHEMA)
+    for position in range(len(df)):
+        writer.write(df.iloc[position:position + 1])
+        writer.flush()
+    buffer.seek(0)
+    return buffer
+
+
+def test_integer_dtypes_follow_the_schema_in_every_chunk():
+    df: pd.DataFrame = pd.DataFrame({"curriculum_id": ["a", "b", "c", "d"], "course_semester": [1, 2, 300, 4],
+                                     "credits": [6, 6, 6, 70000]})
+    chunks: list[pd.DataFrame] = list(read_avro_chunks(avro_file(df), chunk_size=1, schema=SCHEMA))
+    assert len(chunks) == 4
+    assert {chunk["course_semester"].dtype for chunk in chunks} == {np.dtype(np.int8)}
+    assert {chunk["credits"].dtype for chunk in chunks} == {np.dtype(np.int32)}
+    assert pd.concat(chunks)["course_semester"].dtype == np.int8
+
+
+def test_out_of_range_values_are_clipped_not_wrapped():
+    df: pd.DataFrame = pd.DataFrame({"curriculum_id": ["a", "b"], "course_semester": [300, -300], "credits": [6, 6]})
+    assert read_avro(avro_file(df), schema=SCHEMA)["course_semester"].tolist() == [127, -128]
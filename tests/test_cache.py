@@ -0,0 +1,41 @@
+import os
+from pathlib import Path
+
+from src.cache import SchemaCache, ValidationCache
+
+
+def test_cache_directory_is_private(tmp_path: Path):
+    cache: ValidationCache = ValidationCache(directory=tmp_path / "cache", max_size=2 ** 20)
+    cache.put("key", {"rows": 1})
+    assert (tmp_path / "cache").stat().st_mode & 0o777 == 0o700
+    assert cache.path("key").stat().st_mode & 0o777 == 0o600
+    assert cache.get("key") == {"rows": 1}
+
+
+def test_entries_others_can_write_are_not_loaded(tmp_path: Path):
+    cache: ValidationCache = ValidationCache(directory=tmp_path / "cache", max_size=2 ** 20)
+    cache.put("key", {"rows": 1})
+    os.chmod(cache.path("key"), 0o666)
+    assert cache.get("key") is None
+    os.chmod(cache.path("key"), 0o600)
+    os.chmod(tmp_path / "cache", 0o777)
+    assert cache.get("key") is None
+
+
+def test_symlinked_entries_are_not_loaded(tmp_path: Path):
+    cache: ValidationCache = ValidationCache(directory=tmp_path / "cache", max_size=2 ** 20)
+    cache.put("key", {"rows": 1})
+    os.rename(cache.path("key"), tmp_path / "entry.pickle")
+    os.symlink(tmp_path / "entry.pickle", cache.path("key"))
+    assert cache.get("key") is None
+
+
+def test_schemas_and_results_share_one_budget(tmp_path: Path):
+    # Room for two of the three entries, so writing the third evicts the schema written first.
+    cache: ValidationCache = ValidationCache(directory=tmp_path, max_size=2 ** 20 + 2 ** 12)
+    schemas: SchemaCache = SchemaCache(max_entries=1, disk_cache=cache)
+    schemas.get("courses.avsc", "v1", lambda: {"fields": ["x" * 2 ** 19]})
+    cache.put("result", "x" * 2 ** 19)
+    cache.put("newer result", "x" * 2 ** 19)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [cache.path("newer result").name,
+                                                                cache.path("result").name]
@@ -0,0 +1,99 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from src.patterns.builder.dag import PipelineDAG, PipelineNode
+from src.patterns.builder.pipeline import Pipeline
+from src.patterns.builder.stage import PipelineStage
+from src.patterns.builder.step import PipelineStep
+from src.patterns.strategy.validator import ChoiceValidatorStrategy
+from src.validator.models.enums import StageType, ValidationMode
+
+
+class Factory:
+    # Builds a pipeline that appends its own row to the frames of its dependencies and records when it was built, i.e.
+    # when its node started. A failing pipeline rejects its own row in FAIL_FAST mode.
+    def __init__(self, name: str, started: list[str], fails: bool = False):
+        self.name: str = name
+        self.started: list[str] = started
+        self.fails: bool = fails
+
+    def __call__(self, *inputs: pd.DataFrame) -> Pipeline:
+        self.started.append(self.name)
+        data: pd.DataFrame = pd.concat([*inputs, pd.DataFrame({'id': [self.name]})], ignore_index=True)
+        step: PipelineStep = PipelineStep(name=f'validate-{self.name}', function=PipelineStep.validate,
+                                          strategy=ChoiceValidatorStrategy(column='id', values=set() if self.fails
+                                                                           else set(data['id'])))
+        step.validation_mode = ValidationMode.FAIL_FAST
+        return (Pipeline(name=self.name, data=data)
+                .add_stage(PipelineStage(name='validate-data', stage_type=StageType.VALIDATE, fused=False, workers=1)
+                           .add_step(step)))
+
+
+def dag(nodes: dict[str, list[str]], started: list[str], failing: set[str] = frozenset(),
+        max_workers: int | None = None) -> PipelineDAG:
+    return PipelineDAG(name='test-dag', max_workers=max_workers, nodes=[
+        PipelineNode(name=name, factory=Factory(name, started, fails=name in failing), dependencies=dependencies)
+        for name, dependencies in nodes.items()]).build()
+
+
+def test_nodes_run_after_their_dependencies(local_storage):
+    nodes: dict[str, list[str]] = {'d': ['b', 'c'], 'b': ['a'], 'c': ['a'], 'a': [], 'e': []}
+    started: list[str] = []
+    results: dict[str, pd.DataFrame] = dag(nodes, started, max_workers=4).run()
+    for name, dependencies in nodes.items():
+        assert all(started.index(dependency) < started.index(name) for dependency in dependencies)
+    order: list[str] = dag(nodes, []).topological_order()
+    for name, dependencies in nodes.items():
+        assert all(order.index(dependency) < order.index(name) for dependency in dependencies)
+    assert sorted(results['d']['id']) == ['a', 'a', 'b', 'c', 'd']
+
+
+def test_cycles_and_unknown_dependencies_are_rejected():
+    with pytest.raises(ValueError, match='cycle'):
+        dag({'a': ['b'], 'b': ['a']}, [])
+    with pytest.raises(ValueError, match='unknown'):
+        dag({'a': ['missing']}, [])
+
+
+def test_subset_includes_transitive_dependencies(local_storage):
+    nodes: dict[str, list[str]] = {'a': [], 'b': ['a'], 'c': ['b'], 'd': ['a'], 'e': []}
+    full: PipelineDAG = dag(nodes, [])
+    assert set(full.subset(['c']).nodes) == {'a', 'b', 'c'}
+    assert set(full.subset(['c', 'd']).nodes) == {'a', 'b', 'c', 'd'}
+    assert set(full.subset(['e']).nodes) == {'e'}
+    started: list[str] = []
+    dag(nodes, started).subset(['c']).build().run()
+    assert sorted(started) == ['a', 'b', 'c']
+    with pytest.raises(ValueError, match='Unknown'):
+        full.subset(['missing'])
+
+
+def test_fail_fast_failure_cancels_pending_nodes(local_storage):
+    # With one worker, 'independent' is ready but still pending while 'bad' runs, and 'after' waits for 'bad'.
+    started: list[str] = []
+    with pytest.raises(ValueError, match='ChoiceValidatorStrategy validation failed'):
+        dag({'bad': [], 'independent': [], 'after': ['bad']}, started, failing={'bad'}, max_workers=1).run()
+    assert started == ['bad']
+
+
+def test_fail_fast_failure_waits_for_running_nodes(local_storage):
+    # A node already running when another fails is finished, but nothing new is started.
+    started: list[str] = []
+    release: threading.Event = threading.Event()
+
+    class Blocking(Factory):
+        def __call__(self, *inputs: pd.DataFrame) -> Pipeline:
+            release.wait(timeout=10)
+            return super().__call__(*inputs)
+
+    failing: Factory = Factory('bad', started, fails=True)
+    nodes: list[PipelineNode] = [PipelineNode(name='slow', factory=Blocking('slow', started)),
+                                 PipelineNode(name='bad', factory=failing),
+                                 PipelineNode(name='after', factory=Factory('after', started), dependencies=['slow'])]
+    timer: threading.Timer = threading.Timer(0.2, release.set)
+    timer.start()
+    with pytest.raises(ValueError):
+        PipelineDAG(name='test-dag', nodes=nodes, max_workers=2).build().run()
+    assert sorted(started) == ['bad', 'slow']
@@ -0,0 +1,110 @@
+from itertools import product
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.key_index import GroupCodeRegistry, GroupCodes
+from src.patterns.strategy.filter import FilteringStrategy, GroupExistsFilteringStrategy, \
+    GroupHasAtLeastNMembersFilteringStrategy, NotEqualFilteringStrategy, NotNullFilteringStrategy
+
+LEAVES: dict[str, FilteringStrategy] = {
+    'code_set': NotNullFilteringStrategy(column='code'),
+    'not_none_type': NotEqualFilteringStrategy(column='type', value='NONE'),
+    'not_total_type': NotEqualFilteringStrategy(column='type', value='TOTAL'),
+    'group_has_code': GroupExistsFilteringStrategy(group_by_columns='group', evaluated_columns='code'),
+    'group_has_minimum': GroupHasAtLeastNMembersFilteringStrategy(group_by_columns='group', evaluated_columns='code',
+                                                                   threshold_columns='minimum'),
+}
+
+
+def frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng: np.random.Generator = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'code': rng.choice(np.array(['a', 'b', None], dtype=object), size=rows),
+        'type': rng.choice(np.array(['NONE', 'ONE', 'ANY', 'TOTAL'], dtype=object), size=rows),
+        'group': rng.choice(np.array(['g1', 'g2', 'g3', None], dtype=object), size=rows),
+        'minimum': rng.integers(0, 4, size=rows),
+    })
+
+
+def expressions() -> list[tuple[FilteringStrategy, callable]]:
+    # Every expression of up to three leaves with its reference, the same leaves evaluated on the whole frame and
+    # combined with plain boolean operators.
+    leaves: list[tuple[FilteringStrategy, callable]] = [(leaf, lambda df, leaf=leaf: leaf.mask(df))
+                                                        for leaf in LEAVES.values()]
+    pairs: list[tuple[FilteringStrategy, callable]] = [
+        pair for (left, left_mask), (right, right_mask) in product(leaves, repeat=2)
+        for pair in [(left & right, lambda df, l=left_mask, r=right_mask: l(df) & r(df)),
+                     (left | right, lambda df, l=left_mask, r=right_mask: l(df) | r(df))]]
+    return pairs + [
+        expression for (left, left_mask), (right, right_mask) in product(pairs, leaves)
+        for expression in [(left & right, lambda df, l=left_mask, r=right_mask: l(df) & r(df)),
+                           (left | right, lambda df, l=left_mask, r=right_mask: l(df) | r(df)),
+                           (right & left, lambda df, l=left_mask, r=right_mask: r(df) & l(df)),
+                           (right | left, lambda df, l=left_mask, r=right_mask: r(df) | l(df))]]
+
+
+@pytest.mark.parametrize('rows', [0, 1, 40])
+def test_combined_masks_match_boolean_operators(rows):
+    df: pd.DataFrame = frame(rows)
+    positions: np.ndarray = np.arange(0, rows, 3)
+    for strategy, reference in expressions():
+        expected: np.ndarray = reference(df)
+        assert expected.dtype == bool and len(expected) == rows
+        np.testing.assert_array_equal(strategy.mask(df), expected)
+        # Restricted to some rows, the others are False.
+        restricted: np.ndarray = np.zeros(rows, dtype=bool)
+        restricted[positions] = expected[positions]
+        np.testing.assert_array_equal(strategy.mask(df, positions), restricted)
+        pd.testing.assert_frame_equal(strategy.filter(df), df[expected])
+
+
+def test_empty_frames_and_empty_rows_keep_nothing():
+    df: pd.DataFrame = frame(10, seed=1)
+    empty_rows: np.ndarray = np.array([], dtype=np.intp)
+    for strategy, _ in expressions():
+        assert not strategy.mask(df, empty_rows).any()
+        assert strategy.filter(frame(0)).empty
+
+
+def group_frame() -> pd.DataFrame:
+    # Groups of several rows, single-row groups and missing keys in either key column.
+    return pd.DataFrame({
+        'group': ['g1', 'g2', 'g1', None, 'g3', 'g2', np.nan, 'g4', 'g1', 'g5', 'g5'],
+        'year': [1, 1, 1, 1, 2, 1, 1, np.nan, 1, 3, 3],
+        'code': ['a', None, 'b', 'c', None, 'd', 'e', 'f', None, None, None],
+        'minimum': [2, np.nan, 3, 1, 1, 1, 0, 1, 1, 0, np.nan],
+    })
+
+
+@pytest.mark.parametrize('columns', [['group'], ['group', 'year']])
+def test_group_codes_match_groupby(columns):
+    df: pd.DataFrame = group_frame()
+    codes: GroupCodes = GroupCodeRegistry.get(df, columns)
+    assert GroupCodeRegistry.get(df, columns) is codes
+    grouped: pd.api.typing.DataFrameGroupBy = df.assign(present=df['code'].notnull()).groupby(
+        columns, sort=False, dropna=True)
+    present: np.ndarray = df['code'].notnull().to_numpy(dtype=bool)
+    expected_counts: np.ndarray = grouped['present'].transform('sum').fillna(0).to_numpy(dtype=np.int64)
+    expected_first: np.ndarray = grouped['minimum'].transform('first').to_numpy(dtype=float)
+    np.testing.assert_array_equal(codes.count(present), expected_counts)
+    np.testing.assert_array_equal(codes.any(present), expected_counts > 0)
+    np.testing.assert_array_equal(codes.first(df['minimum']), expected_first)
+    np.testing.assert_array_equal(codes.grouped, df[columns].notnull().all(axis=1).to_numpy())
+    assert codes.size == grouped.ngroups
+
+
+@pytest.mark.parametrize('columns', ['group', ['group', 'year']])
+def test_group_strategies_match_groupby(columns):
+    df: pd.DataFrame = group_frame()
+    grouped: pd.api.typing.DataFrameGroupBy = df.assign(present=df['code'].notnull()).groupby(
+        columns, sort=False, dropna=True)
+    counts: pd.Series = grouped['present'].transform('sum')
+    # Rows without a group are in no group that could have members, comparisons with NaN are False.
+    np.testing.assert_array_equal(GroupExistsFilteringStrategy(group_by_columns=columns, evaluated_columns='code')
+                                  .mask(df), (counts > 0).to_numpy())
+    np.testing.assert_array_equal(
+        GroupHasAtLeastNMembersFilteringStrategy(group_by_columns=columns, evaluated_columns='code',
+                                                 threshold_columns='minimum').mask(df),
+        (counts.fillna(0) >= grouped['minimum'].transform('first')).to_numpy())
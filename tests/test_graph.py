@@ -0,0 +1,56 @@
+import pandas as pd
+
+from src.graph import PrerequisiteGraph
+
+
+def prerequisite_graph(satisfies: list[tuple[str, str]], requires: list[tuple[str, str]]) -> PrerequisiteGraph:
+    # satisfies: (requisite, course satisfying it), requires: (requisite, course requiring it).
+    requisites: set[str] = {requisite for requisite, _ in satisfies + requires}
+    return PrerequisiteGraph(
+        requisites=pd.DataFrame({'requisite_id': sorted(requisites)}),
+        satisfies=pd.DataFrame(satisfies, columns=['requisite_id', 'prerequisite_course_id']),
+        requires=pd.DataFrame(requires, columns=['requisite_id', 'course_id']),
+    )
+
+
+def cyclic_requisites(graph: PrerequisiteGraph, requisite_ids: list[str]) -> dict[str, bool]:
+    return dict(zip(requisite_ids, graph.is_cyclic(pd.Series(requisite_ids)).tolist()))
+
+
+def test_acyclic_graph_has_no_cyclic_requisites():
+    graph: PrerequisiteGraph = prerequisite_graph(satisfies=[('r1', 'A'), ('r2', 'B')],
+                                                  requires=[('r1', 'B'), ('r2', 'C')])
+    assert cyclic_requisites(graph, ['r1', 'r2']) == {'r1': False, 'r2': False}
+
+
+def test_path_between_two_cycles_is_not_cyclic():
+    # A <-> r1 and C <-> r4 are cycles, A -> r2 -> B -> r3 -> C only connects them.
+    graph: PrerequisiteGraph = prerequisite_graph(
+        satisfies=[('r1', 'A'), ('r2', 'A'), ('r3', 'B'), ('r4', 'C')],
+        requires=[('r1', 'A'), ('r2', 'B'), ('r3', 'C'), ('r4', 'C')],
+    )
+    assert cyclic_requisites(graph, ['r1', 'r2', 'r3', 'r4']) == {'r1': True, 'r2': False, 'r3': False, 'r4': True}
+
+
+def test_cycle_through_several_courses_is_cyclic():
+    # A -> r1 -> B -> r2 -> A, with r3 hanging off the cycle.
+    graph: PrerequisiteGraph = prerequisite_graph(satisfies=[('r1', 'A'), ('r2', 'B'), ('r3', 'A')],
+                                                  requires=[('r1', 'B'), ('r2', 'A'), ('r3', 'C')])
+    assert cyclic_requisites(graph, ['r1', 'r2', 'r3', 'unknown']) == {'r1': True, 'r2': True, 'r3': False,
+                                                                       'unknown': False}
+
+
+def test_ids_differing_after_a_nul_are_separate_nodes():
+    # 'A' <-> r1 is a cycle, 'A\x00x' only satisfies r2 and requires nothing.
+    graph: PrerequisiteGraph = prerequisite_graph(satisfies=[('r1', 'A'), ('r2', 'A\x00x'), ('r2\x00y', 'A')],
+                                                  requires=[('r1', 'A'), ('r2', 'B'), ('r2\x00y', 'C')])
+    assert cyclic_requisites(graph, ['r1', 'r2', 'r2\x00y']) == {'r1': True, 'r2': False, 'r2\x00y': False}
+    assert len(graph.courses) == 4
+
+
+def test_rows_without_a_course_are_left_out():
+    # Without a node of its own, the missing course of r2 must not be wired to another requisite.
+    graph: PrerequisiteGraph = prerequisite_graph(satisfies=[('r1', 'A'), ('r2', None)],
+                                                  requires=[('r1', 'B'), ('r2', None)])
+    assert cyclic_requisites(graph, ['r1', 'r2']) == {'r1': False, 'r2': False}
+    assert len(graph.courses) == 2
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_datasets import SCHEMAS
+from src.avro import AvroColumnarWriter
+from src.configurations import ExecutionConfiguration, StorageConfiguration
+from src.patterns.builder.pipeline import Pipeline
+from src.validator.models.enums import ValidationMode
+
+# The dataset each streamed validator loads.
+DATASETS: dict[str, str] = {'courses': 'COURSES', 'curricula': 'CURRICULA', 'professors': 'PROFESSORS',
+                            'requisites': 'REQUISITES', 'study_programs': 'STUDY_PROGRAMS', 'offers': 'OFFERS',
+                            'includes': 'INCLUDES', 'requires': 'REQUIRES', 'satisfies': 'SATISFIES',
+                            'teaches': 'TEACHES'}
+BLOCK_ROWS: int = 10
+
+
+def write_dataset(directory: Path, dataset: str, df: pd.DataFrame):
+    # Blocks of BLOCK_ROWS rows, so chunks of BLOCK_ROWS rows end at every multiple of it. Strings are nullable, so the
+    # missing values injected into the frames can be stored.
+    schema: dict = {**SCHEMAS[dataset], 'fields': [
+        {**field, 'type': ['null', 'string']} if field['type'] == 'string' else field
+        for field in SCHEMAS[dataset]['fields']]}
+    (directory / 'data').mkdir(exist_ok=True)
+    (directory / 'schemas').mkdir(exist_ok=True)
+    (directory / 'schemas' / f'{dataset.lower()}.avsc').write_text(json.dumps(schema))
+    with open(directory / 'data' / f'{dataset.lower()}.avro', 'wb') as f:
+        writer: AvroColumnarWriter = AvroColumnarWriter(f, schema)
+        for start in range(0, len(df), BLOCK_ROWS):
+            writer.write(df.iloc[start:start + BLOCK_ROWS])
+            writer.flush()
+
+
+def validation_report(pipeline: Pipeline, chunk_size: int | None) -> list[dict]:
+    pipeline.chunk_size = chunk_size
+    pipeline.run()
+    return [failure.to_dict() for failure in pipeline.validation_report().failures]
+
+
+@pytest.mark.parametrize('case', DATASETS)
+def test_streamed_validation_reports_the_same_failures_as_whole_frames(monkeypatch, local_storage, validation_cases,
+                                                                        case):
+    monkeypatch.setattr(ExecutionConfiguration, 'VALIDATION_MODE', ValidationMode.COLLECT)
+    monkeypatch.setattr(ExecutionConfiguration, 'CACHE_DIRECTORY_PATH', None)
+    monkeypatch.setattr(StorageConfiguration, 'STORE_OUTPUT', False)
+    pipeline, data = validation_cases[case]()
+    write_dataset(local_storage, DATASETS[case], data)
+    whole: list[dict] = validation_report(pipeline, chunk_size=None)
+    streamed_pipeline: Pipeline = validation_cases[case]()[0]
+    streamed: list[dict] = validation_report(streamed_pipeline, chunk_size=BLOCK_ROWS)
+    assert streamed_pipeline.stages[0].steps[0].metrics.calls == -(-len(data) // BLOCK_ROWS)
+    assert whole
+    assert streamed == whole
+    # Failures of several chunks keep the row numbers of the whole file.
+    indices: list[int] = [index for failure in streamed for index in failure['invalid_indices']]
+    assert len({index // BLOCK_ROWS for index in indices}) > 1
+    assert all(index < len(data) for index in indices)
@@ -0,0 +1,17 @@
+import os
+import stat
+from pathlib import Path
+
+from src.service import ValidationServer, ValidationService
+
+
+def test_socket_is_only_accessible_by_its_owner(tmp_path: Path):
+    socket_path: Path = tmp_path / "validator.sock"
+    umask: int = os.umask(0o022)
+    try:
+        server: ValidationServer = ValidationServer(socket_path, ValidationService(socket_path, cache_size=1))
+        server.server_close()
+        assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_datasets import generate_frames
+from src.patterns.builder.partition import PartitionedValidator
+from src.patterns.builder.pipeline import Pipeline
+from src.patterns.builder.stage import PipelineStage
+from src.patterns.strategy.validator import ValidatorStrategy
+from src.validator.course_validator import course_validator
+from src.validator.models.enums import StageType, ValidationMode
+
+CASES: list[str] = ['courses', 'curricula', 'professors', 'requisites', 'study_programs', 'offers', 'includes',
+                    'requires', 'satisfies', 'teaches', 'prerequisite_graph']
+
+
+def validation_failures(pipeline: Pipeline, data: pd.DataFrame, fused: bool, workers: int = 1) -> list[dict]:
+    # Runs the validation stages only, collecting every failure instead of stopping at the first one.
+    stages: list[PipelineStage] = [stage for stage in pipeline.stages if stage.stage_type == StageType.VALIDATE]
+    for stage in stages:
+        stage.fused = fused
+        stage.workers = workers
+        for step in stage.steps:
+            step.validation_mode = ValidationMode.COLLECT
+    try:
+        for stage in stages:
+            data = stage.run(data)
+    finally:
+        for stage in stages:
+            stage.close()
+    return [failure.to_dict() for stage in stages for failure in stage.validation_failures]
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_fused_and_sequential_validation_report_the_same_failures(validation_cases, case):
+    sequential: list[dict] = validation_failures(*validation_cases[case](), fused=False)
+    fused: list[dict] = validation_failures(*validation_cases[case](), fused=True)
+    assert sequential
+    assert fused == sequential
+
+
+def test_fused_validation_of_valid_data_reports_no_failures(local_storage):
+    assert not validation_failures(course_validator(), generate_frames(rows=2000)['COURSES'], fused=True)
+
+
+def partitionable_strategies(pipeline: Pipeline) -> list[ValidatorStrategy]:
+    return [step.strategy for stage in pipeline.stages if stage.stage_type == StageType.VALIDATE
+            for step in stage.steps if step.strategy is not None and step.strategy.partitionable]
+
+
+@pytest.mark.parametrize('workers', [2, 3])
+def test_partitioned_masks_match_single_process_masks(validation_cases, workers):
+    for case in CASES:
+        pipeline, data = validation_cases[case]()
+        strategies: list[ValidatorStrategy] = partitionable_strategies(pipeline)
+        if not strategies:
+            continue
+        validator: PartitionedValidator = PartitionedValidator(strategies=strategies, workers=workers)
+        try:
+            masks: list[np.ndarray] = validator.invalid_masks(data)
+        finally:
+            validator.close()
+        expected: list[np.ndarray] = [strategy.invalid_mask(data).to_numpy(dtype=bool) for strategy in strategies]
+        assert len(masks) == len(expected)
+        for mask, expected_mask in zip(masks, expected):
+            np.testing.assert_array_equal(mask, expected_mask)
+
+
+def test_partitions_cover_every_row_once():
+    data: pd.DataFrame = pd.DataFrame({'id': np.arange(10)})
+    validator: PartitionedValidator = PartitionedValidator(strategies=[ValidatorStrategy(column='id')], workers=4)
+    partitions: list[pd.DataFrame] = validator.partitions(data)
+    assert pd.concat(partitions).index.tolist() == data.index.tolist()
+    # More workers than rows leaves no empty partitions.
+    assert [len(partition) for partition in validator.partitions(data.iloc[:2])] == [1, 1]
+
+
+def test_stages_partition_large_frames_and_validate_small_frames_in_place(monkeypatch, validation_cases):
+    # Frames of at least workers * MIN_PARTITION_ROWS rows are partitioned, the smaller ones fall back to the fused
+    # validation in this process. Both must report what sequential validation reports.
+    partitioned_rows: list[int] = []
+    invalid_masks = PartitionedValidator.invalid_masks
+
+    def counted_invalid_masks(validator: PartitionedValidator, data: pd.DataFrame) -> list[np.ndarray]:
+        partitioned_rows.append(len(data))
+        return invalid_masks(validator, data)
+
+    monkeypatch.setattr(PartitionedValidator, 'MIN_PARTITION_ROWS', 500)
+    monkeypatch.setattr(PartitionedValidator, 'invalid_masks', counted_invalid_masks)
+    for case in CASES:
+        sequential: list[dict] = validation_failures(*validation_cases[case](), fused=False)
+        pipeline, data = validation_cases[case]()
+        partitioned_rows.clear()
+        assert validation_failures(pipeline, data, fused=True, workers=2) == sequential
+        partitioned: bool = len(data) >= 2 * PartitionedValidator.MIN_PARTITION_ROWS \
+            and bool(partitionable_strategies(pipeline))
+        assert partitioned_rows == ([len(data)] if partitioned else [])
+
+
+if __name__ == '__main__':
+    # Worker processes are started by a fork server or spawned, and either re-imports the main module.
+    pytest.main([__file__])
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from src.patterns.strategy import validator
+from src.patterns.strategy.validator import UniqueValidatorStrategy
+
+
+def validate_chunks(strategy: UniqueValidatorStrategy, chunks: list[pd.DataFrame]) -> tuple[list[bool], list[dict]]:
+    # Mirrors a streamed COLLECT run: one mask per chunk, the samples of all chunks concatenated.
+    invalid: list[bool] = []
+    groups: list[dict] = []
+    for chunk in chunks:
+        invalid_mask: pd.Series = strategy.invalid_mask(chunk)
+        invalid += invalid_mask.tolist()
+        if invalid_mask.any():
+            groups += strategy.sample(chunk, invalid_mask, sample_size=10)
+    return invalid, groups
+
+
+def test_duplicates_across_spilled_chunks():
+    # A limit of one byte spills the keys of every chunk to disk.
+    strategy: UniqueValidatorStrategy = UniqueValidatorStrategy(column='id', memory_limit=1)
+    invalid, groups = validate_chunks(strategy, [pd.DataFrame({'id': ['a', 'b']}),
+                                                 pd.DataFrame({'id': ['c', 'a']}),
+                                                 pd.DataFrame({'id': ['a', 'd', 'b']})])
+    assert invalid == [False, False, False, True, True, False, True]
+    assert len(strategy.seen_keys.disk_runs) == 3
+    assert groups == [{'id': 'a', 'group_size': 3}, {'id': 'b', 'group_size': 2}]
+    strategy.reset()
+    assert len(strategy.seen_keys) == 0 and strategy.seen_keys.spill_directory is None
+
+
+def test_composite_keys_keep_types_apart():
+    strategy: UniqueValidatorStrategy = UniqueValidatorStrategy(column=['code', 'year'])
+    invalid, groups = validate_chunks(strategy, [pd.DataFrame({'code': ['x', 'x'], 'year': [1, 2]}),
+                                                 pd.DataFrame({'code': ['x', 'x'], 'year': ['1', 1]})])
+    assert invalid == [False, False, False, True]
+    assert groups == [{'code': 'x', 'year': 1, 'group_size': 2}]
+
+
+def test_hash_collisions_are_not_duplicates(monkeypatch):
+    monkeypatch.setattr(validator, 'hash_keys', lambda keys: np.zeros(len(keys), dtype=np.uint64))
+    for memory_limit in [1, 2 ** 20]:
+        strategy: UniqueValidatorStrategy = UniqueValidatorStrategy(column='id', memory_limit=memory_limit)
+        invalid, _ = validate_chunks(strategy, [pd.DataFrame({'id': ['a', 'b']}), pd.DataFrame({'id': ['c', 'b']})])
+        assert invalid == [False, False, False, True]
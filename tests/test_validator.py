@@ -0,0 +1,36 @@
+import pandas as pd
+import validators
+
+from src.key_index import KeyIndexRegistry
+from src.patterns.strategy.validator import ChoiceValidatorStrategy, UrlValidatorStrategy
+
+# Values that differ only after a NUL or another control character, in both orders, next to valid and invalid ones.
+URLS: list = [
+    'http://example.com\x00bad', 'http://example.com', 'https://example.org', 'https://example.org\x00',
+    'http://example.com\x01', '\x01http://example.com', 'http://exa\x00mple.com', 'http://exa',
+    'http://example.com/path\x7f', 'http://example.com/path', 'ftp://example.com\x1b', 'not a url', None, 42,
+    'http://example.com\x00bad', 'http://example.com',
+]
+
+
+def per_row_invalid_mask(values: list) -> list[bool]:
+    return [not (isinstance(value, str) and bool(validators.url(value))) for value in values]
+
+
+def test_url_fast_path_matches_per_row_validation():
+    for urls in [URLS, URLS[::-1]]:
+        df: pd.DataFrame = pd.DataFrame({'url': urls})
+        expected: list[bool] = per_row_invalid_mask(urls)
+        assert UrlValidatorStrategy(column='url').invalid_mask(df).tolist() == expected
+        assert UrlValidatorStrategy(column='url', fast_path=False).invalid_mask(df).tolist() == expected
+
+
+def test_key_index_keeps_keys_that_differ_after_a_nul():
+    # All strings, so pandas would use its string hash table, the one that stops comparing at a NUL.
+    parents: pd.DataFrame = pd.DataFrame({'course_id': ['k\x00x', 'k', 'k\x00x', 'm\x01']})
+    children: pd.DataFrame = pd.DataFrame({'course_id': ['k', 'k\x00x', 'k\x00y', 'm', 'm\x01', 'z']})
+    index: pd.Index = KeyIndexRegistry.get(parents, 'course_id')
+    assert index.is_unique and len(index) == 3
+    strategy: ChoiceValidatorStrategy = ChoiceValidatorStrategy(column='course_id', values=index)
+    expected: list[bool] = (~children['course_id'].isin(set(parents['course_id']))).tolist()
+    assert strategy.invalid_mask(children).tolist() == expected == [False, False, True, True, False, True]